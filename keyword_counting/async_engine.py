@@ -0,0 +1,341 @@
+# async_engine.py — asyncio 크롤 엔진 (Playwright, 프로세스 1개로 페이지 수십 개 동시 처리)
+#---호출법---#
+# pip install playwright && playwright install chromium
+# python create_profiles_final.py --engine async --concurrency 12
+#
+# make_place_profile.fetch_and_build 와 같은 계약:
+#   await engine.fetch_and_build(place_id, cuisine, store_name, mode="summary"|"chips") → 저장한 JSON 경로
+#   (network 모드는 Chrome performance 로그가 필요해서 여기선 지원 안 함 → ValueError)
+# Selenium 버전은 호출마다 블록되기 때문에 동시성을 얻으려면 프로세스(=Chrome)를 늘려야 했다.
+# 여기서는 브라우저 1개 + 컨텍스트 2개(데스크톱/모바일)에 페이지를 동시에 여러 개 띄우고,
+# '더보기' 응답을 기다리는 동안 이벤트 루프가 다른 페이지를 진행시킨다.
+# 파싱/집계/저장은 make_place_profile 의 순수 함수와 page_scripts 의 JS 를 그대로 재사용.
+from __future__ import annotations
+import asyncio, time
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:                      # 선택 의존성: --engine async 를 쓸 때만 필요
+    async_playwright = None
+
+import make_place_profile as mpp
+from browser_profile import BLOCKED_URL_PATTERNS, DESKTOP_UA, MOBILE_METRICS, MOBILE_UA, LEAN_ARGS
+from page_scripts import CLICK_BY_TEXT_JS, CLICK_PLUS_CHIPS_JS, EXTRACT_REVIEWS_JS, PROBE_JS, REVIEW_LI_SELECTOR
+from tag_sampling import TagSampler
+from throttle import Throttled, looks_blocked
+
+SUMMARY_TITLE = "이런 점이 좋았어요"
+
+# page_scripts 의 JS 는 Selenium 식 arguments[...] 를 씀 → 인자 배열을 그대로 넘기도록 감싸서 evaluate
+_WRAP = "(args) => (function () {{ {body} }}).apply(null, args)"
+
+# '이런 점이 좋았어요' 섹션 (make_place_profile.expand_summary_all 의 XPATH 와 같은 조상 규칙)
+_SUMMARY_SECTION_XPATH = (f"xpath=//*[contains(normalize-space(.),'{SUMMARY_TITLE}')]"
+                          "/ancestor::*[self::div or self::section][1]")
+
+
+def _js(body: str) -> str:
+    return _WRAP.format(body=body)
+
+
+def _require_playwright():
+    if async_playwright is None:
+        raise RuntimeError("async 엔진은 playwright 가 필요해요: pip install playwright && playwright install chromium")
+
+
+class AsyncEngine:
+    """
+    async with AsyncEngine(concurrency=12, headless=True) as eng:
+        await eng.fetch_and_build(...)
+    concurrency = 동시에 열어둘 페이지 수 (Selenium 워커 수에 해당)
+    """
+    MODES = ("summary", "chips")
+
+    def __init__(self, concurrency: int = 8, headless: bool = True, lean: bool = True,
+                 nav_timeout: float = 20.0, wait_timeout: float = 12.0):
+        self.concurrency = max(int(concurrency), 1)
+        self.headless = headless
+        self.lean = lean
+        self.nav_timeout_ms = int(nav_timeout * 1000)
+        self.wait_timeout_ms = int(wait_timeout * 1000)
+        self._sem = asyncio.Semaphore(self.concurrency)
+        self._pw = self._browser = None
+        self._desktop = self._mobile = None
+
+    def slot(self) -> asyncio.Semaphore:
+        """
+        페이지 밖 작업(HTTP 우선 시도, 변경 프로브)도 concurrency 안에서 돌게: async with engine.slot(): ...
+        fetch_and_build 도 같은 세마포어를 잡으므로 그 안에서 fetch_and_build 를 부르면 안 됨
+        """
+        return self._sem
+
+    # -----------------------------
+    # 브라우저 / 컨텍스트
+    # -----------------------------
+    async def start(self):
+        _require_playwright()
+        self._pw = await async_playwright().start()
+        self._browser = await self._pw.chromium.launch(headless=self.headless,
+                                                       args=LEAN_ARGS if self.lean else [])
+        self._desktop = await self._browser.new_context(user_agent=DESKTOP_UA,
+                                                        viewport={"width": 1280, "height": 900})
+        m = MOBILE_METRICS
+        self._mobile = await self._browser.new_context(
+            user_agent=MOBILE_UA, viewport={"width": m["width"], "height": m["height"]},
+            device_scale_factor=m["deviceScaleFactor"], is_mobile=True, has_touch=True)
+        return self
+
+    async def close(self):
+        for obj in (self._desktop, self._mobile, self._browser):
+            if obj is not None:
+                try:
+                    await obj.close()
+                except Exception:
+                    pass
+        if self._pw is not None:
+            await self._pw.stop()
+        self._pw = self._browser = self._desktop = self._mobile = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _new_page(self, mobile: bool):
+        ctx = self._mobile if mobile else self._desktop
+        page = await ctx.new_page()
+        page.set_default_timeout(self.wait_timeout_ms)
+        page.set_default_navigation_timeout(self.nav_timeout_ms)
+        if self.lean:
+            # Selenium 쪽 apply_request_blocking 과 같은 CDP 차단 목록 (route 핸들러보다 왕복이 적음)
+            cdp = await ctx.new_cdp_session(page)
+            await cdp.send("Network.enable")
+            await cdp.send("Network.setBlockedURLs", {"urls": list(BLOCKED_URL_PATTERNS)})
+        return page
+
+    async def _goto(self, page, url: str):
+        if mpp.RATE_LIMITER is not None:            # 동기 락 → 스레드에서 대기 (이벤트 루프 안 막음)
+            await asyncio.to_thread(mpp.RATE_LIMITER.wait, url)
+        await page.goto(url, wait_until="domcontentloaded")
+
+    # -----------------------------
+    # 모드 A) SUMMARY
+    # -----------------------------
+    async def _summary_frame(self, page, place_id: str):
+        if mpp.SUMMARY_DIRECT:                       # iframe 이 띄우는 pcmap 문서로 직행
+            for url in mpp.SCOPE_MEMO.order(place_id, mpp.build_summary_urls(place_id), "summary"):
+                try:
+                    await self._goto(page, url)
+                    await page.wait_for_selector(f"text={SUMMARY_TITLE}", timeout=8000)
+                    mpp.SCOPE_MEMO.record(place_id, url, "summary")
+                    return page.main_frame
+                except Exception:
+                    continue
+        await self._goto(page, f"https://map.naver.com/p/entry/place/{place_id}")
+        frame = page.main_frame
+        try:
+            el = await page.wait_for_selector("iframe#entryIframe", timeout=5000)
+            frame = await el.content_frame() or frame
+        except Exception:
+            pass
+        try:
+            tab = frame.get_by_text("리뷰", exact=True).first
+            await tab.click(timeout=3000)
+        except Exception:
+            pass
+        await frame.wait_for_selector(f"text={SUMMARY_TITLE}")
+        return frame
+
+    async def _expand_summary(self, frame, max_clicks: int = 4):
+        try:
+            sec = await frame.wait_for_selector(_SUMMARY_SECTION_XPATH, timeout=3000)
+        except Exception:
+            return
+        prev = await sec.evaluate("(s) => s.querySelectorAll('li').length")
+        for _ in range(max_clicks):
+            clicked = await frame.evaluate(_js(CLICK_BY_TEXT_JS), [sec, "button,a,[aria-label]", ["더보기", "펼치기"]])
+            if not clicked:
+                break
+            try:
+                await frame.wait_for_function("([s, n]) => s.querySelectorAll('li').length > n",
+                                              arg=[sec, prev], timeout=3000)
+            except Exception:
+                break
+            prev = await sec.evaluate("(s) => s.querySelectorAll('li').length")
+
+    async def fetch_summary(self, place_id: str, cuisine: list[str], store_name: str) -> str:
+        page = await self._new_page(mobile=False)
+        try:
+            frame = await self._summary_frame(page, place_id)
+            await self._expand_summary(frame)
+            html = await frame.content()
+            total = await self._review_total(frame)
+        finally:
+            await page.close()
+        tag_counts = mpp.parse_summary_counts_from_html(html)
+        if not tag_counts:
+            if looks_blocked(html):
+                raise Throttled("차단/캡차 페이지")
+            raise RuntimeError("요약 패널을 파싱하지 못했어요.")
+        out_json = mpp.save_store_tag_json(place_id, cuisine, store_name, tag_counts,
+                                           meta={"review_total": total} if total is not None else None)
+        print(f"[OK/SUMMARY/ASYNC] {store_name} ({place_id}) -> {out_json}  ({len(tag_counts)} tags)")
+        return out_json
+
+    async def _review_total(self, frame) -> int | None:
+        """make_place_profile.read_review_total 의 async 버전 (가게 전체 리뷰 수, 못 찾으면 None)"""
+        try:
+            total, _ = await frame.evaluate(_js(PROBE_JS), [0])
+            return int(total) if total is not None else None
+        except Exception:
+            return None
+
+    # -----------------------------
+    # 모드 B) CHIPS
+    # -----------------------------
+    async def _click_more_until_end(self, page, max_clicks: int, idle_ms: int = 500, on_expand=None) -> int:
+        """on_expand: 처음 한 번 + 리뷰가 늘 때마다 await 하는 콜백 (False 를 돌려주면 클릭 중단)"""
+        clicks = 0
+        count_js = f"() => document.querySelectorAll('{REVIEW_LI_SELECTOR}').length"
+        n = await page.evaluate(count_js)
+        if on_expand and await on_expand() is False:
+            return clicks
+        while clicks < max_clicks:
+            clicked = await page.evaluate(_js(CLICK_BY_TEXT_JS), [None, "a,button", ["더보기"]])
+            if not clicked:
+                break
+            clicks += 1
+            # 리스트가 늘면 즉시 진행, 안 늘면 wait_timeout 후 종료 (그동안 다른 페이지가 돈다)
+            try:
+                await page.wait_for_function(f"(n) => document.querySelectorAll('{REVIEW_LI_SELECTOR}').length > n",
+                                             arg=n, timeout=self.wait_timeout_ms)
+            except Exception:
+                break
+            n = await page.evaluate(count_js)
+            if on_expand and await on_expand() is False:
+                break
+        await page.wait_for_timeout(idle_ms)
+        return clicks
+
+    def _sampling_hook(self, page, sampler: TagSampler, place_id, cuisine, store_name):
+        """make_place_profile._sampling_hook 의 async 버전: 새로 붙은 리뷰만 '+N' 펼쳐서 샘플러에 반영"""
+        async def on_expand():
+            if await page.evaluate(_js(CLICK_PLUS_CHIPS_JS), [None]):
+                await page.wait_for_timeout(150)
+            js_rows = await page.evaluate(_js(EXTRACT_REVIEWS_JS), [REVIEW_LI_SELECTOR, True, True]) or []
+            return sampler.update(mpp._rows_from_js(js_rows, place_id, cuisine, store_name))
+
+        return on_expand
+
+    async def _chips_rows(self, page, place_id, cuisine, store_name, max_clicks: int,
+                          sampler: TagSampler | None = None) -> Tuple[List[Dict[str, Any]], int]:
+        await page.wait_for_selector(REVIEW_LI_SELECTOR)
+        on_expand = self._sampling_hook(page, sampler, place_id, cuisine, store_name) if sampler else None
+        clicks = await self._click_more_until_end(page, max_clicks, on_expand=on_expand)
+        if on_expand:
+            await on_expand()                       # 마지막 클릭 뒤 붙은 리뷰까지
+            return sampler.rows, clicks
+        for _ in range(3):
+            if not await page.evaluate(_js(CLICK_PLUS_CHIPS_JS), [None]):
+                break
+            await page.wait_for_timeout(150)
+        js_rows = await page.evaluate(_js(EXTRACT_REVIEWS_JS), [REVIEW_LI_SELECTOR, True, False]) or []
+        return mpp._rows_from_js(js_rows, place_id, cuisine, store_name), clicks
+
+    async def fetch_chips(self, place_id: str, cuisine: list[str], store_name: str,
+                          sort: str = "recent", max_clicks: int = 60, save_csv_also: bool = False,
+                          dedup_within_row: bool = True, sampling: bool = False) -> str:
+        """sampling=True: make_place_profile.fetch_chips 와 같은 mpp.SAMPLE_* 설정으로 수렴하면 펼치기 중단"""
+        all_rows: List[Dict[str, Any]] = []
+        last_err = None
+        url_count, review_total, clicks, stop_reason, sampler = 0, None, 0, None, None
+        page = await self._new_page(mobile=True)
+        try:
+            for url in mpp.SCOPE_MEMO.order(place_id, mpp.build_review_urls(place_id, sort=sort)):
+                try:
+                    await self._goto(page, url)
+                    if sampling:
+                        sampler = TagSampler(tol=mpp.SAMPLE_TOL, patience=mpp.SAMPLE_PATIENCE,
+                                             min_reviews=mpp.SAMPLE_MIN_REVIEWS,
+                                             target_reviews=mpp.SAMPLE_TARGET_REVIEWS,
+                                             dedup_within_row=dedup_within_row)
+                    rows, clicks = await self._chips_rows(page, place_id, cuisine, store_name, max_clicks,
+                                                          sampler=sampler)
+                    if rows:
+                        if review_total is None:
+                            review_total = await self._review_total(page)
+                        if not url_count:
+                            mpp.SCOPE_MEMO.record(place_id, url)
+                        all_rows = mpp.dedup_reviews(all_rows + rows); url_count += 1
+                        more_left = await page.evaluate(
+                            "() => Array.from(document.querySelectorAll('a,button'))"
+                            ".some(el => (el.textContent || '').includes('더보기') && el.offsetParent)")
+                        stop_reason = ((sampler.stop_reason if sampler is not None else None)
+                                       or ("max_clicks" if clicks >= max_clicks else
+                                           "stalled" if more_left else "exhausted"))
+                        if stop_reason != "stalled":
+                            break
+                except Exception as e:
+                    last_err = e
+                    continue
+        finally:
+            await page.close()
+
+        if not all_rows:
+            if last_err:
+                raise last_err
+            raise RuntimeError("리뷰/태그 요소를 찾지 못했어요.")
+        counts = mpp.count_tags(all_rows, dedup_within_row=dedup_within_row)
+        meta = {"mode": "chips", "stop_reason": stop_reason, "clicks": clicks, "reviews": len(all_rows)}
+        if review_total is not None:
+            meta["review_total"] = review_total
+        if sampler is not None:
+            meta["sampling"] = sampler.meta()
+        out_json = mpp.save_store_tag_json(place_id, cuisine, store_name, counts, meta=meta)
+        if save_csv_also:
+            mpp.save_csv(all_rows, place_id, cuisine, store_name)
+        total_chips = sum(len(r.get("option_tags", [])) for r in all_rows)
+        print(f"[OK/CHIPS/ASYNC] {store_name} ({place_id}) -> {out_json}  "
+              f"({total_chips} chips, {len(counts)} tags, {url_count} urls, stop={stop_reason})")
+        return out_json
+
+    # -----------------------------
+    # 단일 호출 진입점 (make_place_profile.fetch_and_build 와 같은 인자)
+    # -----------------------------
+    async def fetch_and_build(self, place_id: str, cuisine: list[str], store_name: str,
+                              sort: str = "recent", max_clicks: int = 60,
+                              headless: bool | None = None, save_csv_also: bool = False,
+                              dedup_within_row: bool = True, mode: str | None = None, pool=None,
+                              sampling: bool = False) -> str:
+        """headless/pool 은 Selenium 버전과 시그니처를 맞추기 위한 자리 (엔진 생성 시 정해짐)"""
+        mode = (mode or mpp.DEFAULT_MODE).lower()
+        if mode not in self.MODES:
+            raise ValueError(f"async 엔진이 지원하지 않는 모드: {mode} (가능: {', '.join(self.MODES)})")
+        async with self._sem:
+            if mode == "summary":
+                return await self.fetch_summary(place_id, cuisine, store_name)
+            return await self.fetch_chips(place_id, cuisine, store_name, sort=sort, max_clicks=max_clicks,
+                                          save_csv_also=save_csv_also, dedup_within_row=dedup_within_row,
+                                          sampling=sampling)
+
+
+async def run_jobs(jobs: Iterable[tuple], crawl: Callable, concurrency: int = 8, headless: bool = True,
+                   on_result: Callable[[dict], None] | None = None) -> List[dict]:
+    """
+    jobs 를 동시에 처리 → 결과 dict 리스트 (끝나는 순서대로 on_result 호출)
+    crawl = async (engine, *job) -> dict  (create_profiles_final.crawl_one_async)
+    """
+    results: List[dict] = []
+    t0 = time.time()
+    async with AsyncEngine(concurrency=concurrency, headless=headless) as engine:
+        tasks = [asyncio.create_task(crawl(engine, *job)) for job in jobs]
+        for fut in asyncio.as_completed(tasks):
+            r = await fut
+            results.append(r)
+            if on_result:
+                on_result(r)
+    if results:
+        print(f"[ASYNC] {len(results)}곳 {time.time() - t0:.1f}s (concurrency={concurrency})")
+    return results
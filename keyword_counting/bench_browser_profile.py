@@ -0,0 +1,98 @@
+# bench_browser_profile.py — 가게별 다운로드 바이트/페이지 준비 시간 비교 (기본 프로필 vs lean 프로필)
+#---호출법---#
+# python bench_browser_profile.py --place_ids 31751923 37746393 --headless
+# python bench_browser_profile.py --place_list place_list.csv --limit 20 --headless
+#
+# 같은 모바일 리뷰 페이지를
+#   full : 이미지/폰트/트래커 모두 로드 (lean=False)
+#   lean : browser_profile.make_chrome(lean=True) — CDP 요청 차단 + 불필요 기능 off
+# 로 열고, Resource Timing 의 transferSize 합(바이트)과 첫 리뷰 li 가 보일 때까지의 시간(ms)을 잰다.
+from __future__ import annotations
+import time, argparse
+from pathlib import Path
+from statistics import median
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+import make_place_profile as mpp
+from browser_profile import make_chrome
+from page_waits import wait_until_quiet
+
+# Resource Timing 버퍼 기본값(250개)을 넘겨도 다 잡히도록 새 문서마다 늘려둠
+_ENLARGE_BUFFER_JS = "performance.setResourceTimingBufferSize(10000);"
+
+_TRANSFER_JS = r"""
+const nav = performance.getEntriesByType('navigation')[0];
+const res = performance.getEntriesByType('resource');
+let bytes = nav ? (nav.transferSize || 0) : 0;
+for (const r of res) bytes += (r.transferSize || 0);
+return [bytes, res.length + 1, nav ? Math.round(nav.domContentLoadedEventEnd) : null];
+"""
+
+
+def measure(driver, url: str) -> dict:
+    t0 = time.time()
+    mpp.open_url(driver, url)
+    WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.CSS_SELECTOR, "li.place_app")))
+    ready_ms = int((time.time() - t0) * 1000)
+    wait_until_quiet(driver, timeout=3.0)           # 늦게 붙는 리소스까지 합산
+    bytes_, requests, dcl_ms = driver.execute_script(_TRANSFER_JS)
+    return {"bytes": int(bytes_), "requests": int(requests), "ready_ms": ready_ms, "dcl_ms": dcl_ms}
+
+
+def bench(place_ids, headless: bool) -> dict:
+    results = {"full": [], "lean": []}
+    for label, lean in (("full", False), ("lean", True)):
+        driver = make_chrome(headless=headless, lean=lean, mobile=True, implicit_wait=0)
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _ENLARGE_BUFFER_JS})
+            for pid in place_ids:
+                url = mpp.build_review_urls(pid)[0]
+                try:
+                    r = measure(driver, url)
+                except Exception as e:
+                    print(f"[{label}] {pid} 실패: {type(e).__name__}")
+                    continue
+                results[label].append(r)
+                print(f"[{label}] {pid}: {r['bytes'] / 1024:,.0f} KB, {r['requests']} req, ready {r['ready_ms']} ms")
+        finally:
+            driver.quit()
+    return results
+
+
+def _read_place_ids(path: str, limit: int) -> list[str]:
+    from create_profiles_final import _open_csv_with_fallback     # 엑셀 저장본(cp949)도 읽도록 배치와 같은 방식
+    f, reader = _open_csv_with_fallback(Path(path))
+    with f:
+        ids = [(row.get("place_id") or "").strip() for row in reader]
+    return [i for i in ids if i][:limit]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="bytes downloaded / page-ready time: full vs lean browser profile")
+    ap.add_argument("--place_ids", nargs="*", default=[])
+    ap.add_argument("--place_list", default=None, help="place_list.csv 경로 (place_id 열 사용)")
+    ap.add_argument("--limit", type=int, default=10)
+    ap.add_argument("--headless", action="store_true")
+    args = ap.parse_args(argv)
+
+    place_ids = list(args.place_ids)
+    if args.place_list:
+        place_ids += _read_place_ids(args.place_list, args.limit)
+    if not place_ids:
+        ap.error("--place_ids 또는 --place_list 가 필요해요.")
+
+    results = bench(place_ids, args.headless)
+    print("-" * 60)
+    print(f"{'profile':8} {'places':>6} {'median KB':>10} {'median req':>10} {'median ready ms':>15}")
+    for label, rows in results.items():
+        if not rows:
+            continue
+        print(f"{label:8} {len(rows):>6} {median(r['bytes'] for r in rows) / 1024:>10,.0f} "
+              f"{median(r['requests'] for r in rows):>10} {median(r['ready_ms'] for r in rows):>15}")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
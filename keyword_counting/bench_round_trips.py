@@ -0,0 +1,137 @@
+# bench_round_trips.py — '더보기' 탐색 + '+N' 칩 펼치기의 WebDriver 왕복 횟수 비교 (이전 방식 vs 페이지 내 스크립트)
+#---호출법---#
+# python bench_round_trips.py --place_id 31751923 --max_clicks 10 --headless
+#
+# 같은 리뷰 페이지를 두 번 열어,
+#   legacy : find_elements("a,button[,span]") 후 요소마다 .text / .is_displayed() / click  (이전 구현)
+#   script : execute_script 한 번으로 찾기/클릭                                          (현재 구현)
+# 로 같은 횟수만큼 '더보기'를 누르고 칩을 펼친 뒤, 드라이버 명령(=HTTP 왕복) 수와 소요 시간을 출력한다.
+from __future__ import annotations
+import re, time, argparse
+from collections import Counter
+
+from selenium.webdriver.common.by import By
+
+import make_place_profile as mpp
+from page_scripts import click_plus_chips, FIND_BY_TEXT_JS
+from page_waits import item_count, wait_for_growth, wait_until_quiet
+
+
+class CommandCounter:
+    """driver.execute를 감싸 명령 종류별 호출 수를 셈 (WebDriver 명령 1개 = HTTP 왕복 1회)"""
+    def __init__(self, driver):
+        self.driver = driver
+        self.counts: Counter = Counter()
+        self.paused = False
+
+    def __enter__(self):
+        orig = type(self.driver).execute.__get__(self.driver)
+
+        def execute(driver_command, params=None):
+            if not self.paused:
+                self.counts[driver_command] += 1
+            return orig(driver_command, params)
+
+        self.driver.execute = execute
+        return self
+
+    def __exit__(self, *exc):
+        del self.driver.execute                    # 인스턴스 래퍼 제거 → 클래스 메서드로 복귀
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+# -----------------------------
+# 이전 방식 (요소별 왕복)
+# -----------------------------
+def legacy_find_more(driver):
+    for el in driver.find_elements(By.CSS_SELECTOR, "a,button"):
+        try:
+            if "더보기" in (el.text or "") and el.is_displayed():
+                return el
+        except Exception:
+            continue
+    return None
+
+
+def legacy_expand_chips(driver, max_tries: int = 3):
+    plus_pat = re.compile(r"^\+\d+$")
+    for _ in range(max_tries):
+        clicked_any = False
+        for el in driver.find_elements(By.CSS_SELECTOR, "a,button,span"):
+            try:
+                if plus_pat.match((el.text or "").strip()) and el.is_displayed():
+                    driver.execute_script("arguments[0].click();", el)
+                    clicked_any = True
+            except Exception:
+                continue
+        if not clicked_any:
+            break
+
+
+# -----------------------------
+# 현재 방식 (페이지 내 스크립트)
+# -----------------------------
+def script_find_more(driver):
+    return driver.execute_script(FIND_BY_TEXT_JS, None, "a,button", "더보기")
+
+
+def script_expand_chips(driver, max_tries: int = 3):
+    for _ in range(max_tries):
+        if not click_plus_chips(driver):
+            break
+
+
+def run_once(driver, url: str, find_more, expand_chips, max_clicks: int) -> dict:
+    mpp.open_url(driver, url)
+    wait_until_quiet(driver, timeout=5.0)
+    t0 = time.time()
+
+    clicks = 0
+    n_items = item_count(driver)
+    with CommandCounter(driver) as cc:
+        for _ in range(max_clicks):
+            btn = find_more(driver)
+            if btn is None:
+                break
+            driver.execute_script("arguments[0].click();", btn)
+            clicks += 1
+            # 대기(폴링) 명령은 두 방식 공통이므로 세지 않음
+            cc.paused = True
+            n_items = wait_for_growth(driver, n_items, idle_ms=400)
+            cc.paused = False
+        find_rt = cc.total
+        expand_chips(driver)
+        total = cc.total
+
+    return {"clicks": clicks, "reviews": n_items, "round_trips": total,
+            "chip_round_trips": total - find_rt, "sec": round(time.time() - t0, 2)}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="WebDriver round trips per page: legacy vs in-page script")
+    ap.add_argument("--place_id", required=True)
+    ap.add_argument("--max_clicks", type=int, default=10)
+    ap.add_argument("--headless", action="store_true")
+    args = ap.parse_args(argv)
+
+    url = mpp.build_review_urls(args.place_id)[0]
+    driver = mpp.make_driver(headless=args.headless)
+    try:
+        legacy = run_once(driver, url, legacy_find_more, legacy_expand_chips, args.max_clicks)
+        script = run_once(driver, url, script_find_more, script_expand_chips, args.max_clicks)
+    finally:
+        driver.quit()
+
+    print(f"{'':8} {'clicks':>6} {'reviews':>7} {'round_trips':>11} {'chip_rt':>7} {'sec':>6}")
+    for name, r in (("legacy", legacy), ("script", script)):
+        print(f"{name:8} {r['clicks']:>6} {r['reviews']:>7} {r['round_trips']:>11} "
+              f"{r['chip_round_trips']:>7} {r['sec']:>6}")
+    if script["round_trips"]:
+        print(f"→ 왕복 {legacy['round_trips'] / script['round_trips']:.1f}배 감소")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
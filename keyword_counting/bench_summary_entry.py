@@ -0,0 +1,83 @@
+# bench_summary_entry.py — summary 모드 진입 경로별 가게당 시간 비교
+#---호출법---#
+# python bench_summary_entry.py --place_ids 31751923 37746393 --headless
+# python bench_summary_entry.py --place_list place_list.csv --limit 20 --headless
+#
+#   map    : map.naver.com/p/entry/place/{id} 지도 셸 → iframe#entryIframe → '리뷰' 탭 클릭 (기존)
+#   direct : pcmap.place.naver.com/{restaurant|place}/{id}/review/visitor 로 바로 이동
+# 둘 다 '이런 점이 좋았어요' 블록이 보일 때까지 + 요약 파싱까지의 시간(ms)을 잰다.
+# 순서 효과(캐시)를 줄이려고 가게마다 어느 경로를 먼저 돌릴지 번갈아 바꾼다.
+from __future__ import annotations
+import time, argparse
+from statistics import median
+
+import make_place_profile as mpp
+from bench_browser_profile import _read_place_ids
+
+
+def measure(driver, place_id: str, path: str) -> dict:
+    t0 = time.time()
+    if path == "direct":
+        if not mpp.goto_summary_direct(driver, place_id):
+            raise RuntimeError("pcmap 직행 실패")
+    else:
+        mpp.goto_map_entry(driver, place_id)
+    ready_ms = int((time.time() - t0) * 1000)
+    tags = len(mpp.parse_summary_counts_from_html(driver.page_source))
+    total_ms = int((time.time() - t0) * 1000)
+    driver.switch_to.default_content()
+    return {"ready_ms": ready_ms, "total_ms": total_ms, "tags": tags}
+
+
+def bench(place_ids, headless: bool) -> list[dict]:
+    rows = []
+    driver = mpp.make_driver(headless=headless)
+    try:
+        for i, pid in enumerate(place_ids):
+            order = ("map", "direct") if i % 2 == 0 else ("direct", "map")
+            row = {"place_id": pid}
+            for path in order:
+                try:
+                    row[path] = measure(driver, pid, path)
+                except Exception as e:
+                    print(f"[{path}] {pid} 실패: {type(e).__name__}")
+                    row[path] = None
+            rows.append(row)
+            m, d = row.get("map"), row.get("direct")
+            print(f"{pid:>12}  map {m['total_ms'] if m else '-':>6} ms  direct {d['total_ms'] if d else '-':>6} ms  "
+                  f"tags {m['tags'] if m else '-'}/{d['tags'] if d else '-'}")
+    finally:
+        driver.quit()
+    return rows
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="summary mode: map shell vs direct pcmap entry, per-place timing")
+    ap.add_argument("--place_ids", nargs="*", default=[])
+    ap.add_argument("--place_list", default=None, help="place_list.csv 경로 (place_id 열 사용)")
+    ap.add_argument("--limit", type=int, default=10)
+    ap.add_argument("--headless", action="store_true")
+    args = ap.parse_args(argv)
+
+    place_ids = list(args.place_ids)
+    if args.place_list:
+        place_ids += _read_place_ids(args.place_list, args.limit)
+    if not place_ids:
+        ap.error("--place_ids 또는 --place_list 가 필요해요.")
+
+    rows = bench(place_ids, args.headless)
+    both = [r for r in rows if r.get("map") and r.get("direct")]
+    print("-" * 60)
+    print(f"{'path':8} {'places':>6} {'median ready ms':>15} {'median total ms':>15}")
+    for path in ("map", "direct"):
+        ok = [r[path] for r in rows if r.get(path)]
+        if ok:
+            print(f"{path:8} {len(ok):>6} {median(x['ready_ms'] for x in ok):>15} {median(x['total_ms'] for x in ok):>15}")
+    if both:
+        saved = median(r["map"]["total_ms"] - r["direct"]["total_ms"] for r in both)
+        same = sum(r["map"]["tags"] == r["direct"]["tags"] for r in both)
+        print(f"가게당 절감(중앙값) {saved} ms, 태그 수 일치 {same}/{len(both)}")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,59 @@
+# bench_tabs.py — 같은 하드웨어에서 탭 수별 처리량(places/min) 비교
+#---호출법---#
+# python bench_tabs.py --place_list place_list.csv --limit 24 --tabs 1 2 4 8 --headless
+#
+# 탭 수마다 브라우저를 새로 띄워 같은 가게 목록을 tab_crawler.TabCrawler 로 처리하고,
+# 결과 JSON은 outputs/bench_tabs/ 에 따로 저장한다 (실제 places_json 은 건드리지 않음).
+from __future__ import annotations
+import time, argparse
+from statistics import median
+
+from tab_crawler import TabCrawler, make_tab_driver, read_jobs
+
+BENCH_OUT_DIR = "./outputs/bench_tabs"
+
+
+def bench_one(jobs, tabs: int, headless: bool, max_clicks: int) -> dict:
+    driver = make_tab_driver(headless=headless)
+    try:
+        crawler = TabCrawler(driver, tabs=tabs, max_clicks=max_clicks, out_dir=BENCH_OUT_DIR)
+        crawler.warm_up()                          # 탭 여는 시간은 처리량에서 제외
+        t0 = time.time()
+        results = crawler.run(jobs)
+        sec = time.time() - t0
+    finally:
+        driver.quit()
+    ok = [r for r in results if r["status"] == "OK"]
+    return {
+        "tabs": tabs,
+        "places": len(results),
+        "ok": len(ok),
+        "sec": round(sec, 1),
+        "places_per_min": round(len(results) / (sec / 60), 2) if sec else 0.0,
+        "median_place_sec": median(r["sec"] for r in ok) if ok else None,
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="places/minute vs tab count")
+    ap.add_argument("--place_list", default="place_list.csv")
+    ap.add_argument("--limit", type=int, default=24)
+    ap.add_argument("--tabs", type=int, nargs="+", default=[1, 2, 4, 8])
+    ap.add_argument("--max_clicks", type=int, default=20)
+    ap.add_argument("--headless", action="store_true")
+    args = ap.parse_args(argv)
+
+    jobs = read_jobs(args.place_list, 0, args.limit)
+    rows = [bench_one(jobs, n, args.headless, args.max_clicks) for n in args.tabs]
+
+    print("-" * 60)
+    print(f"{'tabs':>4} {'places':>6} {'ok':>4} {'sec':>7} {'places/min':>10} {'med s/place':>11} {'speedup':>7}")
+    base = rows[0]["places_per_min"] or None
+    for r in rows:
+        speedup = f"{r['places_per_min'] / base:.2f}x" if base else "-"
+        print(f"{r['tabs']:>4} {r['places']:>6} {r['ok']:>4} {r['sec']:>7} {r['places_per_min']:>10} "
+              f"{str(r['median_place_sec']):>11} {speedup:>7}")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,146 @@
+# browser_profile.py — 모든 make_driver()가 같이 쓰는 Chrome 프로필 빌더
+#  - lean=True  : 이미지/폰트/미디어/트래커 요청을 CDP Network.setBlockedURLs 로 차단,
+#                 확장/동기화/백그라운드 네트워킹 등 크롤에 필요 없는 Chrome 기능 끔
+#  - mobile=True: 작은 모바일 뷰포트 + 모바일 UA 로 m.place.naver.com 을 렌더 (1920x1080 데스크톱 X)
+# 같은 드라이버로 데스크톱(summary)/모바일(chips)을 오가야 할 때는 emulate_mobile()/clear_emulation() 사용.
+#
+# 루트 스크립트와 keyword_counting/ 양쪽에서 같이 씀 → selenium/webdriver_manager 외 의존성 없음
+# chromedriver 경로는 driver_cache.resolve_driver_path() 로 캐시해서 씀
+from __future__ import annotations
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+from driver_cache import StartupTimer, resolve_driver_path
+
+DESKTOP_UA = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+              "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+MOBILE_UA = ("Mozilla/5.0 (Linux; Android 13; SM-S918N) "
+             "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36")
+MOBILE_METRICS = {"width": 390, "height": 844, "deviceScaleFactor": 1, "mobile": True}
+DESKTOP_WINDOW = "1280,900"
+
+# 리뷰/태그 텍스트 수집에 필요 없는 리소스 (CDP 와일드카드 패턴)
+# 확장자는 경로 끝에만 걸리게 ("*.ico" / 쿼리스트링 붙은 "*.ico?*") — "*.ico*" 는 API 쿼리(…&q=.icon…)까지 막음
+_BLOCKED_EXTENSIONS = [
+    # 이미지
+    "png", "jpg", "jpeg", "gif", "webp", "avif", "ico", "bmp",
+    # 폰트
+    "woff", "woff2", "ttf", "otf", "eot",
+    # 미디어
+    "mp4", "webm", "m3u8", "mp3",
+]
+
+BLOCKED_URL_PATTERNS = [p for ext in _BLOCKED_EXTENSIONS for p in (f"*.{ext}", f"*.{ext}?*")] + [
+    # 이미지 CDN
+    "*search.pstatic.net/common/?src=*", "*phinf.pstatic.net*",
+    # 광고/분석/로그
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*wcs.naver.net*", "*wcs.naver.com*", "*lcs.naver.com*", "*tivan.naver.com*",
+    "*nelo2-col.navercorp.com*", "*er.search.naver.com*", "*veta.naver.com*", "*siape.veta.naver.com*",
+]
+
+LEAN_ARGS = [
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,InterestFeedContentSuggestions",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+    "--metrics-recording-only",
+    "--blink-settings=imagesEnabled=false",
+]
+
+
+# 한 브라우저에서 여러 탭을 동시에 돌릴 때: 백그라운드 탭 타이머/렌더러 스로틀링 끄기
+MULTI_TAB_ARGS = [
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+]
+
+
+def build_options(headless: bool = False, lean: bool = True, mobile: bool = False,
+                  user_agent: str | None = None, extra_args=(), perf_log: bool = False) -> webdriver.ChromeOptions:
+    opts = webdriver.ChromeOptions()
+    if perf_log:
+        # Network.* 이벤트를 driver.get_log("performance") 로 받음 (review_capture 네트워크 캡처 모드)
+        opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    if headless:
+        opts.add_argument("headless=new")
+    opts.add_argument("disable-gpu")
+    for a in extra_args:
+        opts.add_argument(a)
+    prefs = {"profile.default_content_setting_values.notifications": 2}
+    if lean:
+        for a in LEAN_ARGS:
+            opts.add_argument(a)
+        prefs["profile.managed_default_content_settings.images"] = 2
+        opts.page_load_strategy = "eager"
+    opts.add_experimental_option("prefs", prefs)
+
+    if mobile:
+        m = MOBILE_METRICS
+        opts.add_argument(f"window-size={m['width']},{m['height'] + 120}")
+        opts.add_experimental_option("mobileEmulation", {
+            "deviceMetrics": {"width": m["width"], "height": m["height"], "pixelRatio": m["deviceScaleFactor"]},
+            "userAgent": user_agent or MOBILE_UA,
+        })
+    else:
+        opts.add_argument(f"window-size={DESKTOP_WINDOW}")
+        opts.add_argument(f"user-agent={user_agent or DESKTOP_UA}")
+    return opts
+
+
+def apply_request_blocking(driver, patterns=BLOCKED_URL_PATTERNS) -> bool:
+    """CDP로 URL 패턴 차단 (이미지/폰트/미디어/트래커). Chrome 이 아니면 False"""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        return True
+    except Exception:
+        return False
+
+
+def emulate_mobile(driver) -> bool:
+    """실행 중인 드라이버를 모바일 뷰포트/UA로 전환 (풀에서 빌린 데스크톱 드라이버로 chips 모드 돌릴 때)"""
+    try:
+        driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", MOBILE_METRICS)
+        driver.execute_cdp_cmd("Emulation.setTouchEmulationEnabled", {"enabled": True})
+        driver.execute_cdp_cmd("Network.setUserAgentOverride", {"userAgent": MOBILE_UA})
+        return True
+    except Exception:
+        return False
+
+
+def clear_emulation(driver) -> bool:
+    try:
+        driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
+        driver.execute_cdp_cmd("Emulation.setTouchEmulationEnabled", {"enabled": False})
+        driver.execute_cdp_cmd("Network.setUserAgentOverride", {"userAgent": DESKTOP_UA})
+        return True
+    except Exception:
+        return False
+
+
+def make_chrome(headless: bool = False, lean: bool = True, mobile: bool = False,
+                user_agent: str | None = None, implicit_wait: float = 8,
+                page_load_timeout: float | None = None, extra_args=(), perf_log: bool = False) -> webdriver.Chrome:
+    opts = build_options(headless=headless, lean=lean, mobile=mobile, user_agent=user_agent,
+                         extra_args=extra_args, perf_log=perf_log)
+    timer = StartupTimer()
+    with timer.phase("resolve"):
+        driver_path = resolve_driver_path()        # 프로세스/버전별 캐시 → install()은 최초 1회만
+    with timer.phase("launch"):
+        driver = webdriver.Chrome(service=Service(driver_path), options=opts)
+    driver.startup_timer = timer                   # first_nav 는 driver_cache.timed_get 이 채움
+    if lean:
+        apply_request_blocking(driver)
+    driver.implicitly_wait(implicit_wait)
+    if page_load_timeout:
+        driver.set_page_load_timeout(page_load_timeout)
+    return driver
@@ -0,0 +1,111 @@
+# change_probe.py — 재크롤 전에 "바뀐 게 있나"만 싸게 확인하는 프로브
+#---호출법---#
+# python change_probe.py --place_id 31751923                       # 현재 fingerprint 출력
+# python change_probe.py --place_id 31751923 --json outputs/places_json/31751923_tags.json   # 저장본과 비교
+#
+# 배치의 신선도 판단이 SKIP_IF_EXISTS(파일 있으면 건너뜀) 하나뿐이라 "절대 갱신 안 함/전부 갱신" 둘 중 하나였다.
+# 여기서는 방문자 리뷰 총수 + '이런 점이 좋았어요' 상위 항목(라벨, 수)만 읽어 fingerprint 를 만들고,
+# 프로필 JSON 의 meta.fingerprint 와 같으면 summary/chips 크롤을 건너뛴다.
+#  1) HTTP(SSR 상태 1회 GET, 브라우저 없음) → 2) 실패 시 pcmap 요약 문서에서 JS 1회
+from __future__ import annotations
+import json, hashlib, argparse
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+import make_place_profile as mpp
+import http_fetcher
+from page_scripts import PROBE_JS
+from selector_registry import zero_implicit_wait
+
+HEAD_SIZE = 5          # 요약 상위 몇 항목까지 fingerprint 에 넣을지
+
+
+def _head(counts: Dict[str, int], n: int = HEAD_SIZE) -> List[List[Any]]:
+    return [[k, v] for k, v in sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))[:n]]
+
+
+def probe_http(place_id: str, transport=None) -> Dict[str, Any] | None:
+    try:
+        state, _ = http_fetcher.load_state(place_id, transport=transport)
+    except Exception:
+        return None
+    total = http_fetcher.review_total_from_state(state)
+    head = _head(http_fetcher.summary_counts_from_state(state))
+    if total is None and not head:
+        return None
+    return {"review_total": total, "summary_head": head, "source": "http"}
+
+
+def probe_browser(place_id: str, headless: bool = True, pool=None, timeout: float = 6.0) -> Dict[str, Any] | None:
+    with mpp.driver_session(headless=headless, pool=pool) as driver:
+        for url in mpp.SCOPE_MEMO.order(place_id, mpp.build_summary_urls(place_id), "summary"):
+            try:
+                mpp.open_url(driver, url)
+                with zero_implicit_wait(driver):
+                    WebDriverWait(driver, timeout).until(
+                        EC.presence_of_element_located((By.XPATH, mpp.SUMMARY_TITLE_XPATH)))
+                total, texts = driver.execute_script(PROBE_JS, HEAD_SIZE * 2)
+            except Exception:
+                continue
+            counts = dict(filter(None, (mpp.parse_summary_item(t) for t in texts or [])))
+            if total is None and not counts:
+                continue
+            return {"review_total": total, "summary_head": _head(counts), "source": "browser"}
+    return None
+
+
+def probe(place_id: str, headless: bool = True, pool=None, transport=None, browser: bool = True) -> Dict[str, Any] | None:
+    """HTTP → (browser=True 면) 브라우저 순. 둘 다 실패하면 None (= 변경 여부 모름 → 크롤)"""
+    p = probe_http(place_id, transport=transport)
+    if p is None and browser:
+        p = probe_browser(place_id, headless=headless, pool=pool)
+    return p
+
+
+def fingerprint(p: Dict[str, Any] | None) -> str | None:
+    """프로브 결과 → 짧은 해시 (source 는 빼고: HTTP/브라우저 어느 쪽으로 재도 같은 값)"""
+    if not p:
+        return None
+    key = json.dumps([p.get("review_total"), p.get("summary_head")], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def check(place_id: str, json_path: str | Path, headless: bool = True, pool=None,
+          browser: bool = True) -> Tuple[bool, Dict[str, Any] | None]:
+    """→ (바뀌지 않았음이 확실하면 True, 이번 프로브 결과)"""
+    p = probe(place_id, headless=headless, pool=pool, browser=browser)
+    fp = fingerprint(p)
+    stored = mpp.load_profile_meta(json_path).get("fingerprint")
+    return bool(fp and stored and fp == stored), p
+
+
+def stamp(json_path: str | Path, p: Dict[str, Any] | None) -> bool:
+    """크롤 성공 후 프로필에 이번 프로브 fingerprint 기록 (다음 실행의 비교 기준)"""
+    if not p:
+        return False
+    return mpp.stamp_profile(json_path, fingerprint=fingerprint(p), probe=p)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="review-count/summary-header change probe")
+    ap.add_argument("--place_id", required=True)
+    ap.add_argument("--json", default=None, help="비교할 프로필 JSON (없으면 fingerprint만 출력)")
+    ap.add_argument("--headless", action="store_true")
+    args = ap.parse_args(argv)
+
+    p = probe(args.place_id, headless=args.headless)
+    print(json.dumps({"probe": p, "fingerprint": fingerprint(p)}, ensure_ascii=False))
+    if args.json:
+        meta = mpp.load_profile_meta(args.json)
+        same = bool(p and meta.get("fingerprint") == fingerprint(p))
+        print(f"[PROBE] {'변경 없음' if same else '변경됨/모름'} (저장본 crawled_at={meta.get('crawled_at')})")
+        return 0 if same else 1
+    return 0 if p else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,177 @@
+# chrome_daemon.py — 미리 띄워두는 상주 Chrome (remote-debugging-port)
+#---호출법---#
+# python chrome_daemon.py start --headless      # 상주 Chrome 실행 (기본 포트 9222)
+# python chrome_daemon.py status
+# python chrome_daemon.py stop
+#
+# cron 등으로 단건 크롤(make_place_profile.py / naver_place_crolling.py)을 수백 번 돌릴 때
+# 매번 Chrome을 띄우고 끄는 비용을 없앤다. CLI 진입점은 데몬이 떠 있으면 디버깅 포트로 붙어서
+# 새 탭 하나만 열고, 끝나면 그 탭만 닫는다. 데몬이 없으면 평소처럼 Chrome을 새로 띄운다.
+from __future__ import annotations
+import os, sys, json, signal, argparse, subprocess, time
+import urllib.request
+from typing import Callable, Tuple
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+from browser_profile import DESKTOP_WINDOW, LEAN_ARGS, apply_request_blocking, emulate_mobile
+from driver_cache import CACHE_DIR, find_chrome_binary, resolve_driver_path
+
+DEFAULT_PORT = int(os.environ.get("CHROME_DAEMON_PORT", "9222"))
+STATE_PATH = CACHE_DIR / "chrome_daemon.json"
+PROFILE_DIR = CACHE_DIR / "chrome_daemon_profile"
+
+
+# -----------------------------
+# 데몬 상태
+# -----------------------------
+def is_running(port: int = DEFAULT_PORT, timeout: float = 0.3) -> bool:
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/json/version", timeout=timeout) as r:
+            return r.status == 200
+    except Exception:
+        return False
+
+
+def _read_state() -> dict:
+    try:
+        with open(STATE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def start(port: int = DEFAULT_PORT, headless: bool = True) -> int:
+    if is_running(port):
+        print(f"[DAEMON] 이미 실행 중 (port {port})")
+        return 0
+    exe = find_chrome_binary()
+    if not exe:
+        print("[DAEMON] Chrome 실행 파일을 찾지 못했어요.")
+        return 2
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    args = [exe, f"--remote-debugging-port={port}", f"--user-data-dir={PROFILE_DIR}", *LEAN_ARGS]
+    if headless:
+        args.append("--headless=new")
+    args.append("about:blank")               # 이 탭은 남겨둠 → 마지막 작업 탭을 닫아도 Chrome이 안 꺼짐
+
+    kw = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+    if sys.platform.startswith("win"):
+        kw["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kw["start_new_session"] = True
+    proc = subprocess.Popen(args, **kw)
+
+    for _ in range(50):
+        if is_running(port):
+            break
+        time.sleep(0.1)
+    else:
+        print("[DAEMON] 디버깅 포트가 열리지 않았어요.")
+        return 1
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(STATE_PATH, "w", encoding="utf-8") as f:
+        json.dump({"pid": proc.pid, "port": port, "headless": headless}, f)
+    print(f"[DAEMON] 시작 (pid {proc.pid}, port {port})")
+    return 0
+
+
+def stop() -> int:
+    st = _read_state()
+    pid = st.get("pid")
+    if not pid:
+        print("[DAEMON] 실행 기록 없음")
+        return 0
+    try:
+        if sys.platform.startswith("win"):
+            subprocess.run(["taskkill", "/PID", str(pid), "/T", "/F"], capture_output=True)
+        else:
+            os.kill(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+    STATE_PATH.unlink(missing_ok=True)
+    print(f"[DAEMON] 종료 (pid {pid})")
+    return 0
+
+
+# -----------------------------
+# 붙기 / 떼기
+# -----------------------------
+def attach(port: int = DEFAULT_PORT, mobile: bool = False, lean: bool = True,
+           implicit_wait: float = 8, page_load_timeout: float | None = 20) -> webdriver.Chrome:
+    """
+    상주 Chrome에 붙어 새 탭을 열고 그 탭을 현재 창으로 둔 드라이버를 돌려줌
+    make_chrome(make_place_profile.make_driver) 과 같은 타임아웃/창 크기를 맞춤.
+    단, pageLoadStrategy 는 세션을 만들 때의 capability 라 이미 떠 있는 Chrome 에 붙을 땐 바꿀 수 없음
+    (데몬을 띄운 쪽 설정 그대로, 기본 normal).
+    """
+    opts = webdriver.ChromeOptions()
+    opts.add_experimental_option("debuggerAddress", f"127.0.0.1:{port}")
+    driver = webdriver.Chrome(service=Service(resolve_driver_path()), options=opts)
+    driver.switch_to.new_window("tab")
+    driver.daemon_tab = driver.current_window_handle
+    # CDP 차단/에뮬레이션은 탭 단위 → 이 탭에만 적용되고 탭과 함께 사라짐
+    if lean:
+        apply_request_blocking(driver)
+    if mobile:
+        emulate_mobile(driver)                 # 뷰포트는 CDP 메트릭이 정함 (창 크기는 안 건드림)
+    else:
+        w, h = (int(v) for v in DESKTOP_WINDOW.split(","))
+        driver.set_window_size(w, h)           # 창은 탭들이 같이 씀 → 데스크톱 탭이 붙을 때마다 맞춤
+    driver.implicitly_wait(implicit_wait)
+    if page_load_timeout:
+        driver.set_page_load_timeout(page_load_timeout)
+    return driver
+
+
+def release_tab(driver):
+    """내가 연 탭만 닫고 세션을 끊음 (데몬 Chrome은 계속 살아있음)"""
+    try:
+        tab = getattr(driver, "daemon_tab", None)
+        if tab and len(driver.window_handles) > 1:
+            driver.switch_to.window(tab)
+            driver.close()
+    except Exception:
+        pass
+    try:
+        driver.quit()          # debuggerAddress 로 붙은 세션은 quit 해도 브라우저를 끄지 않음
+    except Exception:
+        pass
+
+
+def acquire_driver(launch: Callable[[], webdriver.Chrome], mobile: bool = False, use_daemon: bool = True,
+                   port: int = DEFAULT_PORT, implicit_wait: float = 8) -> Tuple[webdriver.Chrome, Callable[[], None]]:
+    """
+    데몬이 떠 있으면 새 탭으로 붙고, 아니면 launch()로 Chrome을 새로 띄움.
+    → (driver, release) : 작업이 끝나면 release() 호출 (탭 닫기 또는 quit)
+    """
+    if use_daemon and is_running(port):
+        try:
+            driver = attach(port, mobile=mobile, implicit_wait=implicit_wait)
+            print(f"[DAEMON] 상주 Chrome(port {port})에 새 탭으로 연결")
+            return driver, lambda: release_tab(driver)
+        except Exception as e:
+            print(f"[DAEMON] 연결 실패 → Chrome 새로 실행 ({type(e).__name__})")
+    driver = launch()
+    return driver, driver.quit
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="상주 Chrome 데몬 (remote-debugging-port)")
+    ap.add_argument("cmd", choices=["start", "stop", "status"])
+    ap.add_argument("--port", type=int, default=DEFAULT_PORT)
+    ap.add_argument("--headless", action="store_true")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "start":
+        return start(args.port, headless=args.headless)
+    if args.cmd == "stop":
+        return stop()
+    running = is_running(args.port)
+    print(f"[DAEMON] {'실행 중' if running else '꺼져 있음'} (port {args.port}) {_read_state() or ''}")
+    return 0 if running else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,294 @@
+# crawl_db.py — 배치 크롤 상태/결과 DB (SQLite 파일 1개)
+#---호출법---#
+# python crawl_db.py                          # 상태별 가게 수 + 최근 실행
+# python crawl_db.py --status FAIL --limit 50 # 실패 가게 목록 (마지막 오류 포함)
+# python crawl_db.py --place_id 31751923      # 가게 1곳의 시도 이력
+#
+# create_profiles_final 은 상태를 파일 존재(SKIP_IF_EXISTS) + 실행마다 새 batch_summary_{ts}.csv 로만 남겨서
+# 재시도/크래시 후 재개/"지난주에 뭐가 실패했나"를 CSV 를 뒤져서 맞춰야 했다.
+#   runs      : 배치 실행 1회 = 1행 (범위, 모드, 집계, 끝났는지)
+#   attempts  : 가게 처리 1회 = 1행 (상태, 모드, 오류, 소요 ms) — 이력은 지우지 않음
+#   places    : 가게별 최신 상태 (upsert) + 누적 시도/연속 실패 수 + 리뷰 총수/증가 속도(건/일) + 추천된 적 있는지
+#   tags      : 가게별 최신 태그 집계 (성공 시 통째로 교체)
+# 쓰기는 메인 프로세스 1곳(run() 의 record)에서만, 가게 1곳 단위 트랜잭션 → 중간에 죽어도 반쯤 쓴 행이 없음.
+from __future__ import annotations
+import json, sqlite3, argparse, datetime as dt
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+DEFAULT_DB_PATH = Path("./outputs/crawl_state.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at  TEXT NOT NULL,
+    finished_at TEXT,
+    mode        TEXT, engine TEXT,
+    start_row   INTEGER, end_row INTEGER,
+    total INTEGER DEFAULT 0, ok INTEGER DEFAULT 0, fail INTEGER DEFAULT 0, skip INTEGER DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS attempts (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id      INTEGER,
+    place_id    TEXT NOT NULL,
+    started_at  TEXT, finished_at TEXT NOT NULL,
+    elapsed_ms  INTEGER,
+    status      TEXT NOT NULL,
+    mode_used   TEXT, error TEXT, json_path TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_attempts_place ON attempts(place_id, finished_at);
+CREATE INDEX IF NOT EXISTS ix_attempts_run ON attempts(run_id, status);
+CREATE TABLE IF NOT EXISTS places (
+    place_id     TEXT PRIMARY KEY,
+    store_name   TEXT, cuisine_raw TEXT,
+    status       TEXT, mode_used TEXT, json_path TEXT, error TEXT,
+    attempts     INTEGER DEFAULT 0,
+    fail_streak  INTEGER DEFAULT 0,
+    review_total INTEGER,
+    review_velocity REAL,
+    recommended  INTEGER DEFAULT 0,
+    last_elapsed_ms INTEGER,
+    last_attempt_at TEXT, last_ok_at TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_places_status ON places(status, last_attempt_at);
+CREATE INDEX IF NOT EXISTS ix_places_ok ON places(last_ok_at);
+CREATE TABLE IF NOT EXISTS tags (
+    place_id TEXT NOT NULL,
+    tag      TEXT NOT NULL,
+    count    INTEGER NOT NULL,
+    PRIMARY KEY (place_id, tag)
+);
+"""
+# 예전 스키마로 만들어진 DB 파일에 나중에 추가된 컬럼 (CREATE TABLE IF NOT EXISTS 로는 안 붙음)
+_ADDED_COLUMNS = {"places": [("review_velocity", "REAL"), ("recommended", "INTEGER DEFAULT 0")]}
+VELOCITY_ALPHA = 0.5     # 리뷰 증가 속도 EWMA 가중치 (새 관측 쪽)
+
+_UPSERT_PLACE = """
+INSERT INTO places (place_id, store_name, cuisine_raw, status, mode_used, json_path, error,
+                    attempts, fail_streak, review_total, review_velocity, last_elapsed_ms, last_attempt_at, last_ok_at)
+VALUES (:place_id, :store_name, :cuisine_raw, :status, :mode_used, :json_path, :error,
+        1, :failed, :review_total, :velocity, :elapsed_ms, :finished_at, CASE WHEN :status = 'OK' THEN :finished_at END)
+ON CONFLICT(place_id) DO UPDATE SET
+    store_name      = COALESCE(NULLIF(excluded.store_name, ''), places.store_name),
+    cuisine_raw     = COALESCE(NULLIF(excluded.cuisine_raw, ''), places.cuisine_raw),
+    status          = excluded.status,
+    mode_used       = excluded.mode_used,
+    json_path       = COALESCE(NULLIF(excluded.json_path, ''), places.json_path),
+    error           = excluded.error,
+    attempts        = places.attempts + 1,
+    fail_streak     = CASE WHEN excluded.status = 'FAIL' THEN places.fail_streak + 1
+                           WHEN excluded.status = 'OK' THEN 0 ELSE places.fail_streak END,
+    review_total    = COALESCE(excluded.review_total, places.review_total),
+    review_velocity = COALESCE(excluded.review_velocity, places.review_velocity),
+    last_elapsed_ms = excluded.last_elapsed_ms,
+    last_attempt_at = excluded.last_attempt_at,
+    last_ok_at      = COALESCE(excluded.last_ok_at, places.last_ok_at)
+"""
+
+
+def _now() -> str:
+    return dt.datetime.now().isoformat(timespec="seconds")
+
+
+def read_profile(json_path: str | Path) -> Dict[str, Any]:
+    """프로필 JSON → {"tag_counts": {...}, "review_total": int|None, "crawled_at": str|None} (없거나 깨졌으면 빈 dict)"""
+    try:
+        with open(json_path, encoding="utf-8") as f:
+            doc = json.load(f)
+    except Exception:
+        return {}
+    meta = doc.get("meta") or {}
+    # 가게 전체 리뷰 수만 씀 (meta.reviews 는 이번에 펼친 행 수라 max_clicks/샘플링에 잘려서 속도 계산에 못 씀)
+    total = meta.get("review_total")
+    if total is None:
+        total = (meta.get("probe") or {}).get("review_total")
+    return {"tag_counts": doc.get("tag_counts") or {}, "review_total": total, "crawled_at": meta.get("crawled_at")}
+
+
+def _velocity(prev: sqlite3.Row | None, total: int | None, now: dt.datetime) -> float | None:
+    """직전 성공 시점 대비 리뷰 총수 증가 → 건/일, 기존 값과 EWMA (둘 중 하나라도 모르면 None = 기존 값 유지)"""
+    if prev is None or total is None or prev["review_total"] is None or not prev["last_ok_at"]:
+        return None
+    days = (now - dt.datetime.fromisoformat(prev["last_ok_at"])).total_seconds() / 86400
+    if days < 0.5:                                       # 너무 짧은 간격은 잡음만 큼
+        return None
+    v = max(int(total) - int(prev["review_total"]), 0) / days
+    old = prev["review_velocity"]
+    return v if old is None else VELOCITY_ALPHA * v + (1 - VELOCITY_ALPHA) * old
+
+
+class CrawlDB:
+    def __init__(self, path: str | Path = DEFAULT_DB_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")       # 배치가 쓰는 중에도 조회는 바로
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        for table, cols in _ADDED_COLUMNS.items():
+            have = {r["name"] for r in self.conn.execute(f"PRAGMA table_info({table})")}
+            for name, decl in cols:
+                if name not in have:
+                    self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {decl}")
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -----------------------------
+    # 실행(run) 단위
+    # -----------------------------
+    def start_run(self, mode: str = "", engine: str = "", start_row: int | None = None,
+                  end_row: int | None = None) -> int:
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO runs (started_at, mode, engine, start_row, end_row) VALUES (?, ?, ?, ?, ?)",
+                (_now(), mode, engine, start_row, end_row))
+        return cur.lastrowid
+
+    def finish_run(self, run_id: int, total: int, ok: int, fail: int, skip: int):
+        """집계는 더해서 기록 (--resume 으로 이어 돈 세션도 같은 run 에 누적)"""
+        with self.conn:
+            self.conn.execute("UPDATE runs SET finished_at = ?, total = total + ?, ok = ok + ?, fail = fail + ?, "
+                              "skip = skip + ? WHERE run_id = ?", (_now(), total, ok, fail, skip, run_id))
+
+    def last_unfinished_run(self) -> sqlite3.Row | None:
+        """가장 최근 실행이 끝나지 않았으면 그 행 (크래시/중단 → --resume 대상)"""
+        row = self.conn.execute("SELECT * FROM runs ORDER BY run_id DESC LIMIT 1").fetchone()
+        return row if row is not None and row["finished_at"] is None else None
+
+    def done_in_run(self, run_id: int) -> set[str]:
+        """해당 실행에서 이미 끝난(OK/SKIP) 가게 — 재개 시 건너뜀 (FAIL 은 다시 시도)"""
+        rows = self.conn.execute("SELECT DISTINCT place_id FROM attempts WHERE run_id = ? AND status IN ('OK', 'SKIP')",
+                                 (run_id,))
+        return {r["place_id"] for r in rows}
+
+    # -----------------------------
+    # 가게 1곳 결과 기록
+    # -----------------------------
+    def record(self, result: Dict[str, Any], run_id: int | None = None):
+        """create_profiles_final 의 요약 행(dict) 1개 → attempts 추가 + places upsert (+ 성공 시 tags 교체)"""
+        finished = dt.datetime.now()
+        elapsed = result.get("elapsed_ms") or None
+        started = (finished - dt.timedelta(milliseconds=elapsed)).isoformat(timespec="seconds") if elapsed else None
+        profile = read_profile(result["json_path"]) if result.get("status") == "OK" and result.get("json_path") else {}
+        row = {
+            "place_id": str(result.get("place_id") or ""),
+            "store_name": result.get("store_name") or "",
+            "cuisine_raw": result.get("cuisine_raw") or "",
+            "status": result.get("status") or "FAIL",
+            "mode_used": result.get("mode_used") or "",
+            "json_path": result.get("json_path") or "",
+            "error": result.get("error") or "",
+            "elapsed_ms": elapsed,
+            "failed": int(result.get("status") == "FAIL"),
+            "review_total": profile.get("review_total"),
+            "velocity": _velocity(self.place(result.get("place_id") or ""), profile.get("review_total"), finished),
+            "started_at": started,
+            "finished_at": finished.isoformat(timespec="seconds"),
+            "run_id": run_id,
+        }
+        if not row["place_id"]:
+            return
+        with self.conn:                                  # 가게 1곳 = 트랜잭션 1개
+            self.conn.execute(
+                "INSERT INTO attempts (run_id, place_id, started_at, finished_at, elapsed_ms, status, mode_used, "
+                "error, json_path) VALUES (:run_id, :place_id, :started_at, :finished_at, :elapsed_ms, :status, "
+                ":mode_used, :error, :json_path)", row)
+            self.conn.execute(_UPSERT_PLACE, row)
+            if profile:
+                self.conn.execute("DELETE FROM tags WHERE place_id = ?", (row["place_id"],))
+                self.conn.executemany("INSERT INTO tags (place_id, tag, count) VALUES (?, ?, ?)",
+                                      [(row["place_id"], t, int(c)) for t, c in profile["tag_counts"].items()])
+
+    def mark_recommended(self, place_ids: Iterable[str]) -> int:
+        """챗봇이 추천한 적 있는 가게 표시 (재크롤 스케줄러가 우선순위를 올림)"""
+        ids = [(str(p),) for p in place_ids if str(p).strip()]
+        with self.conn:
+            self.conn.executemany("INSERT INTO places (place_id, recommended) VALUES (?, 1) "
+                                  "ON CONFLICT(place_id) DO UPDATE SET recommended = 1", ids)
+        return len(ids)
+
+    # -----------------------------
+    # 조회
+    # -----------------------------
+    def status_counts(self) -> Dict[str, int]:
+        return {r["status"]: r["n"] for r in
+                self.conn.execute("SELECT status, COUNT(*) AS n FROM places GROUP BY status")}
+
+    def places(self, status: str | None = None, limit: int = 100) -> List[sqlite3.Row]:
+        if status:
+            q = ("SELECT * FROM places WHERE status = ? ORDER BY last_attempt_at DESC LIMIT ?", (status, limit))
+        else:
+            q = ("SELECT * FROM places ORDER BY last_attempt_at DESC LIMIT ?", (limit,))
+        return self.conn.execute(*q).fetchall()
+
+    def place_map(self) -> Dict[str, sqlite3.Row]:
+        return {r["place_id"]: r for r in self.conn.execute("SELECT * FROM places")}
+
+    def median_elapsed_ms(self, default: int = 20000) -> int:
+        """성공 시도의 소요시간 중앙값 (처음 보는 가게의 예상 비용)"""
+        rows = [r[0] for r in self.conn.execute(
+            "SELECT elapsed_ms FROM attempts WHERE status = 'OK' AND elapsed_ms IS NOT NULL "
+            "ORDER BY id DESC LIMIT 500")]
+        return sorted(rows)[len(rows) // 2] if rows else default
+
+    def place(self, place_id: str) -> sqlite3.Row | None:
+        return self.conn.execute("SELECT * FROM places WHERE place_id = ?", (str(place_id),)).fetchone()
+
+    def history(self, place_id: str, limit: int = 20) -> List[sqlite3.Row]:
+        return self.conn.execute("SELECT * FROM attempts WHERE place_id = ? ORDER BY id DESC LIMIT ?",
+                                 (str(place_id), limit)).fetchall()
+
+    def tag_counts(self, place_id: str) -> Dict[str, int]:
+        return {r["tag"]: r["count"] for r in
+                self.conn.execute("SELECT tag, count FROM tags WHERE place_id = ? ORDER BY count DESC", (str(place_id),))}
+
+    def runs(self, limit: int = 5) -> List[sqlite3.Row]:
+        return self.conn.execute("SELECT * FROM runs ORDER BY run_id DESC LIMIT ?", (limit,)).fetchall()
+
+
+def _print_rows(rows: Iterable[sqlite3.Row], cols: List[str]):
+    for r in rows:
+        print("  " + "  ".join(f"{c}={r[c]}" for c in cols))
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="crawl state DB query")
+    ap.add_argument("--db", default=str(DEFAULT_DB_PATH))
+    ap.add_argument("--status", default=None, help="OK / FAIL / SKIP 가게 목록")
+    ap.add_argument("--place_id", default=None, help="가게 1곳의 상태 + 시도 이력")
+    ap.add_argument("--limit", type=int, default=20)
+    args = ap.parse_args(argv)
+
+    with CrawlDB(args.db) as db:
+        if args.place_id:
+            p = db.place(args.place_id)
+            if p is None:
+                print(f"[DB] 기록 없음: {args.place_id}")
+                return 1
+            print(dict(p))
+            _print_rows(db.history(args.place_id, args.limit),
+                        ["finished_at", "status", "mode_used", "elapsed_ms", "error"])
+            print(f"tags: {db.tag_counts(args.place_id)}")
+        elif args.status:
+            _print_rows(db.places(args.status, args.limit),
+                        ["place_id", "store_name", "last_attempt_at", "fail_streak", "error"])
+        else:
+            print(f"상태별 가게 수: {db.status_counts()}")
+            _print_rows(db.runs(args.limit), ["run_id", "started_at", "finished_at", "total", "ok", "fail", "skip"])
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
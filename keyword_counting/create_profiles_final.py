@@ -8,13 +8,34 @@
 
 #------------------#
 # 2) create_profiles_final.py 코드 실행
+#   python create_profiles_final.py                 # 직렬
+#   python create_profiles_final.py --workers 4     # 병렬(워커마다 Chrome 1개)
+#   python create_profiles_final.py --engine async --concurrency 12   # asyncio(Playwright) 1프로세스 동시 처리
+#   python create_profiles_final.py --resume        # 중단된 직전 실행을 끝난 가게 빼고 이어서 (crawl_db.py)
+#   python create_profiles_final.py --schedule --limit 300 --budget_min 45   # 재크롤 가치 높은 순 (recrawl_scheduler.py)
+#   여러 머신에 나눠 돌리기 (work_queue.py, 여러 머신이면 --queue redis://host:6379/0):
+#   python create_profiles_final.py --enqueue [--schedule --limit 3000]   # 코디네이터: 작업 넣기
+#   python create_profiles_final.py --work --workers 4                     # 각 호스트: 빌려서 크롤 → 결과 올리기
+#   python create_profiles_final.py --collect                              # 코디네이터: 결과를 places_json/상태 DB 로
 #------------------#
 # create_profiles_final.py — place_list.csv 일괄 실행 (요약패널 FAST 모드 기본)
 from __future__ import annotations
-import csv, sys, time, random, datetime as dt
+import csv, sys, json, time, random, asyncio, argparse, datetime as dt
+import multiprocessing as mp
+from multiprocessing.util import Finalize
 from pathlib import Path
 
 import make_place_profile as mpp  # 방금 교체한 파일을 사용
+import http_fetcher
+import change_probe
+import recrawl_scheduler
+import throttle
+import work_queue
+from crawl_db import CrawlDB
+from driver_pool import DriverPool
+from rate_limit import HostRateLimiter
+from throttle import AimdController
+from work_queue import open_queue
 
 # ===== 사용자 설정 =====
 PLACE_LIST_PATH = Path("place_list.csv")
@@ -22,16 +43,43 @@ OUTPUT_DIR      = Path("./outputs/places_json")
 
 # make_place_profile 옵션
 MODE               = "summary"   # "summary"(빠름/정확) 기본, 실패시 chips로 폴백 옵션 아래
+                                 # "network" = 리뷰 API 응답 캡처 (풀 드라이버에 performance 로그를 켬)
 HEADLESS           = True        # 창 없이 빠르게 (문제시 False로)
 SAVE_CSV_ALSO      = False       # chips 모드일 때만 의미 있음
 DEDUP_WITHIN_ROW   = True
 MAX_CLICKS         = 60          # chips 모드에서만 의미 있음
+SAMPLE_CHIPS       = False       # chips 모드: 태그 분포가 수렴하면 펼치기 중단 (mpp.SAMPLE_* 로 조절)
 SORT               = "recent"
 
 # 기타
 SKIP_IF_EXISTS         = True    # 이미 생성된 JSON은 건너뛰기
+REFRESH_CHANGED        = False   # True면 기존 JSON도 프로브(리뷰 총수+요약 상위)로 확인해서 바뀐 곳만 재크롤
 FALLBACK_TO_CHIPS_ON_FAIL = True # summary 실패 시 chips로 1회 재시도(느려질 수 있음)
+TRY_HTTP_FIRST         = True    # 브라우저 없이 HTTP(SSR 상태)로 먼저 시도 → 실패/불완전할 때만 Selenium
 SLEEP_BETWEEN_SEC      = (0.6, 1.3)  # 가게 간 랜덤 딜레이
+USE_AIMD               = True    # 차단/타임아웃/빈 페이지가 보이면 동시 처리 수를 줄이고 대기, 성공하면 다시 늘림 (throttle.py)
+AIMD_BACKOFF_SEC       = (5.0, 300.0)  # 스로틀 시 첫 대기 → 연속될 때마다 2배, 최대값
+USE_DB                 = True    # 상태/시도 이력/태그 집계를 outputs/crawl_state.sqlite 에도 기록 (요약 CSV 는 그대로)
+DB_PATH                = Path("./outputs/crawl_state.sqlite")
+
+# 드라이버 풀 (가게마다 Chrome 새로 띄우지 않기)
+POOL_SIZE              = 1       # 직렬 배치는 1개면 충분
+POOL_MAX_PAGES         = 40      # N개 가게 처리 후 Chrome 재기동(메모리 누수 방지)
+
+# 병렬 모드(--workers N): 워커 프로세스마다 Chrome 1개, 호스트별 전역 레이트 리밋
+RATE_LIMIT_SEC         = 0.8     # 같은 호스트로 나가는 페이지 이동 최소 간격(모든 워커 합산)
+
+# async 엔진(--engine async): 브라우저 1개에 동시에 띄울 페이지 수
+ASYNC_CONCURRENCY      = 8
+
+# 작업 큐(--enqueue/--work/--collect): 여러 호스트가 같은 큐에서 가게를 빌려 감
+QUEUE_PATH             = work_queue.DEFAULT_QUEUE_PATH   # 여러 호스트면 "redis://host:6379/0" (SQLite 는 한 머신 전용)
+QUEUE_LEASE_SEC        = work_queue.LEASE_SEC   # 가게 1곳 크롤보다 넉넉하게 (하트비트가 1/3 주기로 연장)
+QUEUE_POLL_SEC         = 5.0     # 빌릴 작업이 없을 때 (남은 건 다른 워커가 처리 중) 다시 볼 간격
+
+# --schedule --budget_min: 이 시각(time.time()) 이후에 차례가 온 가게는 크롤하지 않고 SKIP(budget)
+DEADLINE: float | None = None
+CONTROLLER: AimdController | None = None   # run() 이 만들어 꽂음 (워커는 _worker_init 으로 공유본을 받음)
 # =====================
 
 
@@ -55,10 +103,299 @@ def _open_csv_with_fallback(path: Path):
     raise last_err or UnicodeError("CSV 인코딩 감지 실패 (UTF-8/CP949로 저장해 주세요).")
 
 
-def run(start: int | None = None, end: int | None = None) -> int:
+def _read_place_rows(start: int | None = None, end: int | None = None) -> list[dict]:
+    f, reader = _open_csv_with_fallback(PLACE_LIST_PATH)
+    with f:
+        rows = list(reader)
+    if start is not None or end is not None:
+        s = 0 if start is None else max(int(start), 0)
+        e = len(rows) if end is None else max(int(end), 0)
+        rows = rows[s:e]
+    return rows
+
+
+def _job_of(row: dict) -> tuple[str, str, str]:
+    """place_list 행 → (place_id, store_name, cuisine_raw)"""
+    return ((row.get("place_id") or "").strip(),
+            (row.get("store_name") or row.get("name") or "").strip(),
+            (row.get("cuisine") or "").strip())
+
+
+SUMMARY_FIELDS = ["place_id","store_name","cuisine_raw","json_path","status","error","mode_used","elapsed_ms"]
+
+
+def _summary_row(place_id, store_name, cuisine_raw, json_path="", status="OK", error="", mode_used=""):
+    return {
+        "place_id": place_id, "store_name": store_name,
+        "cuisine_raw": cuisine_raw, "json_path": json_path,
+        "status": status, "error": error, "mode_used": mode_used, "elapsed_ms": "",
+    }
+
+
+def _mode_order(place_id: str) -> list[str]:
+    """시도할 모드 순서: 지난번에 통한 모드(스코프 메모) → MODE → (폴백) chips
+    network 는 perf_log 드라이버가 있어야 함 → MODE 가 network 가 아니면 메모에 있어도 건너뜀"""
+    memo = mpp.SCOPE_MEMO.mode(place_id)
+    if memo == "network" and MODE != "network":
+        memo = None
+    modes = [memo, MODE]
+    if FALLBACK_TO_CHIPS_ON_FAIL:
+        modes.append("chips")
+    return list(dict.fromkeys(m for m in modes if m))
+
+
+def _try_http(place_id: str, store_name: str, cuisine_raw: str, cuisine_tokens: list[str]) -> dict | None:
+    """HTTP 전용 수집 성공 시 요약 행, 실패하면 None (→ 브라우저 크롤)"""
+    mode = _mode_order(place_id)[0]
+    try:
+        out_json = http_fetcher.fetch_and_build(place_id=place_id, cuisine=cuisine_tokens, store_name=store_name,
+                                                sort=SORT, dedup_within_row=DEDUP_WITHIN_ROW, mode=mode)
+    except throttle.Throttled as e:
+        # 막힌 상태에서 브라우저로 같은 호스트를 또 두드리지 않음 → 바로 FAIL (컨트롤러가 속도를 줄임)
+        print(f"[THROTTLED] {store_name} ({place_id}) - {e}")
+        return _summary_row(place_id, store_name, cuisine_raw, status="FAIL",
+                            error=f"{type(e).__name__}: {e}", mode_used=f"{mode}/http")
+    except Exception as e:
+        print(f"[HTTP→browser] {store_name} ({place_id}) - 사유: {type(e).__name__}: {e}")
+        return None
+    mpp.SCOPE_MEMO.record_mode(place_id, mode)
+    print(f"[OK] {store_name} ({place_id}) -> {out_json}  [mode={mode}/http]")
+    return _summary_row(place_id, store_name, cuisine_raw, json_path=out_json, mode_used=f"{mode}/http")
+
+
+def _unchanged_row(place_id, store_name, cuisine_raw, json_path) -> dict:
+    print(f"[SKIP] 변경 없음: {place_id} (fingerprint 동일)")
+    return _summary_row(place_id, store_name, cuisine_raw, json_path=str(json_path), status="SKIP",
+                        mode_used="unchanged")
+
+
+def _over_budget_row(place_id, store_name, cuisine_raw) -> dict | None:
+    if DEADLINE is None or time.time() < DEADLINE:
+        return None
+    return _summary_row(place_id, store_name, cuisine_raw, status="SKIP", error="time budget", mode_used="budget")
+
+
+def _record_review_total(json_path, place_id: str, probe=None):
+    """프로필 meta.review_total 을 가게 전체 리뷰 수로 채움 (크롤 중 못 읽었으면 프로브 값 → 없으면 HTTP 프로브)"""
+    if probe:
+        change_probe.stamp(json_path, probe)
+    if mpp.load_profile_meta(json_path).get("review_total") is not None:
+        return
+    p = probe if probe and probe.get("review_total") is not None else change_probe.probe_http(place_id)
+    if p and p.get("review_total") is not None:
+        mpp.stamp_profile(json_path, review_total=p["review_total"])
+
+
+def crawl_one(place_id: str, store_name: str, cuisine_raw: str, pool=None) -> dict:
+    """REFRESH_CHANGED 면 먼저 프로브 → 안 바뀌었으면 SKIP, 아니면 크롤 후 fingerprint 기록"""
+    over = _over_budget_row(place_id, store_name, cuisine_raw)
+    if over:
+        return over
+    t0 = time.time()
+    probe = None
+    if REFRESH_CHANGED:
+        json_path = OUTPUT_DIR / f"{place_id}_tags.json"
+        unchanged, probe = change_probe.check(place_id, json_path, headless=HEADLESS, pool=pool)
+        if unchanged:
+            row = _unchanged_row(place_id, store_name, cuisine_raw, json_path)
+            row["elapsed_ms"] = int((time.time() - t0) * 1000)
+            return row
+    row = _crawl_one(place_id, store_name, cuisine_raw, pool=pool)
+    if row["status"] == "OK":
+        _record_review_total(row["json_path"], place_id, probe)
+    row["elapsed_ms"] = int((time.time() - t0) * 1000)
+    return row
+
+
+def _crawl_one(place_id: str, store_name: str, cuisine_raw: str, pool=None) -> dict:
+    """가게 1곳 처리 (메모된 모드 → MODE → 실패 시 chips 폴백) 후 요약 CSV 한 줄(dict)을 돌려줌"""
+    cuisine_tokens = mpp.parse_cuisine_tokens([cuisine_raw]) if cuisine_raw else []
+    kwargs = dict(
+        place_id=place_id,
+        cuisine=cuisine_tokens,
+        store_name=store_name,
+        sort=SORT,
+        max_clicks=MAX_CLICKS,
+        headless=HEADLESS,
+        save_csv_also=SAVE_CSV_ALSO,
+        dedup_within_row=DEDUP_WITHIN_ROW,
+        pool=pool,
+        sampling=SAMPLE_CHIPS,
+    )
+
+    if TRY_HTTP_FIRST:
+        row = _try_http(place_id, store_name, cuisine_raw, cuisine_tokens)
+        if row is not None:
+            return row
+
+    # 1차: 메모된 모드 또는 summary (빠름/정확) → 필요 시 chips로 폴백(느릴 수 있음)
+    modes = _mode_order(place_id)
+    err = None
+    for mode_used in modes:
+        if err is not None:
+            print(f"[RETRY→{mode_used}] {store_name} ({place_id}) - 사유: {type(err).__name__}")
+        try:
+            out_json = mpp.fetch_and_build(mode=mode_used, **kwargs)
+        except Exception as e:
+            err = e
+            if isinstance(e, throttle.Throttled):
+                break                           # 차단 중엔 다른 모드도 같은 결과
+            continue
+        mpp.SCOPE_MEMO.record_mode(place_id, mode_used)
+        print(f"[OK] {store_name} ({place_id}) -> {out_json}  [mode={mode_used}]")
+        return _summary_row(place_id, store_name, cuisine_raw, json_path=out_json, mode_used=mode_used)
+
+    print(f"[FAIL] {store_name} ({place_id}) -> {type(err).__name__}: {err}")
+    return _summary_row(place_id, store_name, cuisine_raw, status="FAIL",
+                        error=f"{type(err).__name__}: {err}", mode_used=mode_used)
+
+
+async def crawl_one_async(engine, place_id: str, store_name: str, cuisine_raw: str) -> dict:
+    """crawl_one 의 async 엔진 버전 (프로브는 HTTP만: 스레드에서 Chrome 을 따로 띄우지 않게)"""
+    over = _over_budget_row(place_id, store_name, cuisine_raw)
+    if over:
+        return over
+    t0 = time.time()
+    probe = None
+    if REFRESH_CHANGED:
+        json_path = OUTPUT_DIR / f"{place_id}_tags.json"
+        async with engine.slot():
+            unchanged, probe = await asyncio.to_thread(change_probe.check, place_id, json_path, browser=False)
+        if unchanged:
+            row = _unchanged_row(place_id, store_name, cuisine_raw, json_path)
+            row["elapsed_ms"] = int((time.time() - t0) * 1000)
+            return row
+    row = await _crawl_one_async(engine, place_id, store_name, cuisine_raw)
+    if row["status"] == "OK":
+        async with engine.slot():
+            await asyncio.to_thread(_record_review_total, row["json_path"], place_id, probe)
+    row["elapsed_ms"] = int((time.time() - t0) * 1000)
+    return row
+
+
+async def _crawl_one_async(engine, place_id: str, store_name: str, cuisine_raw: str) -> dict:
+    """_crawl_one 의 async 엔진 버전 (같은 모드 순서, 같은 요약 행)"""
+    cuisine_tokens = mpp.parse_cuisine_tokens([cuisine_raw]) if cuisine_raw else []
+    if TRY_HTTP_FIRST:
+        # to_thread 는 기본 스레드 풀 크기만큼 돌기 때문에 --concurrency 가 HTTP 요청에도 걸리도록 엔진 슬롯 안에서
+        async with engine.slot():
+            row = await asyncio.to_thread(_try_http, place_id, store_name, cuisine_raw, cuisine_tokens)
+        if row is not None:
+            return row
+    kwargs = dict(place_id=place_id, cuisine=cuisine_tokens, store_name=store_name, sort=SORT,
+                  max_clicks=MAX_CLICKS, save_csv_also=SAVE_CSV_ALSO, dedup_within_row=DEDUP_WITHIN_ROW,
+                  sampling=SAMPLE_CHIPS)
+    # Selenium 실행에서 메모된 network 모드 등 엔진이 못 하는 모드는 건너뜀 (MODE 는 run() 에서 미리 검사)
+    modes = [m for m in _mode_order(place_id) if m in engine.MODES]
+    err = None
+    for mode_used in modes:
+        if err is not None:
+            print(f"[RETRY→{mode_used}] {store_name} ({place_id}) - 사유: {type(err).__name__}")
+        try:
+            out_json = await engine.fetch_and_build(mode=mode_used, **kwargs)
+        except Exception as e:
+            err = e
+            if isinstance(e, throttle.Throttled):
+                break
+            continue
+        mpp.SCOPE_MEMO.record_mode(place_id, mode_used)
+        print(f"[OK] {store_name} ({place_id}) -> {out_json}  [mode={mode_used}, engine=async]")
+        return _summary_row(place_id, store_name, cuisine_raw, json_path=out_json, mode_used=mode_used)
+    print(f"[FAIL] {store_name} ({place_id}) -> {type(err).__name__}: {err}")
+    return _summary_row(place_id, store_name, cuisine_raw, status="FAIL",
+                        error=f"{type(err).__name__}: {err}", mode_used=mode_used)
+
+
+def crawl_guarded(place_id: str, store_name: str, cuisine_raw: str, pool=None) -> dict:
+    """CONTROLLER 슬롯을 잡고 crawl_one → 결과로 동시성/백오프 조정 (CONTROLLER 없으면 그냥 crawl_one)"""
+    if CONTROLLER is None:
+        return crawl_one(place_id, store_name, cuisine_raw, pool=pool)
+    started, row = CONTROLLER.acquire(), None
+    try:
+        row = crawl_one(place_id, store_name, cuisine_raw, pool=pool)
+        return row
+    finally:
+        CONTROLLER.release(started, throttle.outcome(row))
+
+
+async def crawl_guarded_async(engine, place_id: str, store_name: str, cuisine_raw: str) -> dict:
+    if CONTROLLER is None:
+        return await crawl_one_async(engine, place_id, store_name, cuisine_raw)
+    started, row = await CONTROLLER.acquire_async(), None
+    try:
+        row = await crawl_one_async(engine, place_id, store_name, cuisine_raw)
+        return row
+    finally:
+        CONTROLLER.release(started, throttle.outcome(row))
+
+
+# -----------------------------
+# 병렬 워커 (프로세스마다 자기 Chrome 풀 1개)
+# -----------------------------
+_WORKER_POOL: DriverPool | None = None
+
+
+def _make_pool_driver():
+    return mpp.make_driver(headless=HEADLESS, perf_log=(MODE == "network"))
+
+
+def _worker_init(limiter: HostRateLimiter, refresh_changed: bool = False, deadline: float | None = None,
+                 controller: AimdController | None = None):
+    global _WORKER_POOL, REFRESH_CHANGED, DEADLINE, CONTROLLER
+    mpp.RATE_LIMITER = limiter
+    REFRESH_CHANGED = refresh_changed          # spawn 방식 워커는 CLI 로 바꾼 전역값을 물려받지 못함
+    DEADLINE = deadline
+    CONTROLLER = controller
+    _WORKER_POOL = DriverPool(_make_pool_driver, size=1, max_pages=POOL_MAX_PAGES)
+    # Pool 워커는 atexit이 안 돌기 때문에 Finalize로 Chrome 정리
+    Finalize(_WORKER_POOL, _WORKER_POOL.close, exitpriority=10)
+    Finalize(_WORKER_POOL, mpp.save_run_state, exitpriority=9)
+
+
+def _worker_task(job: tuple) -> dict:
+    place_id, store_name, cuisine_raw = job
+    return crawl_guarded(place_id, store_name, cuisine_raw, pool=_WORKER_POOL)
+
+
+def _make_controller(max_limit: int, ctx=None) -> AimdController | None:
+    if not USE_AIMD:
+        return None
+    base, cap = AIMD_BACKOFF_SEC
+    return AimdController(max_limit, base_backoff=base, max_backoff=cap, ctx=ctx)
+
+
+def run(start: int | None = None, end: int | None = None, workers: int = 1,
+        engine: str = "selenium", concurrency: int = ASYNC_CONCURRENCY, resume: bool = False,
+        schedule: bool = False, limit: int | None = None, budget_min: float | None = None,
+        recommended_path: str | None = None) -> int:
+    """
+    schedule=True 면 start~end 범위를 재크롤 가치 순으로 다시 골라 limit 개 / budget_min 분 안에 드는 만큼만
+    (기존 JSON 이 있어도 크롤, 예산 시각이 지나면 남은 가게는 SKIP(budget))
+    """
+    global DEADLINE, CONTROLLER
     if not PLACE_LIST_PATH.exists():
         print(f"[ERR] CSV 없음: {PLACE_LIST_PATH.resolve()}")
         return 2
+    if engine == "async":
+        from async_engine import AsyncEngine
+        if MODE not in AsyncEngine.MODES:
+            print(f"[ERR] --engine async 는 MODE={MODE} 를 지원하지 않아요 (가능: {', '.join(AsyncEngine.MODES)})")
+            return 2
+
+    # 상태 DB: resume 이면 끝나지 않은 직전 실행을 같은 범위로 이어서 (그 실행에서 OK/SKIP 된 가게는 제외)
+    db = CrawlDB(DB_PATH) if USE_DB or resume or schedule else None
+    done: set[str] = set()
+    run_id = None
+    if resume:
+        prev = db.last_unfinished_run()
+        if prev is None:
+            print("[RESUME] 이어서 돌릴 미완료 실행이 없어 새로 시작합니다.")
+        else:
+            run_id, start, end = prev["run_id"], prev["start_row"], prev["end_row"]
+            done = db.done_in_run(run_id)
+            print(f"[RESUME] run #{run_id} (행 {start}~{end}) 이어서: 이미 끝난 가게 {len(done)}곳 제외")
+    if db is not None and run_id is None:
+        run_id = db.start_run(mode=MODE, engine=engine, start_row=start, end_row=end)
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     summary_dir = Path("outputs") / "batch_logs"
@@ -66,120 +403,280 @@ def run(start: int | None = None, end: int | None = None) -> int:
     ts = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
     summary_csv = summary_dir / f"batch_summary_{ts}.csv"
 
-    f, reader = _open_csv_with_fallback(PLACE_LIST_PATH)
+    rows = _read_place_rows(start, end)
 
-    total = ok = fail = skip = 0
-    with f, summary_csv.open("w", encoding="utf-8-sig", newline="") as sf:
-        writer = csv.DictWriter(sf, fieldnames=[
-            "place_id","store_name","cuisine_raw","json_path","status","error","mode_used"
-        ])
+    total = ok = fail = skip = resumed = 0
+    # 요약 CSV는 메인 프로세스만 씀 (워커는 결과 dict만 돌려줌)
+    with summary_csv.open("w", encoding="utf-8-sig", newline="") as sf:
+        writer = csv.DictWriter(sf, fieldnames=SUMMARY_FIELDS)
         writer.writeheader()
 
-        rows = list(reader)
-        if start is not None or end is not None:
-            s = 0 if start is None else max(int(start), 0)
-            e = len(rows) if end is None else max(int(end), 0)
-            rows = rows[s:e]
+        if schedule:
+            if recommended_path:
+                db.mark_recommended(recrawl_scheduler.load_recommended(recommended_path))
+            parallel = concurrency if engine == "async" else max(workers, 1)
+            picked = recrawl_scheduler.plan(rows, db, limit=limit, parallel=parallel, profile_dir=OUTPUT_DIR,
+                                            budget_sec=budget_min * 60 if budget_min else None)
+            print(f"[SCHEDULE] 후보 {len(rows)}곳 중 {len(picked)}곳 선택 "
+                  f"(예상 {sum(c['cost_sec'] for c in picked) / parallel / 60:.1f}분, 예산 {budget_min or '-'}분)")
+            rows = [c["row"] for c in picked]
+            DEADLINE = time.time() + budget_min * 60 if budget_min else None
 
-        print(f">>> 총 {len(rows)}개 가게 처리 시작 (MODE={MODE}, HEADLESS={HEADLESS})")
+        print(f">>> 총 {len(rows)}개 가게 처리 시작 (MODE={MODE}, HEADLESS={HEADLESS}, ENGINE={engine}, "
+              f"{'CONCURRENCY=' + str(concurrency) if engine == 'async' else 'WORKERS=' + str(workers)})")
 
+        jobs = []
         for row in rows:
             total += 1
-            place_id = (row.get("place_id") or "").strip()
-            store_name = (row.get("store_name") or row.get("name") or "").strip()
-            cuisine_raw = (row.get("cuisine") or "").strip()
-            cuisine_tokens = mpp.parse_cuisine_tokens([cuisine_raw]) if cuisine_raw else []
+            place_id, store_name, cuisine_raw = _job_of(row)
 
             if not place_id or not store_name:
                 fail += 1
-                writer.writerow({
-                    "place_id": place_id, "store_name": store_name,
-                    "cuisine_raw": cuisine_raw, "json_path": "",
-                    "status": "FAIL", "error": "place_id/store_name 누락", "mode_used": ""
-                })
+                writer.writerow(_summary_row(place_id, store_name, cuisine_raw, status="FAIL",
+                                             error="place_id/store_name 누락"))
                 print(f"[SKIP] 잘못된 행: {row}")
                 continue
 
+            if place_id in done:
+                resumed += 1            # 재개: 이전 세션에서 이미 처리됨 (집계에도 넣지 않음)
+                continue
+
             out_path = OUTPUT_DIR / f"{place_id}_tags.json"
-            if SKIP_IF_EXISTS and out_path.exists():
+            if SKIP_IF_EXISTS and not REFRESH_CHANGED and not schedule and out_path.exists():
                 skip += 1
-                writer.writerow({
-                    "place_id": place_id, "store_name": store_name,
-                    "cuisine_raw": cuisine_raw, "json_path": str(out_path),
-                    "status": "SKIP", "error": "", "mode_used": "exists"
-                })
+                writer.writerow(_summary_row(place_id, store_name, cuisine_raw, json_path=str(out_path),
+                                             status="SKIP", mode_used="exists"))
                 print(f"[SKIP] 이미 존재: {place_id} -> {out_path.name}")
                 continue
 
-            mode_used = MODE
-            try:
-                # 1차: summary (빠름/정확)
-                out_json = mpp.fetch_and_build(
-                    place_id=place_id,
-                    cuisine=cuisine_tokens,
-                    store_name=store_name,
-                    sort=SORT,
-                    max_clicks=MAX_CLICKS,
-                    headless=HEADLESS,
-                    save_csv_also=SAVE_CSV_ALSO,
-                    dedup_within_row=DEDUP_WITHIN_ROW,
-                    mode=MODE,
-                )
-            except Exception as e:
-                # 필요 시 chips로 폴백(느릴 수 있음)
-                if FALLBACK_TO_CHIPS_ON_FAIL and MODE != "chips":
-                    try:
-                        mode_used = "chips"
-                        print(f"[RETRY→chips] {store_name} ({place_id}) - 사유: {type(e).__name__}")
-                        out_json = mpp.fetch_and_build(
-                            place_id=place_id,
-                            cuisine=cuisine_tokens,
-                            store_name=store_name,
-                            sort=SORT,
-                            max_clicks=MAX_CLICKS,
-                            headless=HEADLESS,
-                            save_csv_also=SAVE_CSV_ALSO,
-                            dedup_within_row=DEDUP_WITHIN_ROW,
-                            mode="chips",
-                        )
-                    except Exception as e2:
-                        fail += 1
-                        writer.writerow({
-                            "place_id": place_id, "store_name": store_name,
-                            "cuisine_raw": cuisine_raw, "json_path": "",
-                            "status": "FAIL", "error": f"{type(e2).__name__}: {e2}", "mode_used": "chips"
-                        })
-                        print(f"[FAIL] {store_name} ({place_id}) -> {type(e2).__name__}: {e2}")
-                        time.sleep(random.uniform(*SLEEP_BETWEEN_SEC))
-                        continue
-                else:
-                    fail += 1
-                    writer.writerow({
-                        "place_id": place_id, "store_name": store_name,
-                        "cuisine_raw": cuisine_raw, "json_path": "",
-                        "status": "FAIL", "error": f"{type(e).__name__}: {e}", "mode_used": mode_used
-                    })
-                    print(f"[FAIL] {store_name} ({place_id}) -> {type(e).__name__}: {e}")
-                    time.sleep(random.uniform(*SLEEP_BETWEEN_SEC))
-                    continue
+            jobs.append((place_id, store_name, cuisine_raw))
 
-            ok += 1
-            writer.writerow({
-                "place_id": place_id, "store_name": store_name,
-                "cuisine_raw": cuisine_raw, "json_path": out_json,
-                "status": "OK", "error": "", "mode_used": mode_used
-            })
-            print(f"[OK] {store_name} ({place_id}) -> {out_json}  [mode={mode_used}]")
+        def record(result: dict):
+            nonlocal ok, fail, skip
+            if result["status"] == "OK":
+                ok += 1
+            elif result["status"] == "SKIP":
+                skip += 1
+            else:
+                fail += 1
+            writer.writerow(result)
+            sf.flush()
+            if db is not None and result["mode_used"] != "budget":     # 예산 초과로 안 돈 가게는 시도가 아님
+                db.record(result, run_id=run_id)
 
-            time.sleep(random.uniform(*SLEEP_BETWEEN_SEC))
+        if engine == "async":
+            # 이벤트 루프 1개가 페이지 여러 개를 동시에 진행 (호스트 간격은 단일 프로세스 리미터로)
+            import async_engine
+            mpp.RATE_LIMITER = HostRateLimiter(RATE_LIMIT_SEC)
+            CONTROLLER = _make_controller(concurrency)
+            asyncio.run(async_engine.run_jobs(jobs, crawl_guarded_async, concurrency=concurrency,
+                                              headless=HEADLESS, on_result=record))
+        elif workers <= 1:
+            CONTROLLER = _make_controller(1)
+            with DriverPool(_make_pool_driver,
+                            size=POOL_SIZE, max_pages=POOL_MAX_PAGES) as pool:
+                for i, job in enumerate(jobs):
+                    if DEADLINE is not None and time.time() >= DEADLINE:
+                        print(f"[BUDGET] 시간 예산 소진 → 남은 {len(jobs) - i}곳은 다음 실행으로")
+                        break
+                    record(crawl_guarded(*job, pool=pool))
+                    time.sleep(random.uniform(*SLEEP_BETWEEN_SEC))
+        else:
+            # 작은 샤드 단위로 나눠 주면 느린 가게가 한 워커에 몰려도 나머지가 놀지 않음
+            ctx = mp.get_context()
+            limiter = HostRateLimiter(RATE_LIMIT_SEC, ctx=ctx)
+            controller = _make_controller(workers, ctx=ctx)
+            chunksize = max(1, min(8, len(jobs) // (workers * 4)))
+            procs = ctx.Pool(processes=workers, initializer=_worker_init,
+                             initargs=(limiter, REFRESH_CHANGED, DEADLINE, controller))
+            try:
+                for result in procs.imap_unordered(_worker_task, jobs, chunksize=chunksize):
+                    record(result)
+                procs.close()
+            except BaseException:
+                procs.terminate()
+                raise
+            finally:
+                procs.join()
 
+    mpp.save_run_state()
+    if db is not None:
+        db.finish_run(run_id, total=total - resumed, ok=ok, fail=fail, skip=skip)
+        db.close()
     print("-" * 60)
     print(f"Done. 총 {total} / 성공 {ok} / 실패 {fail} / 건너뜀 {skip}")
     print(f"요약 CSV: {summary_csv.resolve()}")
     return 0 if fail == 0 else 1
 
 
+# -----------------------------
+# 작업 큐 (여러 호스트)
+# -----------------------------
+def enqueue(start: int | None = None, end: int | None = None, schedule: bool = False, limit: int | None = None,
+            recommended_path: str | None = None, queue_path: str | Path = QUEUE_PATH) -> int:
+    """place_list 범위를 큐에 넣음 (schedule 이면 재크롤 가치 순 priority, 아니면 목록 순)"""
+    if not PLACE_LIST_PATH.exists():
+        print(f"[ERR] CSV 없음: {PLACE_LIST_PATH.resolve()}")
+        return 2
+    rows = _read_place_rows(start, end)
+    if schedule:
+        with CrawlDB(DB_PATH) as db:
+            if recommended_path:
+                db.mark_recommended(recrawl_scheduler.load_recommended(recommended_path))
+            picked = [(c["row"], c["score"]) for c in recrawl_scheduler.plan(rows, db, limit=limit, profile_dir=OUTPUT_DIR)]
+    else:
+        picked = [(row, -i) for i, row in enumerate(rows)]
+    jobs = []
+    for row, prio in picked:
+        place_id, store_name, cuisine_raw = _job_of(row)
+        if not place_id or not store_name:
+            continue
+        if SKIP_IF_EXISTS and not REFRESH_CHANGED and not schedule and (OUTPUT_DIR / f"{place_id}_tags.json").exists():
+            continue
+        jobs.append((place_id, {"place_id": place_id, "store_name": store_name, "cuisine_raw": cuisine_raw}, prio))
+    with open_queue(queue_path) as q:
+        added = q.enqueue(jobs, replace=schedule or REFRESH_CHANGED)   # 재크롤 목적이면 끝난 작업도 다시
+        print(f"[QUEUE] {added}/{len(jobs)}개 추가 -> {queue_path}  {q.stats()}")
+    return 0
+
+
+def _read_json(path) -> dict | None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def _queue_loop(queue_path: str | Path, pool=None) -> int:
+    """큐가 빌 때까지: 1곳 빌림 → crawl_guarded → 결과(요약 행 + 프로필 JSON 본문) 올림"""
+    me = work_queue.worker_name()
+    n = 0
+    with open_queue(queue_path, lease_sec=QUEUE_LEASE_SEC) as q, \
+            work_queue.Heartbeat(queue_path, me, QUEUE_LEASE_SEC) as hb:
+        while True:
+            leased = q.lease(me, n=1)
+            if not leased:
+                if q.pending() == 0:
+                    break
+                time.sleep(QUEUE_POLL_SEC)          # 남은 건 다른 워커가 처리 중 (리스 만료되면 여기로 옴)
+                continue
+            job = leased[0]
+            p = job["payload"]
+            hb.add(job["job_id"])
+            try:
+                row = crawl_guarded(p["place_id"], p["store_name"], p["cuisine_raw"], pool=pool)
+            except Exception as e:
+                row = _summary_row(p["place_id"], p["store_name"], p["cuisine_raw"], status="FAIL",
+                                   error=f"{type(e).__name__}: {e}")
+            result = {**row, "host": me,
+                      "profile": _read_json(row["json_path"]) if row["status"] != "FAIL" and row["json_path"] else None}
+            if job["job_id"] in hb.lost or not q.complete(me, job["job_id"], result, ok=row["status"] != "FAIL",
+                                                        error=row["error"]):
+                print(f"[QUEUE] 리스 만료로 결과 버림: {job['job_id']} (다른 워커가 다시 처리)")
+            hb.discard(job["job_id"])
+            n += 1
+            time.sleep(random.uniform(*SLEEP_BETWEEN_SEC))
+    return n
+
+
+def _queue_proc(queue_path: str, limiter: HostRateLimiter, refresh_changed: bool, controller):
+    _worker_init(limiter, refresh_changed, None, controller)
+    n = _queue_loop(queue_path, pool=_WORKER_POOL)
+    print(f"[QUEUE] {work_queue.worker_name()} 종료: {n}곳 처리")
+
+
+def work(workers: int = 1, queue_path: str | Path = QUEUE_PATH) -> int:
+    """이 호스트에서 워커 N개로 큐를 비움 (각 프로세스가 Chrome 1개 + 자기 하트비트)"""
+    global CONTROLLER
+    if workers <= 1:
+        CONTROLLER = _make_controller(1)
+        with DriverPool(_make_pool_driver, size=POOL_SIZE, max_pages=POOL_MAX_PAGES) as pool:
+            n = _queue_loop(queue_path, pool=pool)
+        print(f"[QUEUE] {n}곳 처리")
+    else:
+        ctx = mp.get_context()
+        limiter = HostRateLimiter(RATE_LIMIT_SEC, ctx=ctx)
+        controller = _make_controller(workers, ctx=ctx)
+        procs = [ctx.Process(target=_queue_proc, args=(str(queue_path), limiter, REFRESH_CHANGED, controller))
+                 for _ in range(workers)]
+        for pr in procs:
+            pr.start()
+        try:
+            for pr in procs:
+                pr.join()
+        except BaseException:
+            for pr in procs:
+                pr.terminate()
+            raise
+    mpp.save_run_state()
+    return 0
+
+
+def collect(queue_path: str | Path = QUEUE_PATH) -> int:
+    """끝난 작업 결과 → OUTPUT_DIR 프로필 JSON + 상태 DB (이미 가져간 건 건너뜀)"""
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    db = CrawlDB(DB_PATH) if USE_DB else None
+    ok = fail = 0
+    with open_queue(queue_path) as q:
+        results = q.results(only_new=True)
+        for r in results:
+            row = r["result"] or _summary_row(r["job_id"], "", "", status="FAIL", error=r["error"] or "")
+            prof = row.pop("profile", None)
+            row.pop("host", None)
+            if prof:
+                row["json_path"] = mpp.save_store_tag_json(prof["place_id"], prof.get("cuisine"), prof.get("store_name", ""),
+                                                           prof.get("tag_counts") or {}, out_dir=str(OUTPUT_DIR),
+                                                           meta=prof.get("meta"))
+            if db is not None:
+                db.record(row)
+            ok += row["status"] != "FAIL"
+            fail += row["status"] == "FAIL"
+        q.mark_collected(r["job_id"] for r in results)
+        print(f"[QUEUE] 결과 {len(results)}개 반영 (성공/건너뜀 {ok}, 실패 {fail}), 큐 상태 {q.stats()}")
+    if db is not None:
+        db.close()
+    return 0
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="place_list.csv → places_json 일괄 생성")
+    ap.add_argument("--start", type=int, default=None, help="처리 시작 행(0부터)")
+    ap.add_argument("--end", type=int, default=None, help="처리 끝 행(미포함)")
+    ap.add_argument("--workers", type=int, default=1, help="병렬 워커 수 (워커마다 Chrome 1개)")
+    ap.add_argument("--engine", choices=["selenium", "async"], default="selenium",
+                    help="async = Playwright asyncio 엔진 (pip install playwright 필요)")
+    ap.add_argument("--concurrency", type=int, default=ASYNC_CONCURRENCY, help="(async) 동시 페이지 수")
+    ap.add_argument("--refresh_changed", action="store_true",
+                    help="기존 JSON도 변경 감지 프로브 후 바뀐 가게만 재크롤 (REFRESH_CHANGED)")
+    ap.add_argument("--resume", action="store_true",
+                    help="중단된 직전 실행을 같은 범위로 이어서 (상태 DB 에서 끝난 가게는 제외)")
+    ap.add_argument("--schedule", action="store_true",
+                    help="재크롤 가치(경과 시간·리뷰 증가 속도·실패 백오프·추천 여부) 높은 순으로 골라서 크롤")
+    ap.add_argument("--limit", type=int, default=None, help="(schedule) 최대 가게 수")
+    ap.add_argument("--budget_min", type=float, default=None, help="(schedule) 시간 예산(분)")
+    ap.add_argument("--recommended", default=None, help="(schedule) 추천된 가게 place_id 목록 파일")
+    qg = ap.add_mutually_exclusive_group()
+    qg.add_argument("--enqueue", action="store_true", help="작업 큐에 넣기만 (여러 호스트 분산, work_queue.py)")
+    qg.add_argument("--work", action="store_true", help="작업 큐에서 빌려서 크롤 (--workers 개 프로세스)")
+    qg.add_argument("--collect", action="store_true", help="작업 큐의 결과를 places_json/상태 DB 로 가져오기")
+    ap.add_argument("--queue", default=str(QUEUE_PATH), help="작업 큐: SQLite 파일(한 머신) 또는 redis://host:port/db (여러 머신)")
+    args = ap.parse_args(argv)
+    if args.refresh_changed:
+        global REFRESH_CHANGED
+        REFRESH_CHANGED = True
+    if args.enqueue:
+        return enqueue(args.start, args.end, schedule=args.schedule, limit=args.limit,
+                       recommended_path=args.recommended, queue_path=args.queue)
+    if args.work:
+        return work(workers=args.workers, queue_path=args.queue)
+    if args.collect:
+        return collect(queue_path=args.queue)
+    return run(args.start, args.end, workers=args.workers, engine=args.engine, concurrency=args.concurrency,
+               resume=args.resume, schedule=args.schedule, limit=args.limit, budget_min=args.budget_min,
+               recommended_path=args.recommended)
+
+
 if __name__ == "__main__":
     print(">>> create_profiles_final: START")
-    rc = run()
-    sys.exit(rc)
+    sys.exit(main())
@@ -0,0 +1,153 @@
+# driver_cache.py — chromedriver 경로 캐시 + 드라이버 기동 타이머
+# ChromeDriverManager().install() 은 호출마다 버전 확인/파일시스템/메타데이터 작업을 한다.
+#  - 프로세스 안에서는 한 번만 해석하고(메모리 캐시),
+#  - 실행 간에는 Chrome 버전별 매니페스트(JSON)에 경로를 남겨 재사용한다.
+#    (Chrome 이 업데이트되면 버전 키가 바뀌므로 자동으로 다시 해석)
+# StartupTimer 로 드라이버 생성 시간을 resolve / launch / first_nav 로 나눠 기록한다.
+from __future__ import annotations
+import os, re, sys, json, time, shutil, subprocess
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict
+
+CACHE_DIR = Path(os.environ.get("CHROMEDRIVER_CACHE_DIR") or Path.home() / ".cache" / "store_recommendation")
+MANIFEST_PATH = CACHE_DIR / "chromedriver_manifest.json"
+
+_RESOLVED: Dict[str, str] = {}          # Chrome 버전 -> chromedriver 경로 (프로세스 캐시)
+_CHROME_VERSION: list = []              # 한 번만 감지 ([] = 아직 안 함)
+
+_VERSION_RE = re.compile(r"(\d+\.\d+\.\d+\.\d+)")
+_LINUX_MAC_BINARIES = [
+    "google-chrome", "google-chrome-stable", "chromium", "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+_WINDOWS_BINARIES = [
+    os.path.expandvars(r"%ProgramFiles%\Google\Chrome\Application\chrome.exe"),
+    os.path.expandvars(r"%ProgramFiles(x86)%\Google\Chrome\Application\chrome.exe"),
+    os.path.expandvars(r"%LocalAppData%\Google\Chrome\Application\chrome.exe"),
+]
+
+
+def find_chrome_binary() -> str | None:
+    """설치된 Chrome 실행 파일 경로 (없으면 None)"""
+    cands = _WINDOWS_BINARIES if sys.platform.startswith("win") else _LINUX_MAC_BINARIES
+    for b in cands:
+        exe = b if os.path.isabs(b) else shutil.which(b)
+        if exe and os.path.exists(exe):
+            return exe
+    return None
+
+
+# -----------------------------
+# Chrome 버전 감지
+# -----------------------------
+def _detect_windows() -> str | None:
+    try:
+        import winreg
+    except ImportError:
+        return None
+    for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+        try:
+            with winreg.OpenKey(hive, r"Software\Google\Chrome\BLBeacon") as k:
+                return winreg.QueryValueEx(k, "version")[0]
+        except OSError:
+            continue
+    return None
+
+
+def _detect_posix() -> str | None:
+    exe = find_chrome_binary()
+    if not exe:
+        return None
+    try:
+        out = subprocess.run([exe, "--version"], capture_output=True, text=True, timeout=5).stdout
+    except Exception:
+        return None
+    m = _VERSION_RE.search(out or "")
+    return m.group(1) if m else None
+
+
+def detect_chrome_version() -> str | None:
+    if not _CHROME_VERSION:
+        _CHROME_VERSION.append(_detect_windows() if sys.platform.startswith("win") else _detect_posix())
+    return _CHROME_VERSION[0]
+
+
+# -----------------------------
+# 매니페스트
+# -----------------------------
+def _load_manifest() -> dict:
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def _save_manifest(doc: dict):
+    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = MANIFEST_PATH.with_name(f".{MANIFEST_PATH.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(doc, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, MANIFEST_PATH)       # 병렬 워커가 동시에 써도 깨진 JSON이 남지 않음
+
+
+def resolve_driver_path() -> str:
+    """Chrome 버전에 맞는 chromedriver 경로 (프로세스 캐시 → 매니페스트 → ChromeDriverManager 순)"""
+    version = detect_chrome_version() or "unknown"
+    path = _RESOLVED.get(version)
+    if path:
+        return path
+
+    if version != "unknown":
+        entry = _load_manifest().get(version) or {}
+        path = entry.get("path")
+        if path and os.path.exists(path):
+            _RESOLVED[version] = path
+            return path
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    path = ChromeDriverManager().install()
+    _RESOLVED[version] = path
+    if version != "unknown":                # 버전을 모르면 키를 못 잡으니 프로세스 캐시만
+        doc = _load_manifest()
+        doc[version] = {"path": path, "resolved_at": time.strftime("%Y-%m-%d %H:%M:%S")}
+        _save_manifest(doc)
+    return path
+
+
+# -----------------------------
+# 기동 타이머
+# -----------------------------
+class StartupTimer:
+    PHASES = ("resolve", "launch", "first_nav")
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - t0
+
+    @property
+    def done(self) -> bool:
+        return all(p in self.phases for p in self.PHASES)
+
+    def report(self) -> str:
+        parts = [f"{p}={self.phases[p]:.2f}s" for p in self.PHASES if p in self.phases]
+        return f"[STARTUP] {' '.join(parts)} (total {sum(self.phases.values()):.2f}s)"
+
+
+def timed_get(driver, url: str):
+    """driver.get — 드라이버의 첫 이동이면 first_nav 로 재고 기동 시간 요약을 출력"""
+    timer = getattr(driver, "startup_timer", None)
+    if timer is None or "first_nav" in timer.phases:
+        driver.get(url)
+        return
+    with timer.phase("first_nav"):
+        driver.get(url)
+    print(timer.report())
@@ -0,0 +1,160 @@
+# driver_pool.py — 배치용 Chrome 드라이버 풀
+# 가게마다 Chrome을 새로 띄우지 않고, 몇 개의 드라이버를 빌려 쓰고(checkout) 반납(checkin)한다.
+#  - 반납 시 헬스체크 → 죽은 세션은 버리고 다음 체크아웃 때 새로 띄움
+#  - max_pages 만큼 쓰면 재활용(quit 후 새로 생성) → 장시간 배치에서 메모리 누수 방지
+#
+# 사용 예)
+#   pool = DriverPool(lambda: mpp.make_driver(headless=True), size=1, max_pages=40)
+#   with pool.borrow() as driver:
+#       driver.get(url)
+#   pool.close()
+from __future__ import annotations
+import queue, threading, time
+from contextlib import contextmanager
+from typing import Callable, Dict
+
+
+class DriverPool:
+    def __init__(self, factory: Callable[[], object], size: int = 1, max_pages: int = 40,
+                 checkout_timeout: float = 300.0, on_return: Callable[[object], None] | None = None):
+        self.factory = factory
+        self.size = max(int(size), 1)
+        self.max_pages = max(int(max_pages), 1)
+        self.checkout_timeout = checkout_timeout
+        self.on_return = on_return                  # 반납 시 상태 초기화 훅(프레임/에뮬레이션 등)
+        self._idle: "queue.LifoQueue" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._pages: Dict[int, int] = {}           # id(driver) -> 사용 횟수
+        self._closed = False
+        self.stats = {"launched": 0, "recycled": 0, "crashed": 0, "checkouts": 0}
+
+    # -----------------------------
+    # 내부 유틸
+    # -----------------------------
+    def _launch(self):
+        t0 = time.time()
+        driver = self.factory()
+        self._pages[id(driver)] = 0
+        self.stats["launched"] += 1
+        print(f"[POOL] Chrome 기동 ({time.time() - t0:.1f}s, 누적 {self.stats['launched']}회)")
+        return driver
+
+    def _discard(self, driver):
+        self._pages.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self._lock:
+            self._created -= 1
+
+    @staticmethod
+    def healthy(driver) -> bool:
+        """세션이 살아있는지 가볍게 확인 (크래시/창 닫힘 감지)"""
+        try:
+            return bool(driver.window_handles) and driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _reset(self, driver):
+        # 프레임 진입(summary 모드) 상태로 돌려주면 다음 가게에서 find가 꼬임
+        driver.switch_to.default_content()
+        handles = driver.window_handles
+        for h in handles[1:]:
+            driver.switch_to.window(h)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        if self.on_return:
+            self.on_return(driver)
+
+    # -----------------------------
+    # 체크아웃/반납
+    # -----------------------------
+    def checkout(self):
+        if self._closed:
+            raise RuntimeError("이미 닫힌 DriverPool 입니다.")
+        deadline = time.time() + self.checkout_timeout
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = None
+                with self._lock:
+                    can_launch = self._created < self.size
+                    if can_launch:
+                        self._created += 1
+                if can_launch:
+                    try:
+                        driver = self._launch()
+                    except Exception:
+                        with self._lock:
+                            self._created -= 1
+                        raise
+                else:
+                    remain = deadline - time.time()
+                    if remain <= 0:
+                        raise TimeoutError("사용 가능한 드라이버가 없어요 (checkout timeout).")
+                    try:
+                        driver = self._idle.get(timeout=remain)
+                    except queue.Empty:
+                        continue
+
+            if self.healthy(driver):
+                self.stats["checkouts"] += 1
+                return driver
+            self.stats["crashed"] += 1
+            self._discard(driver)
+
+    def checkin(self, driver, broken: bool = False):
+        n = self._pages.get(id(driver), 0) + 1
+        self._pages[id(driver)] = n
+
+        if self._closed:
+            self._discard(driver)
+            return
+        if broken or not self.healthy(driver):
+            self.stats["crashed"] += 1
+            self._discard(driver)
+            return
+        if n >= self.max_pages:
+            self.stats["recycled"] += 1
+            self._discard(driver)
+            return
+        try:
+            self._reset(driver)
+        except Exception:
+            self.stats["crashed"] += 1
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    @contextmanager
+    def borrow(self):
+        """with pool.borrow() as driver: ...  (예외 시 세션이 죽었으면 폐기)"""
+        driver = self.checkout()
+        broken = False
+        try:
+            yield driver
+        except BaseException:
+            broken = not self.healthy(driver)
+            raise
+        finally:
+            self.checkin(driver, broken=broken)
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+        print(f"[POOL] 종료: 기동 {self.stats['launched']} / 재활용 {self.stats['recycled']} "
+              f"/ 크래시 {self.stats['crashed']} / 체크아웃 {self.stats['checkouts']}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,269 @@
+# http_fetcher.py — 브라우저 없이 HTTP 만으로 태그 집계 (summary/chips 와 같은 인터페이스)
+#---호출법---#
+# python http_fetcher.py --place_id 31751923 --store_name "신통치킨 단국대점" --cuisine 치킨
+# python http_fetcher.py --place_id 31751923 --store_name "신통치킨 단국대점" --record fixtures/http   # 응답 녹화
+# python http_fetcher.py --place_id 31751923 --store_name "신통치킨 단국대점" --replay fixtures/http   # 오프라인 재생
+#
+# 태그 수만 갱신하면 되는 가게에 Chrome 을 통째로 띄울 필요는 없다.
+# m.place 리뷰 페이지 HTML 에 SSR 로 박혀 오는 window.__APOLLO_STATE__ 에서
+#  - summary : '이런 점이 좋았어요' 키워드 통계(votedKeyword details → displayName/count)
+#  - chips   : 첫 페이지 리뷰의 votedKeywords (전체 리뷰 수보다 적으면 HttpIncomplete → 브라우저로 폴백)
+# 를 꺼낸다. 전송은 Transport 로 분리 — RequestsTransport(keep-alive/gzip 세션 풀) / RecordedTransport(녹화 재생).
+from __future__ import annotations
+import os, re, json, hashlib, argparse
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import make_place_profile as mpp
+from browser_profile import MOBILE_UA
+from review_capture import parse_apollo_state
+from throttle import Throttled, looks_blocked
+
+_STATE_RE = re.compile(r"window\.__APOLLO_STATE__\s*=\s*")
+
+DEFAULT_HEADERS = {
+    "User-Agent": MOBILE_UA,
+    "Accept": "text/html,application/xhtml+xml,application/json;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+    "Accept-Encoding": "gzip, deflate",
+    "Referer": "https://m.place.naver.com/",
+}
+
+
+class HttpError(RuntimeError):
+    pass
+
+
+class HttpIncomplete(RuntimeError):
+    """HTTP 로 받은 데이터가 전체가 아님 (브라우저 크롤로 넘겨야 함)"""
+
+
+# -----------------------------
+# Transport
+# -----------------------------
+class RequestsTransport:
+    """requests.Session 하나를 프로세스 안에서 재사용 (keep-alive, gzip, 커넥션 풀)"""
+    live = True
+
+    def __init__(self, pool_size: int = 8, timeout: float = 10.0, headers: Dict[str, str] | None = None):
+        import requests
+        from requests.adapters import HTTPAdapter
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=1)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+
+    def get(self, url: str) -> Tuple[int, str]:
+        r = self.session.get(url, timeout=self.timeout)
+        r.encoding = r.encoding or "utf-8"
+        return r.status_code, r.text
+
+    def close(self):
+        self.session.close()
+
+
+def _fixture_name(url: str) -> str:
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()[:16] + ".json"
+
+
+class RecordedTransport:
+    """
+    fixture_dir 의 녹화 응답을 재생 (오프라인 테스트용).
+    inner 를 주면 녹화 모드: 실제로 요청하고 응답을 fixture_dir 에 저장
+    """
+
+    def __init__(self, fixture_dir: str, inner=None):
+        self.dir = Path(fixture_dir)
+        self.inner = inner
+        self.live = bool(inner is not None and getattr(inner, "live", False))
+
+    def get(self, url: str) -> Tuple[int, str]:
+        path = self.dir / _fixture_name(url)
+        if self.inner is None:
+            if not path.exists():
+                raise HttpError(f"녹화된 응답 없음: {url}")
+            with open(path, encoding="utf-8") as f:
+                doc = json.load(f)
+            return int(doc["status"]), doc["text"]
+        status, text = self.inner.get(url)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"url": url, "status": status, "text": text}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+        return status, text
+
+    def close(self):
+        if self.inner is not None:
+            self.inner.close()
+
+
+_DEFAULT_TRANSPORT = None
+
+
+def default_transport():
+    """프로세스당 세션 1개 (배치에서 가게 간 keep-alive 재사용)"""
+    global _DEFAULT_TRANSPORT
+    if _DEFAULT_TRANSPORT is None:
+        _DEFAULT_TRANSPORT = RequestsTransport()
+    return _DEFAULT_TRANSPORT
+
+
+def _get(transport, url: str) -> str:
+    if getattr(transport, "live", False) and mpp.RATE_LIMITER is not None:
+        mpp.RATE_LIMITER.wait(url)
+    status, text = transport.get(url)
+    if status in (403, 429):                # 차단/과다 요청 → 브라우저로 넘기지 말고 컨트롤러가 속도를 줄이게
+        raise Throttled(f"HTTP {status}: {url}")
+    if status != 200:
+        raise HttpError(f"HTTP {status}: {url}")
+    return text
+
+
+# -----------------------------
+# SSR 상태 파싱
+# -----------------------------
+def extract_apollo_state(html: str) -> Dict[str, Any] | None:
+    m = _STATE_RE.search(html or "")
+    if not m:
+        return None
+    try:
+        state, _ = json.JSONDecoder().raw_decode(html, m.end())
+    except ValueError:
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def _walk_dicts(node):
+    if isinstance(node, dict):
+        yield node
+        for v in node.values():
+            yield from _walk_dicts(v)
+    elif isinstance(node, list):
+        for v in node:
+            yield from _walk_dicts(v)
+
+
+def summary_counts_from_state(state: Dict[str, Any]) -> Dict[str, int]:
+    """votedKeyword.details[{displayName, count}] → {라벨: 수}"""
+    counts: Dict[str, int] = {}
+    for d in _walk_dicts(state):
+        vk = d.get("votedKeyword")
+        if not isinstance(vk, dict):
+            continue
+        for item in vk.get("details") or []:
+            if not isinstance(item, dict):
+                continue
+            label, n = item.get("displayName"), item.get("count")
+            if isinstance(label, str) and label.strip() and isinstance(n, int):
+                counts[label.strip()] = n
+    return counts
+
+
+def review_total_from_state(state: Dict[str, Any]) -> int | None:
+    """방문자 리뷰 전체 수 (visitorReviews 결과의 total) — 못 찾으면 None"""
+    best = None
+    for key, obj in state.items():
+        if not isinstance(obj, dict) or not key.startswith("ROOT_QUERY"):
+            continue
+        for k, v in obj.items():
+            if k.startswith("visitorReviews") and isinstance(v, dict) and isinstance(v.get("total"), int):
+                best = max(best or 0, v["total"])
+    return best
+
+
+# -----------------------------
+# fetch_summary / fetch_chips 와 같은 인터페이스
+# -----------------------------
+def load_state(place_id: str, sort: str = "recent", transport=None) -> Tuple[Dict[str, Any], str]:
+    """리뷰 페이지 HTML 1회 GET → (__APOLLO_STATE__, html). 스코프는 메모 순서대로 시도"""
+    transport = transport or default_transport()
+    last_err = None
+    for url in mpp.SCOPE_MEMO.order(place_id, mpp.build_review_urls(place_id, sort=sort)):
+        try:
+            html = _get(transport, url)
+        except Exception as e:
+            last_err = e
+            continue
+        state = extract_apollo_state(html)
+        if state:
+            mpp.SCOPE_MEMO.record(place_id, url)
+            return state, html
+        if looks_blocked(html):
+            raise Throttled(f"차단/캡차 페이지: {url}")
+        last_err = HttpError(f"__APOLLO_STATE__ 없음: {url}")
+    raise last_err or HttpError("리뷰 페이지를 받지 못했어요.")
+
+
+def fetch_summary_http(place_id: str, cuisine: list[str], store_name: str,
+                       sort: str = "recent", transport=None) -> str:
+    state, _ = load_state(place_id, sort, transport or default_transport())
+    tag_counts = summary_counts_from_state(state)
+    if not tag_counts:
+        raise RuntimeError("요약 키워드 통계를 찾지 못했어요.")
+    total = review_total_from_state(state)
+    out_json = mpp.save_store_tag_json(place_id, cuisine, store_name, tag_counts,
+                                       meta={"review_total": total} if total is not None else None)
+    print(f"[OK/SUMMARY/HTTP] {store_name} ({place_id}) -> {out_json}  ({len(tag_counts)} tags)")
+    return out_json
+
+
+def fetch_chips_http(place_id: str, cuisine: list[str], store_name: str,
+                     sort: str = "recent", dedup_within_row: bool = True, transport=None) -> str:
+    state, _ = load_state(place_id, sort, transport or default_transport())
+    records = parse_apollo_state(state)
+    total = review_total_from_state(state)
+    if not records:
+        raise RuntimeError("리뷰/태그를 찾지 못했어요.")
+    if total is None or total > len(records):
+        # SSR 첫 페이지만으로는 전수 집계가 안 됨 → 브라우저 '더보기' 크롤로
+        raise HttpIncomplete(f"리뷰 {len(records)}/{total if total is not None else '?'}건만 수신")
+    rows = [{"place_id": str(place_id), "cuisine": cuisine or [], "store_name": store_name,
+             "option_tags": r["tags"]} for r in records if r["tags"]]
+    counts = mpp.count_tags(rows, dedup_within_row=dedup_within_row)
+    out_json = mpp.save_store_tag_json(place_id, cuisine, store_name, counts, meta={"review_total": total})
+    print(f"[OK/CHIPS/HTTP] {store_name} ({place_id}) -> {out_json}  ({len(records)} reviews, {len(counts)} tags)")
+    return out_json
+
+
+def fetch_and_build(place_id: str, cuisine: list[str], store_name: str,
+                    sort: str = "recent", dedup_within_row: bool = True,
+                    mode: str | None = None, transport=None, **_) -> str:
+    """make_place_profile.fetch_and_build 와 같은 인자 (브라우저 전용 인자는 무시)"""
+    mode = (mode or mpp.DEFAULT_MODE).lower()
+    if mode == "summary":
+        return fetch_summary_http(place_id, cuisine, store_name, sort=sort, transport=transport)
+    return fetch_chips_http(place_id, cuisine, store_name, sort=sort, dedup_within_row=dedup_within_row,
+                            transport=transport)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="HTTP-only tag_counts.json (browserless)")
+    ap.add_argument("--place_id", required=True)
+    ap.add_argument("--store_name", required=True)
+    ap.add_argument("--cuisine", nargs="+")
+    ap.add_argument("--mode", choices=["summary", "chips"], default=mpp.DEFAULT_MODE)
+    ap.add_argument("--sort", default="recent")
+    g = ap.add_mutually_exclusive_group()
+    g.add_argument("--record", default=None, help="응답을 이 폴더에 녹화")
+    g.add_argument("--replay", default=None, help="이 폴더의 녹화 응답으로 오프라인 실행")
+    args = ap.parse_args(argv)
+
+    if args.replay:
+        transport = RecordedTransport(args.replay)
+    elif args.record:
+        transport = RecordedTransport(args.record, inner=RequestsTransport())
+    else:
+        transport = default_transport()
+    try:
+        print(fetch_and_build(args.place_id, mpp.parse_cuisine_tokens(args.cuisine), args.store_name,
+                              sort=args.sort, mode=args.mode, transport=transport))
+    finally:
+        transport.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,55 +1,130 @@
 #---호출법---#
 #python make_place_profile.py --place_id 31751923 --store_name "신통치킨 단국대점" --cuisine "치킨","닭강정" --mode summary#
+#--mode network : 리뷰 API 응답(JSON)을 직접 캡처해서 집계 (DOM 셀렉터 안 씀, review_capture.py)#
 #단일 코드이기 때문에 place_id/store_name/cuisine을 넣어줘야함#
+#cron 등으로 여러 번 돌릴 땐 먼저 `python chrome_daemon.py start --headless` → 매번 Chrome을 새로 띄우지 않고 탭만 열고 닫음#
 
 # make_place_profile.py — Naver Place 태그 수집 (FAST: 요약 패널 기본)
 from __future__ import annotations
-import time, csv, json, argparse, datetime as dt, re
+import os, time, csv, json, argparse, datetime as dt, re
 from pathlib import Path
 from typing import List, Dict, Any
 from collections import Counter
+from contextlib import contextmanager
 
 # --- Selenium ---
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import StaleElementReferenceException, NoSuchElementException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+
+from page_waits import item_count, wait_for_growth, wait_until_quiet
+from browser_profile import make_chrome, emulate_mobile, clear_emulation
+from driver_cache import timed_get
+from chrome_daemon import acquire_driver
+from selector_registry import SelectorRegistry, zero_implicit_wait
+from page_scripts import extract_reviews, click_plus_chips, PROBE_JS
+import review_capture
+from scope_memo import ScopeMemo
+from tag_sampling import TagSampler
+from throttle import Throttled, looks_blocked
+from review_store import review_key
 
 # =========================================================
 # 설정
 DEFAULT_MODE = "summary"     # "summary" = 요약 패널(빠름/정확), "chips" = 모바일 리뷰칩 전수(느리지만 상세)
+                             # "network" = chips 와 같은 데이터를 리뷰 API 응답에서 직접 (performance 로그 필요)
+RATE_LIMITER = None          # 병렬 배치에서 워커가 HostRateLimiter를 꽂아 넣음 (None이면 제한 없음)
+USE_DAEMON = False           # 단건 CLI: 상주 Chrome(chrome_daemon.py)이 있으면 새 탭으로 붙기 (main()에서 켬)
+SCOPE_MEMO = ScopeMemo()     # place_id → 통했던 URL 스코프(restaurant/place)/모드 (outputs/scope_memo.json)
+
+# chips 샘플링 모드 (--sample): 태그 비율이 수렴하거나 목표 리뷰 수에 닿으면 '더보기' 중단 (tag_sampling.py)
+SAMPLE_TOL = 0.01            # 클릭 간 태그 비율 변화(최대 절대값)가 이 값 미만이면 '안정'
+SAMPLE_PATIENCE = 3          # '안정'이 연속 몇 번이면 수렴으로 볼지
+SAMPLE_MIN_REVIEWS = 30      # 이보다 적게 모였으면 수렴 판정 안 함
+SAMPLE_TARGET_REVIEWS = None # 리뷰 수 상한 (None = 수렴으로만 멈춤)
+
+# 셀렉터 후보 — 최근 적중률 순으로 implicit wait 없이 조회 (없는 XPATH에서 8초씩 블록되지 않게)
+SELECTOR_STATS_DIR = Path("./outputs/selector_stats")
+MORE_BUTTON = SelectorRegistry("more_button", [
+    ("xpath", '//*[@id="app-root"]//a[contains(.,"더보기")]', None),
+    ("xpath", '//*[@id="app-root"]//button[contains(.,"더보기")]', None),
+    ("js", "a,button", "더보기"),         # 전수조사 폴백 (페이지 안에서 1회 왕복)
+], stats_path=SELECTOR_STATS_DIR / "more_button.json")
+SUMMARY_EXPAND = SelectorRegistry("summary_expand", [
+    ("xpath", ".//button[contains(.,'더보기')]", None),
+    ("xpath", ".//a[contains(.,'더보기')]", None),
+    ("xpath", ".//button[contains(.,'펼치기')]", None),
+    ("xpath", ".//a[contains(.,'펼치기')]", None),
+    ("xpath", ".//*[@aria-label and (contains(@aria-label,'더보기') or contains(@aria-label,'펼치기'))]", None),
+    ("xpath", ".//*[name()='svg' or name()='path']/ancestor::button", None),   # 아이콘(chevron) 버튼 추정
+], stats_path=SELECTOR_STATS_DIR / "summary_expand.json")
+
+
+def save_selector_stats():
+    for reg in (MORE_BUTTON, SUMMARY_EXPAND):
+        try:
+            reg.save()
+        except Exception:
+            pass
+
+
+def save_run_state():
+    """실행 간에 이어 쓰는 학습 상태 저장 (셀렉터 적중률 + 스코프 메모)"""
+    save_selector_stats()
+    try:
+        SCOPE_MEMO.save()
+    except Exception:
+        pass
 # =========================================================
 
 
 # -----------------------------
 # 공통: 드라이버/유틸
 # -----------------------------
-def make_driver(headless: bool = False) -> webdriver.Chrome:
-    opts = webdriver.ChromeOptions()
-    if headless:
-        opts.add_argument("headless=new")
-    opts.add_argument("window-size=1920,1080")
-    opts.add_argument("disable-gpu")
-    # 속도 ↑ : 이미지/알림 차단, 빠른 로딩전략
-    opts.add_argument("--blink-settings=imagesEnabled=false")
-    opts.add_experimental_option("prefs", {
-        "profile.default_content_setting_values.notifications": 2,
-        "profile.managed_default_content_settings.images": 2,
-    })
-    opts.page_load_strategy = "eager"
-    # 무난한 UA
-    opts.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    )
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=opts)
-    driver.implicitly_wait(8)
-    driver.set_page_load_timeout(20)
-    return driver
+def make_driver(headless: bool = False, lean: bool = True, perf_log: bool = False) -> webdriver.Chrome:
+    # 공용 프로필(browser_profile.py): 데스크톱 창(summary) + 이미지/폰트/미디어/트래커 차단, eager 로딩
+    # chips 모드는 같은 드라이버를 CDP로 모바일 에뮬레이션 전환해서 씀 (driver_session(mobile=True))
+    # perf_log=True : network 모드용 performance 로그 (안 쓰는 모드에선 로그만 쌓이므로 기본 off)
+    return make_chrome(headless=headless, lean=lean, mobile=False, implicit_wait=8, page_load_timeout=20,
+                       perf_log=perf_log)
+
+
+@contextmanager
+def driver_session(headless: bool = False, pool=None, mobile: bool = False, perf_log: bool = False):
+    """
+    pool(DriverPool)이 있으면 빌려 쓰고 반납, 없으면 (상주 데몬 탭 또는) 새로 띄우고 끝나면 정리.
+    mobile=True 면 m.place 용 모바일 뷰포트/UA로 전환 (풀 반납 전 원복)
+    """
+    if pool is not None:
+        with pool.borrow() as driver:
+            if mobile:
+                emulate_mobile(driver)
+            try:
+                yield driver
+            finally:
+                if mobile:
+                    clear_emulation(driver)
+        return
+    # 데몬 탭이면 release = 탭만 닫기, 아니면 quit
+    # performance 로그는 실행 시 capability 라서 데몬 탭으로는 못 켬 → perf_log 면 새로 띄움
+    driver, release = acquire_driver(lambda: make_driver(headless=headless, perf_log=perf_log),
+                                     use_daemon=USE_DAEMON and not perf_log)
+    if mobile:
+        emulate_mobile(driver)
+    try:
+        yield driver
+    finally:
+        release()
+
+
+def open_url(driver: webdriver.Chrome, url: str):
+    """driver.get 래퍼: RATE_LIMITER가 설정돼 있으면 호스트별 간격을 지킨 뒤 이동 (첫 이동은 기동 타이머에 기록)"""
+    if RATE_LIMITER is not None:
+        RATE_LIMITER.wait(url)
+    timed_get(driver, url)
 
 
 def parse_cuisine_tokens(tokens) -> list[str]:
@@ -66,21 +141,82 @@ def parse_cuisine_tokens(tokens) -> list[str]:
 
 
 def save_store_tag_json(place_id: str, cuisine: list[str], store_name: str,
-                        tag_counts: Dict[str, int], out_dir: str = "./outputs/places_json") -> str:
+                        tag_counts: Dict[str, int], out_dir: str = "./outputs/places_json",
+                        meta: Dict[str, Any] | None = None) -> str:
+    """meta: 수집 방식/중단 이유 등 부가 정보 ("meta" 키, crawled_at 은 항상 기록)"""
     Path(out_dir).mkdir(parents=True, exist_ok=True)
-    doc = {"place_id": str(place_id), "cuisine": cuisine or [], "store_name": store_name, "tag_counts": tag_counts}
+    doc = {"place_id": str(place_id), "cuisine": cuisine or [], "store_name": store_name, "tag_counts": tag_counts,
+           "meta": {"crawled_at": dt.datetime.now().isoformat(timespec="seconds"), **(meta or {})}}
     path = Path(out_dir) / f"{place_id}_tags.json"
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(doc, f, ensure_ascii=False, indent=2)
+    _write_json_atomic(path, doc)
     return str(path)
 
 
+def _write_json_atomic(path: Path, doc: dict):
+    # 임시 파일에 쓰고 교체 → 병렬 배치/중단 시에도 반쯤 쓰인 JSON이 남지 않음
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(doc, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+def load_profile_meta(path: str | Path) -> Dict[str, Any]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f).get("meta") or {}
+    except Exception:
+        return {}
+
+
+def stamp_profile(path: str | Path, **meta) -> bool:
+    """저장된 프로필 JSON 의 meta 에 값 추가 (예: 변경 감지 프로브 fingerprint)"""
+    path = Path(path)
+    try:
+        with open(path, encoding="utf-8") as f:
+            doc = json.load(f)
+    except Exception:
+        return False
+    doc["meta"] = {**(doc.get("meta") or {}), **meta}
+    _write_json_atomic(path, doc)
+    return True
+
+
 # =========================================================
 # 모드 A) SUMMARY — 데스크톱 요약 패널(“이런 점이 좋았어요”) 직접 파싱
 # =========================================================
-def goto_desktop_reviews(driver: webdriver.Chrome, place_id: str):
+SUMMARY_DIRECT = True        # entryIframe 이 띄우는 pcmap 문서로 바로 이동 (map.naver.com 지도 셸 생략)
+SUMMARY_TITLE_XPATH = "//*[contains(normalize-space(.),'이런 점이 좋았어요')]"
+
+
+def build_summary_urls(place_id: str) -> List[str]:
+    """map.naver.com 의 iframe#entryIframe 이 실제로 불러오는 장소 상세(리뷰 탭) 문서"""
+    return [f"https://pcmap.place.naver.com/{sc}/{place_id}/review/visitor" for sc in ("restaurant", "place")]
+
+
+def _wait_summary_block(driver, timeout: float):
+    # implicit wait 끄고 명시적 대기만 (implicit 8s 가 폴링마다 겹치지 않게)
+    with zero_implicit_wait(driver):
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.XPATH, SUMMARY_TITLE_XPATH)))
+
+
+def goto_summary_direct(driver: webdriver.Chrome, place_id: str, timeout: float = 8.0) -> str | None:
+    """pcmap 리뷰 문서로 바로 이동해서 요약 블록이 뜨면 성공한 URL, 아니면 None"""
+    for url in SCOPE_MEMO.order(place_id, build_summary_urls(place_id), "summary"):
+        try:
+            open_url(driver, url)
+            _wait_summary_block(driver, timeout)
+        except Exception:
+            continue
+        wait_until_quiet(driver, timeout=0.6)
+        SCOPE_MEMO.record(place_id, url, "summary")
+        return url
+    return None
+
+
+def goto_map_entry(driver: webdriver.Chrome, place_id: str):
+    """(기존 경로) 지도 셸 → entryIframe 진입 → '리뷰' 탭 클릭"""
     url = f"https://map.naver.com/p/entry/place/{place_id}"
-    driver.get(url)
+    open_url(driver, url)
 
     # (케이스에 따라) entryIframe 내부일 수 있음 → 프레임 진입 시도
     try:
@@ -103,10 +239,17 @@ def goto_desktop_reviews(driver: webdriver.Chrome, place_id: str):
         pass
 
     # '이런 점이 좋았어요' 섹션 등장 대기
-    WebDriverWait(driver, 12).until(EC.presence_of_element_located(
-        (By.XPATH, "//*[contains(normalize-space(.),'이런 점이 좋았어요')]")
-    ))
-    time.sleep(0.6)
+    _wait_summary_block(driver, 12)
+    wait_until_quiet(driver, timeout=0.6)
+
+
+def goto_desktop_reviews(driver: webdriver.Chrome, place_id: str, direct: bool | None = None):
+    """요약 패널이 보이는 문서로 이동 (direct: pcmap 직행 → 실패 시 지도 셸 경로)"""
+    if (SUMMARY_DIRECT if direct is None else direct):
+        if goto_summary_direct(driver, place_id):
+            return
+        print(f"[SUMMARY] {place_id}: pcmap 직행 실패 → 지도 셸 경로")
+    goto_map_entry(driver, place_id)
 
 
 def expand_summary_all(driver, max_clicks: int = 4):
@@ -117,48 +260,25 @@ def expand_summary_all(driver, max_clicks: int = 4):
         "//*[contains(normalize-space(.),'이런 점이 좋았어요')]/ancestor::*[self::div or self::section][1]"
     )
     driver.execute_script("arguments[0].scrollIntoView({block:'center'});", sec)
-    time.sleep(0.3)
-
-    def li_count():
-        try:
-            return len(sec.find_elements(By.CSS_SELECTOR, "li"))
-        except Exception:
-            return 0
 
-    prev = li_count()
+    prev = item_count(driver, "li", root=sec)
     for _ in range(max_clicks):
         clicked = False
 
-        # '더보기/펼치기' 텍스트 버튼
-        for xp in [".//button[contains(.,'더보기')]",
-                   ".//a[contains(.,'더보기')]",
-                   ".//button[contains(.,'펼치기')]",
-                   ".//a[contains(.,'펼치기')]",
-                   ".//*[@aria-label and (contains(@aria-label,'더보기') or contains(@aria-label,'펼치기'))]"]:
+        # '더보기/펼치기' 텍스트/아이콘 버튼 (적중률 순, 0-wait)
+        el = SUMMARY_EXPAND.find(driver, root=sec)
+        if el is not None:
             try:
-                el = sec.find_element(By.XPATH, xp)
-                if el.is_displayed():
-                    driver.execute_script("arguments[0].click();", el)
-                    clicked = True
-                    break
+                driver.execute_script("arguments[0].click();", el)
+                clicked = True
             except Exception:
                 pass
 
-        # 폴백: 섹션 내 아이콘(chevron) 버튼 추정
         if not clicked:
-            try:
-                btns = sec.find_elements(By.XPATH, ".//*[name()='svg' or name()='path']/ancestor::button")
-                for b in btns:
-                    if b.is_displayed():
-                        driver.execute_script("arguments[0].click();", b)
-                        clicked = True
-                        break
-            except Exception:
-                pass
-
-        time.sleep(0.6)
-        now = li_count()
-        if not clicked or now <= prev:
+            break
+        # 섹션 li가 늘면 즉시 리턴, 안 늘면 DOM/네트워크가 잠잠해질 때까지만 대기
+        now = wait_for_growth(driver, prev, "li", root=sec, timeout=3.0, idle_ms=300)
+        if now <= prev:
             break
         prev = now
 
@@ -192,43 +312,62 @@ def parse_summary_counts_from_html(html: str) -> Dict[str, int]:
     if not items:
         items = soup.find_all("li")
 
-    rm_phrase = re.compile(r"이\s*키워드를\s*선택한\s*인원")
     for li in items:
-        txt = " ".join(li.stripped_strings)
-        if not txt:
-            continue
-        mnum = re.search(r"(\d+)\s*$", txt)
-        if not mnum:
-            continue
-        num = int(mnum.group(1))
-        left = re.sub(r"\s*\d+\s*$", "", txt)           # 끝 숫자 제거
-        left = rm_phrase.sub("", left).strip()          # ‘이 키워드를 선택한 인원’ 제거
+        item = parse_summary_item(" ".join(li.stripped_strings))
+        if item:
+            counts[item[0]] = item[1]
 
-        # 큰따옴표 안 문구가 있으면 그걸 라벨로
-        mquote = re.search(r"[“\"]\s*(.+?)\s*[”\"]", left)
-        label = (mquote.group(1) if mquote else left).strip()
+    return counts
 
-        if 1 <= len(label) <= 30 and "이런 점이 좋았어요" not in label:
-            counts[label] = num
 
-    return counts
+_RM_PHRASE = re.compile(r"이\s*키워드를\s*선택한\s*인원")
 
 
-def fetch_summary(place_id: str, cuisine: list[str], store_name: str,
-                  headless: bool = False) -> str:
-    driver = make_driver(headless=headless)
+def parse_summary_item(txt: str):
+    """요약 항목 한 줄 텍스트 → (라벨, 수) 또는 None"""
+    if not txt:
+        return None
+    mnum = re.search(r"(\d+)\s*$", txt)
+    if not mnum:
+        return None
+    num = int(mnum.group(1))
+    left = re.sub(r"\s*\d+\s*$", "", txt)           # 끝 숫자 제거
+    left = _RM_PHRASE.sub("", left).strip()         # ‘이 키워드를 선택한 인원’ 제거
+
+    # 큰따옴표 안 문구가 있으면 그걸 라벨로
+    mquote = re.search(r"[“\"]\s*(.+?)\s*[”\"]", left)
+    label = (mquote.group(1) if mquote else left).strip()
+
+    if 1 <= len(label) <= 30 and "이런 점이 좋았어요" not in label:
+        return label, num
+    return None
+
+
+def read_review_total(driver) -> int | None:
+    """페이지 본문의 '방문자 리뷰 N' → 가게 전체 리뷰 수 (이번에 수집한 행 수와 별개, 못 찾으면 None)"""
     try:
+        total, _ = driver.execute_script(PROBE_JS, 0)
+        return int(total) if total is not None else None
+    except Exception:
+        return None
+
+
+def fetch_summary(place_id: str, cuisine: list[str], store_name: str,
+                  headless: bool = False, pool=None) -> str:
+    with driver_session(headless=headless, pool=pool) as driver:
         goto_desktop_reviews(driver, place_id)
         expand_summary_all(driver)                 # ✅ 요약 리스트 끝까지 펼치기
         html = driver.page_source
         tag_counts = parse_summary_counts_from_html(html)
         if not tag_counts:
+            if looks_blocked(html):
+                raise Throttled("차단/캡차 페이지")
             raise RuntimeError("요약 패널을 파싱하지 못했어요.")
-        out_json = save_store_tag_json(place_id, cuisine, store_name, tag_counts)
+        total = read_review_total(driver)
+        out_json = save_store_tag_json(place_id, cuisine, store_name, tag_counts,
+                                       meta={"review_total": total} if total is not None else None)
         print(f"[OK/SUMMARY] {store_name} ({place_id}) -> {out_json}  ({len(tag_counts)} tags)")
         return out_json
-    finally:
-        driver.quit()
 
 
 # =========================================================
@@ -241,35 +380,37 @@ def build_review_urls(place_id: str, sort: str = "recent") -> List[str]:
     ]
 
 
-def click_more_until_end(driver: webdriver.Chrome, max_clicks: int = 100, sleep_sec: float = 0.5):
+def click_more_until_end(driver: webdriver.Chrome, max_clicks: int = 100, sleep_sec: float = 0.5,
+                         wait_timeout: float = 8.0, on_expand=None):
+    """
+    sleep_sec = 리뷰가 안 늘 때 '조용함'으로 판단하는 구간(고정 대기 아님)
+    on_expand: 처음 한 번 + 리뷰가 늘어날 때마다 호출되는 콜백 (False를 돌려주면 클릭 중단)
+    """
     try:
         driver.find_element(By.TAG_NAME, "body").send_keys(Keys.PAGE_DOWN)
-        time.sleep(0.3)
+        wait_until_quiet(driver, timeout=0.3)
     except Exception:
         pass
 
-    def find_more_btn():
-        try:
-            for el in driver.find_elements(By.CSS_SELECTOR, "a,button"):
-                t = (el.text or "").strip()
-                if (("더보기" in t) or ("후기 더보기" in t)) and el.is_displayed():
-                    return el
-        except Exception:
-            return None
-        return None
-
     clicks, same_height = 0, 0
     last_h = driver.execute_script("return document.body.scrollHeight")
     last_activity = time.time()
+    n_items = item_count(driver)
+    idle_ms = int(sleep_sec * 1000)
+    if on_expand and on_expand() is False:
+        return clicks
 
     while clicks < max_clicks:
-        btn = find_more_btn()
+        btn = MORE_BUTTON.find(driver)
         if btn:
             try:
                 driver.execute_script("arguments[0].click();", btn)
                 clicks += 1
                 last_activity = time.time()
-                time.sleep(sleep_sec)
+                now = wait_for_growth(driver, n_items, idle_ms=idle_ms, timeout=wait_timeout)
+                grew, n_items = now > n_items, now
+                if grew and on_expand and on_expand() is False:
+                    break
                 continue
             except Exception:
                 pass
@@ -278,7 +419,10 @@ def click_more_until_end(driver: webdriver.Chrome, max_clicks: int = 100, sleep_
             driver.execute_script("window.scrollBy(0, 1400);")
         except Exception:
             pass
-        time.sleep(sleep_sec)
+        now = wait_for_growth(driver, n_items, idle_ms=idle_ms, timeout=wait_timeout)
+        grew, n_items = now > n_items, now
+        if grew and on_expand and on_expand() is False:
+            break
 
         h = driver.execute_script("return document.body.scrollHeight")
         if h <= last_h:
@@ -297,6 +441,18 @@ def click_more_until_end(driver: webdriver.Chrome, max_clicks: int = 100, sleep_
 
 
 def expand_all_chip_more(driver, max_tries: int = 3):
+    """보이는 '+N' 칩 전부 펼치기 — 페이지 안 스크립트 1회 왕복/회차 (실패 시 요소별 Selenium 스윕)"""
+    for _ in range(max_tries):
+        n = click_plus_chips(driver)
+        if n is None:
+            return _expand_all_chip_more_slow(driver, max_tries)
+        if not n:
+            break
+        # '+N' 펼침은 클라이언트 렌더링 → 한 번만 잠잠해질 때까지 대기
+        wait_until_quiet(driver, idle_ms=150, timeout=1.0)
+
+
+def _expand_all_chip_more_slow(driver, max_tries: int = 3):
     plus_pat = re.compile(r"^\+\d+$")
     for _ in range(max_tries):
         clicked_any = False
@@ -306,11 +462,24 @@ def expand_all_chip_more(driver, max_tries: int = 3):
                 if plus_pat.match(txt) and el.is_displayed():
                     driver.execute_script("arguments[0].click();", el)
                     clicked_any = True
-                    time.sleep(0.2)
             except Exception:
                 continue
         if not clicked_any:
             break
+        wait_until_quiet(driver, idle_ms=150, timeout=1.0)
+
+
+def dedup_reviews(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """review_key 가 같은 행은 처음 것만 (스코프 두 곳에서 같은 리뷰 목록을 받은 경우)"""
+    seen, out = set(), []
+    for r in rows:
+        k = r.get("review_key")
+        if k:
+            if k in seen:
+                continue
+            seen.add(k)
+        out.append(r)
+    return out
 
 
 def parse_reviews_from_html(html: str, place_id: str, cuisine: list[str], store_name: str) -> List[Dict[str, Any]]:
@@ -330,15 +499,42 @@ def parse_reviews_from_html(html: str, place_id: str, cuisine: list[str], store_
         if tags:
             uniq = list(dict.fromkeys(t for t in tags if t))
             if uniq:
+                nick = r.select_one("span.pui__NMi-Dp")
+                body = r.select_one("div.pui__vn15t2")
                 data.append({
                     "place_id": str(place_id),
                     "cuisine": cuisine or [],
                     "store_name": store_name,
                     "option_tags": uniq,
+                    "review_key": review_key(nick.get_text(strip=True) if nick else "",
+                                             body.get_text(" ", strip=True) if body else ""),
                 })
     return data
 
 
+def collect_review_rows(driver, place_id: str, cuisine: list[str], store_name: str) -> List[Dict[str, Any]]:
+    """페이지 안 JS 한 번으로 태그만 받아옴 (수 MB page_source 전송/재파싱 없음). 실패 시 BeautifulSoup 폴백"""
+    js_rows = extract_reviews(driver, loose_tags=True)
+    if not js_rows:
+        return parse_reviews_from_html(driver.page_source, place_id=place_id, cuisine=cuisine, store_name=store_name)
+    return _rows_from_js(js_rows, place_id, cuisine, store_name)
+
+
+def _rows_from_js(js_rows, place_id: str, cuisine: list[str], store_name: str) -> List[Dict[str, Any]]:
+    data: List[Dict[str, Any]] = []
+    for r in js_rows:
+        uniq = list(dict.fromkeys(t for t in r["tags"] if t))
+        if uniq:
+            data.append({
+                "place_id": str(place_id),
+                "cuisine": cuisine or [],
+                "store_name": store_name,
+                "option_tags": uniq,
+                "review_key": review_key(r.get("nickname", ""), r.get("content", "")),
+            })
+    return data
+
+
 def count_tags(rows: List[Dict[str, Any]], dedup_within_row: bool = True) -> Dict[str, int]:
     c = Counter()
     for r in rows:
@@ -367,33 +563,75 @@ def save_csv(records: List[Dict[str, Any]], place_id: str, cuisine: list[str], s
     return str(path)
 
 
+def _sampling_hook(driver, sampler: TagSampler, place_id: str, cuisine: list[str], store_name: str):
+    """click_more_until_end 의 on_expand: 새로 붙은 리뷰만 '+N' 펼친 뒤 뽑아서 샘플러에 반영"""
+    state = {"js_ok": True}
+
+    def on_expand():
+        if not state["js_ok"]:
+            return None
+        if click_plus_chips(driver):
+            wait_until_quiet(driver, idle_ms=150, timeout=1.0)
+        js_rows = extract_reviews(driver, loose_tags=True, only_new=True)
+        if js_rows is None:
+            state["js_ok"] = False          # JS 추출 불가 → 샘플링 없이 끝까지 펼치고 한 번에 파싱
+            return None
+        return sampler.update(_rows_from_js(js_rows, place_id, cuisine, store_name))
+
+    return on_expand
+
+
 def fetch_chips(place_id: str, cuisine: list[str], store_name: str,
                 sort: str = "recent", max_clicks: int = 60,
                 headless: bool = False, save_csv_also: bool = False,
-                dedup_within_row: bool = True) -> str:
-    driver = make_driver(headless=headless)
+                dedup_within_row: bool = True, pool=None, sampling: bool = False) -> str:
+    """sampling=True: 태그 비율이 수렴(또는 목표 리뷰 수 도달)하면 펼치기 중단 → meta.stop_reason 기록"""
     all_rows: List[Dict[str, Any]] = []
-    try:
+    stop_reason, clicks, sampler, review_total = None, 0, None, None
+    with driver_session(headless=headless, pool=pool, mobile=True) as driver:
         last_err = None
         url_count = 0
-        for url in build_review_urls(place_id, sort=sort):
+        for url in SCOPE_MEMO.order(place_id, build_review_urls(place_id, sort=sort)):
             try:
-                driver.get(url)
+                open_url(driver, url)
                 WebDriverWait(driver, 12).until(EC.any_of(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "li.place_app")),
                     EC.presence_of_element_located((By.XPATH, '//*[@id="app-root"]//*[contains(.,"리뷰")]')),
                 ))
-                click_more_until_end(driver, max_clicks=max_clicks, sleep_sec=0.5)
+                on_expand = None
+                if sampling:
+                    sampler = TagSampler(tol=SAMPLE_TOL, patience=SAMPLE_PATIENCE, min_reviews=SAMPLE_MIN_REVIEWS,
+                                         target_reviews=SAMPLE_TARGET_REVIEWS, dedup_within_row=dedup_within_row)
+                    on_expand = _sampling_hook(driver, sampler, place_id, cuisine, store_name)
+                clicks = click_more_until_end(driver, max_clicks=max_clicks, sleep_sec=0.5, on_expand=on_expand)
                 expand_all_chip_more(driver)
-                time.sleep(0.6)
-                html = driver.page_source
-                rows = parse_reviews_from_html(html, place_id=place_id, cuisine=cuisine, store_name=store_name)
+                wait_until_quiet(driver, timeout=0.6)
+                if on_expand:
+                    on_expand()                     # 마지막 클릭 뒤 붙은 리뷰까지
+                if sampler is not None and sampler.rows:
+                    rows = sampler.rows
+                else:
+                    rows = collect_review_rows(driver, place_id=place_id, cuisine=cuisine, store_name=store_name)
                 if rows:
-                    all_rows.extend(rows); url_count += 1
+                    if review_total is None:
+                        review_total = read_review_total(driver)
+                    if not url_count:
+                        SCOPE_MEMO.record(place_id, url)
+                    all_rows = dedup_reviews(all_rows + rows); url_count += 1
+                    more_left = MORE_BUTTON.find(driver) is not None
+                    stop_reason = ((sampler.stop_reason if sampler is not None else None)
+                                   or ("max_clicks" if clicks >= max_clicks else
+                                       "stalled" if more_left else "exhausted"))
+                    # 끝까지 펼쳤거나 상한/샘플링으로 멈췄으면 다른 스코프는 같은 목록 → 그만
+                    if stop_reason != "stalled":
+                        break
             except Exception as e:
                 Path("outputs/debug").mkdir(parents=True, exist_ok=True)
+                src = driver.page_source
                 with open(f"outputs/debug/{place_id}_{int(time.time())}.html", "w", encoding="utf-8") as df:
-                    df.write(driver.page_source)
+                    df.write(src)
+                if looks_blocked(src):
+                    raise Throttled("차단/캡차 페이지") from e     # 다른 스코프도 같은 응답 → 바로 포기
                 last_err = e
                 continue
 
@@ -402,14 +640,61 @@ def fetch_chips(place_id: str, cuisine: list[str], store_name: str,
                 raise last_err
             raise RuntimeError("리뷰/태그 요소를 찾지 못했어요.")
         counts = count_tags(all_rows, dedup_within_row=dedup_within_row)
-        out_json = save_store_tag_json(place_id, cuisine, store_name, counts)
+        # reviews = 이번에 펼쳐서 모은 행 수 (max_clicks/샘플링에 잘림), review_total = 가게 전체 리뷰 수
+        meta = {"mode": "chips", "stop_reason": stop_reason, "clicks": clicks, "reviews": len(all_rows)}
+        if review_total is not None:
+            meta["review_total"] = review_total
+        if sampler is not None:
+            meta["sampling"] = sampler.meta()
+        out_json = save_store_tag_json(place_id, cuisine, store_name, counts, meta=meta)
         if save_csv_also:
             save_csv(all_rows, place_id, cuisine, store_name)
         total_chips = sum(len(r.get("option_tags", [])) for r in all_rows)
-        print(f"[OK/CHIPS] {store_name} ({place_id}) -> {out_json}  ({total_chips} chips, {len(counts)} tags, {url_count} urls)")
+        print(f"[OK/CHIPS] {store_name} ({place_id}) -> {out_json}  ({total_chips} chips, {len(counts)} tags, "
+              f"{url_count} urls, {clicks} clicks, stop={stop_reason})")
         return out_json
-    finally:
-        driver.quit()
+
+
+# =========================================================
+# 모드 C) NETWORK — 모바일 리뷰 페이지가 받아오는 리뷰 API 응답(JSON)을 캡처
+# =========================================================
+def fetch_network(place_id: str, cuisine: list[str], store_name: str,
+                  sort: str = "recent", max_clicks: int = 60,
+                  headless: bool = False, save_csv_also: bool = False,
+                  dedup_within_row: bool = True, pool=None) -> str:
+    """'더보기' 클릭으로 요청만 발생시키고, 레코드는 SSR 캐시 + 응답 본문에서 만듦 (클래스명 변경에 무관)"""
+    with driver_session(headless=headless, pool=pool, mobile=True, perf_log=True) as driver:
+        if not review_capture.flush_log(driver):
+            raise RuntimeError("performance 로그가 꺼진 드라이버예요 (make_driver(perf_log=True) 필요).")
+        review_capture.enable_capture(driver)
+        last_err = None
+        for url in SCOPE_MEMO.order(place_id, build_review_urls(place_id, sort=sort)):
+            try:
+                open_url(driver, url)
+                WebDriverWait(driver, 12).until(EC.presence_of_element_located((By.CSS_SELECTOR, "li.place_app")))
+                clicks = click_more_until_end(driver, max_clicks=max_clicks, sleep_sec=0.5)
+                wait_until_quiet(driver, timeout=0.6)
+                records = review_capture.capture_records(driver)
+            except Exception as e:
+                review_capture.flush_log(driver)
+                last_err = e
+                continue
+            rows = [{"place_id": str(place_id), "cuisine": cuisine or [], "store_name": store_name,
+                     "option_tags": r["tags"]} for r in records if r["tags"]]
+            if not rows:
+                last_err = RuntimeError("리뷰 API 응답을 캡처하지 못했어요.")
+                continue
+            SCOPE_MEMO.record(place_id, url)
+            counts = count_tags(rows, dedup_within_row=dedup_within_row)
+            total = read_review_total(driver)
+            out_json = save_store_tag_json(place_id, cuisine, store_name, counts,
+                                           meta={"review_total": total} if total is not None else None)
+            if save_csv_also:
+                save_csv(rows, place_id, cuisine, store_name)
+            print(f"[OK/NETWORK] {store_name} ({place_id}) -> {out_json}  "
+                  f"({len(records)} reviews, {len(counts)} tags, {clicks} clicks)")
+            return out_json
+        raise last_err or RuntimeError("리뷰 API 응답을 캡처하지 못했어요.")
 
 
 # =========================================================
@@ -418,32 +703,50 @@ def fetch_chips(place_id: str, cuisine: list[str], store_name: str,
 def fetch_and_build(place_id: str, cuisine: list[str], store_name: str,
                     sort: str = "recent", max_clicks: int = 60,
                     headless: bool = False, save_csv_also: bool = False,
-                    dedup_within_row: bool = True, mode: str | None = None) -> str:
+                    dedup_within_row: bool = True, mode: str | None = None, pool=None,
+                    sampling: bool = False) -> str:
+    """
+    pool(DriverPool)을 넘기면 가게마다 Chrome을 새로 띄우지 않고 빌려 씀
+    sampling=True 면 chips 모드에서 태그 분포가 수렴할 때까지만 펼침 (summary/network 에는 영향 없음)
+    """
     mode = (mode or DEFAULT_MODE).lower()
     if mode == "summary":
-        return fetch_summary(place_id, cuisine, store_name, headless=headless)
+        return fetch_summary(place_id, cuisine, store_name, headless=headless, pool=pool)
+    elif mode == "network":
+        return fetch_network(place_id, cuisine, store_name, sort=sort, max_clicks=max_clicks,
+                             headless=headless, save_csv_also=save_csv_also, dedup_within_row=dedup_within_row,
+                             pool=pool)
     else:
         return fetch_chips(place_id, cuisine, store_name, sort=sort, max_clicks=max_clicks,
-                           headless=headless, save_csv_also=save_csv_also, dedup_within_row=dedup_within_row)
+                           headless=headless, save_csv_also=save_csv_also, dedup_within_row=dedup_within_row,
+                           pool=pool, sampling=sampling)
 
 
 # -----------------------------
 # CLI (단일 테스트)
 # -----------------------------
 def main(argv=None):
+    global USE_DAEMON, SAMPLE_TOL, SAMPLE_TARGET_REVIEWS
     ap = argparse.ArgumentParser(description="Naver Place → tag_counts.json (summary/chips)")
     ap.add_argument("--place_id", required=True)
     ap.add_argument("--store_name", required=True)
     ap.add_argument("--cuisine", "--cusine", dest="cuisine", nargs="+",
                     help='쉼표/공백 아무거나로 구분: 예) --cuisine "파스타","스파게티" 또는 --cuisine 파스타 스파게티')
-    ap.add_argument("--mode", choices=["summary","chips"], default=DEFAULT_MODE)
+    ap.add_argument("--mode", choices=["summary","chips","network"], default=DEFAULT_MODE)
     ap.add_argument("--sort", default="recent")
     ap.add_argument("--max_clicks", type=int, default=60)
     ap.add_argument("--headless", action="store_true")
     ap.add_argument("--save_csv", action="store_true", help="(chips 모드) CSV도 함께 저장")
     ap.add_argument("--dedup", action="store_true", help="(chips 모드) 리뷰 내부 중복 태그 1회만 카운트")
+    ap.add_argument("--no_daemon", action="store_true", help="상주 Chrome(chrome_daemon.py)이 있어도 새로 띄우기")
+    ap.add_argument("--sample", action="store_true", help="(chips 모드) 태그 분포가 수렴하면 펼치기 중단")
+    ap.add_argument("--sample_tol", type=float, default=SAMPLE_TOL, help="(--sample) 비율 변화 허용치")
+    ap.add_argument("--sample_target", type=int, default=SAMPLE_TARGET_REVIEWS, help="(--sample) 목표 리뷰 수")
     args = ap.parse_args(argv)
 
+    USE_DAEMON = not args.no_daemon
+    SAMPLE_TOL, SAMPLE_TARGET_REVIEWS = args.sample_tol, args.sample_target
+
     cuisine = parse_cuisine_tokens(args.cuisine)
     out = fetch_and_build(
         place_id=args.place_id,
@@ -455,7 +758,9 @@ def main(argv=None):
         save_csv_also=args.save_csv,
         dedup_within_row=args.dedup or True,
         mode=args.mode,
+        sampling=args.sample,
     )
+    save_run_state()
     print(out)
 
 
@@ -0,0 +1,177 @@
+# page_scripts.py — 페이지 안에서 한 번에 실행하는 JS 스니펫 모음
+# page_source(수 MB)를 WebDriver로 끌어와 BeautifulSoup으로 다시 DOM을 만드는 대신,
+# execute_script 한 번으로 필요한 레코드만 JSON으로 받는다.
+# 실패하면 None을 돌려주므로 호출 쪽에서 page_source + BeautifulSoup 경로로 폴백하면 됨.
+#
+# 루트 스크립트와 keyword_counting/ 양쪽에서 같이 씀 → selenium 외 의존성 없음
+from __future__ import annotations
+from typing import Any, Dict, List, Optional
+
+REVIEW_LI_SELECTOR = "li.place_app"
+
+# arguments[0] = 리뷰 li 셀렉터, arguments[1] = 느슨한 태그 폴백("…요" 패턴 span) 사용 여부
+# arguments[2] = only_new: 이미 가져간 li(data-crawled)는 건너뛰고, 이번에 가져간 li에 표시를 남김
+EXTRACT_REVIEWS_JS = r"""
+const sel = arguments[0], loose = arguments[1], onlyNew = arguments[2];
+let items = document.querySelectorAll(sel);
+if (!items.length) items = document.querySelectorAll('li');
+if (onlyNew) items = Array.from(items).filter(li => !li.dataset.crawled);
+const chip = /^[가-힣\s]{2,20}요$/;
+// BeautifulSoup get_text(sep, strip=True) 와 같은 규칙: 텍스트 노드마다 trim, 빈 것 빼고 sep 로 연결
+// (innerText 는 레이아웃에 따라 줄바꿈/공백이 달라져서 BS 경로와 review_key 가 어긋났음)
+const text = (el, sep = '') => {
+  if (!el) return '';
+  const parts = [], w = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+  while (w.nextNode()) { const t = w.currentNode.nodeValue.trim(); if (t) parts.push(t); }
+  return parts.join(sep);
+};
+const out = [];
+for (const li of items) {
+  const nickname = text(li.querySelector('span.pui__NMi-Dp'));
+  const content = text(li.querySelector('div.pui__vn15t2'), '\n');
+  const box = li.querySelector('div.pui__HLNvmI') || li;       // 태그 박스가 없으면 li 전체 (BS 경로와 같음)
+  let tags = Array.from(box.querySelectorAll('span.pui__jhpEyP'), el => text(el));
+  if (!tags.length && loose) {
+    tags = Array.from(box.querySelectorAll('span'), el => text(el)).filter(t => chip.test(t));
+  }
+  tags = tags.filter(Boolean);
+  if (onlyNew) li.dataset.crawled = '1';
+  if (nickname || content || tags.length) out.push({nickname, content, tags});
+}
+return out;
+"""
+
+
+# 보이는 요소 판정 (Selenium is_displayed 근사: 크기 0 / display:none / visibility:hidden 제외)
+_VISIBLE_JS = r"""
+const visible = (el) => {
+  const r = el.getBoundingClientRect();
+  if (!r.width || !r.height) return false;
+  const cs = getComputedStyle(el);
+  return cs.visibility !== 'hidden' && cs.display !== 'none';
+};
+"""
+
+# arguments[0] = 루트(없으면 document), arguments[1] = CSS 셀렉터, arguments[2] = 포함 텍스트
+# 조건에 맞는 첫 번째 보이는 요소(WebElement) 또는 null
+FIND_BY_TEXT_JS = _VISIBLE_JS + r"""
+const root = arguments[0] || document;
+for (const el of root.querySelectorAll(arguments[1])) {
+  if ((el.textContent || '').includes(arguments[2]) && visible(el)) return el;
+}
+return null;
+"""
+
+# arguments[0] = 루트(없으면 document), arguments[1] = CSS 셀렉터, arguments[2] = 텍스트 후보 배열
+# 텍스트(또는 aria-label)에 후보 중 하나가 들어간 첫 번째 보이는 요소를 클릭 → 클릭 여부
+CLICK_BY_TEXT_JS = _VISIBLE_JS + r"""
+const root = arguments[0] || document;
+const hit = (el) => arguments[2].some(t => (el.textContent || '').includes(t)
+                                       || (el.getAttribute('aria-label') || '').includes(t));
+for (const el of root.querySelectorAll(arguments[1])) {
+  if (hit(el) && visible(el)) { el.click(); return true; }
+}
+return false;
+"""
+
+# arguments[0] = 루트(없으면 document) — 보이는 '+N' 칩을 전부 클릭하고 클릭 수를 리턴
+# (<button><span>+3</span></button> 처럼 겹치면 바깥 요소만 클릭: 두 번 눌러 다시 접히는 것 방지)
+CLICK_PLUS_CHIPS_JS = _VISIBLE_JS + r"""
+const root = arguments[0] || document;
+const pat = /^\+\d+$/;
+const hits = Array.from(root.querySelectorAll('a,button,span'))
+  .filter(el => pat.test((el.textContent || '').trim()));
+const set = new Set(hits);
+let n = 0;
+for (const el of hits) {
+  let p = el.parentElement, nested = false;
+  while (p && p !== root) { if (set.has(p)) { nested = true; break; } p = p.parentElement; }
+  if (nested || !visible(el)) continue;
+  el.click(); n++;
+}
+return n;
+"""
+
+
+# 탭 멀티플렉싱용 한 스텝: 상태 확인 + (직전 클릭의 로딩이 끝났으면) '더보기' 클릭 후 기다리지 않고 바로 리턴
+# arguments[0] = 리뷰 li 셀렉터, arguments[1] = 클릭 후 리스트가 안 늘어도 로딩 중으로 볼 최대 ms,
+# arguments[2] = 클릭 허용 여부 (max_clicks 도달 시 false → 상태만 확인)
+# → {ready, count, clicked, loading, button}
+#   ready=false : 이전 문서(window.__leaving)거나 아직 파싱 중
+TAB_STEP_JS = _VISIBLE_JS + r"""
+if (window.__leaving || document.readyState === 'loading')
+  return {ready: false, count: 0, clicked: false, loading: true, button: false};
+const n = document.querySelectorAll(arguments[0]).length;
+const w = window.__tabStep || (window.__tabStep = {lastN: -1, clickedAt: 0});
+const loading = !!(w.clickedAt && n <= w.lastN && (Date.now() - w.clickedAt) < arguments[1]);
+let btn = null;
+if (!loading) {
+  for (const el of document.querySelectorAll('a,button')) {
+    if ((el.textContent || '').includes('더보기') && visible(el)) { btn = el; break; }
+  }
+}
+let clicked = false;
+if (btn && arguments[2]) { btn.click(); w.clickedAt = Date.now(); w.lastN = n; clicked = true; }
+return {ready: true, count: n, clicked, loading: loading || clicked, button: !!btn};
+"""
+
+
+# 변경 감지 프로브: 방문자 리뷰 총수 + '이런 점이 좋았어요' 상위 항목 텍스트만 → [total|null, [li 텍스트...]]
+# arguments[0] = 상위 몇 개 항목까지 볼지
+PROBE_JS = r"""
+const text = document.body ? document.body.innerText : '';
+const m = text.match(/방문자\s*리뷰\s*([\d,]+)/);
+const total = m ? parseInt(m[1].replace(/,/g, ''), 10) : null;
+let head = [];
+const it = document.evaluate("//*[contains(normalize-space(.),'이런 점이 좋았어요')]", document, null,
+                             XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+if (it.snapshotLength) {
+  const title = it.snapshotItem(it.snapshotLength - 1);        // 가장 안쪽(제목) 요소
+  const sec = title.closest('section') || title.parentElement;
+  head = Array.from(sec.querySelectorAll('li'), li => li.innerText.replace(/\s+/g, ' ').trim())
+    .filter(Boolean).slice(0, arguments[0]);
+}
+return [total, head];
+"""
+
+
+def click_plus_chips(driver, root=None) -> Optional[int]:
+    """보이는 '+N' 칩을 한 번의 execute_script로 전부 펼침 → 클릭 수 (실패 시 None)"""
+    try:
+        return int(driver.execute_script(CLICK_PLUS_CHIPS_JS, root))
+    except Exception:
+        return None
+
+
+# arguments[0] = 리뷰 li 셀렉터, arguments[1] = 남겨둘 마지막 li 개수
+# 이미 추출된(data-crawled) li를 라이브 DOM에서 제거 → [제거 수, 남은 li 수]
+# 마지막 몇 개는 남겨야 스크롤 위치/'더보기' 버튼 위치가 유지됨
+PRUNE_CRAWLED_JS = r"""
+const done = Array.from(document.querySelectorAll(arguments[0])).filter(li => li.dataset.crawled);
+const drop = done.slice(0, Math.max(done.length - arguments[1], 0));
+for (const li of drop) li.remove();
+return [drop.length, document.querySelectorAll(arguments[0]).length];
+"""
+
+
+def prune_crawled(driver, selector: str = REVIEW_LI_SELECTOR, keep_last: int = 5) -> int:
+    """추출 끝난 리뷰 li를 DOM에서 떼어냄 → 제거한 개수 (실패 시 0)"""
+    try:
+        removed, _ = driver.execute_script(PRUNE_CRAWLED_JS, selector, keep_last)
+        return int(removed)
+    except Exception:
+        return 0
+
+
+def extract_reviews(driver, selector: str = REVIEW_LI_SELECTOR, loose_tags: bool = False,
+                    only_new: bool = False) -> Optional[List[Dict[str, Any]]]:
+    """
+    리뷰 li를 페이지 안에서 바로 파싱 → [{"nickname", "content", "tags": [...]}, ...]
+    only_new=True 이면 지난 호출 이후 새로 붙은 li만 돌려줌 (무한 스크롤 중 증분 수집용)
+    스크립트 실행 실패 시 None (BeautifulSoup 폴백 신호)
+    """
+    try:
+        rows = driver.execute_script(EXTRACT_REVIEWS_JS, selector, loose_tags, only_new)
+    except Exception:
+        return None
+    return rows if isinstance(rows, list) else None
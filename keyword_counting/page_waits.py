@@ -0,0 +1,99 @@
+# page_waits.py — 고정 sleep 대신 "이벤트가 오면 바로 리턴"하는 대기 엔진
+# '더보기' 클릭 후 0.4~0.6초를 무조건 쉬는 대신,
+#  1) 리뷰 li 개수가 늘어나면 즉시 리턴
+#  2) DOM 변화(MutationObserver)와 fetch/XHR 이 모두 idle_ms 동안 조용하면 리턴 (network-idle)
+#  3) 그래도 안 되면 timeout 에서 리턴
+# 페이지 안에 관찰자(window.__crawlWatch)를 심어두고, 파이썬은 짧게 폴링만 한다.
+#
+# 루트 스크립트(naver_place_crolling.py 등)와 keyword_counting/ 양쪽에서 같이 씀 → selenium 외 의존성 없음
+from __future__ import annotations
+import time
+
+REVIEW_ITEM_SELECTOR = "li.place_app, #app-root li"
+
+_INSTALL_JS = r"""
+if (!window.__crawlWatch) {
+  const w = window.__crawlWatch = {muts: 0, lastMut: performance.now(), pending: 0, lastNet: 0};
+  new MutationObserver(() => { w.muts++; w.lastMut = performance.now(); })
+    .observe(document.documentElement, {childList: true, subtree: true});
+  const done = () => { w.pending = Math.max(w.pending - 1, 0); w.lastNet = performance.now(); };
+  if (window.fetch) {
+    const of = window.fetch;
+    window.fetch = function () { w.pending++; return of.apply(this, arguments).finally(done); };
+  }
+  const os = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    w.pending++; this.addEventListener('loadend', done, {once: true});
+    return os.apply(this, arguments);
+  };
+}
+return true;
+"""
+
+_STATE_JS = r"""
+const w = window.__crawlWatch || {muts: 0, lastMut: 0, pending: 0, lastNet: 0};
+const root = arguments[1] || document;
+return [root.querySelectorAll(arguments[0]).length, w.pending,
+        performance.now() - Math.max(w.lastMut, w.lastNet)];
+"""
+
+
+def install_watch(driver) -> bool:
+    """관찰자 설치(페이지 이동 시 사라지므로 매번 호출해도 안전)"""
+    try:
+        return bool(driver.execute_script(_INSTALL_JS))
+    except Exception:
+        return False
+
+
+def _state(driver, selector: str, root=None):
+    return driver.execute_script(_STATE_JS, selector, root)
+
+
+def item_count(driver, selector: str = REVIEW_ITEM_SELECTOR, root=None) -> int:
+    try:
+        install_watch(driver)
+        return int(_state(driver, selector, root)[0])
+    except Exception:
+        return 0
+
+
+def wait_for_growth(driver, prev_count: int, selector: str = REVIEW_ITEM_SELECTOR, root=None,
+                    timeout: float = 8.0, idle_ms: int = 400, poll: float = 0.05) -> int:
+    """
+    항목 수가 prev_count 보다 늘면 즉시, 아니면 DOM/네트워크가 idle_ms 동안 조용해지면 리턴.
+    리턴값 = 현재 항목 수 (늘지 않았으면 prev_count 이하)
+    """
+    install_watch(driver)
+    t0 = time.time()
+    deadline = t0 + timeout
+    count = prev_count
+    while True:
+        try:
+            count, pending, quiet_ms = _state(driver, selector, root)
+        except Exception:
+            return count
+        if count > prev_count:
+            return count
+        waited_ms = (time.time() - t0) * 1000
+        if pending == 0 and quiet_ms >= idle_ms and waited_ms >= idle_ms:
+            return count
+        if time.time() >= deadline:
+            return count
+        time.sleep(poll)
+
+
+def wait_until_quiet(driver, idle_ms: int = 300, timeout: float = 3.0, poll: float = 0.05) -> bool:
+    """진행 중 요청이 없고 DOM 변화가 idle_ms 동안 없으면 True, timeout이면 False"""
+    install_watch(driver)
+    deadline = time.time() + timeout
+    while True:
+        try:
+            _, pending, quiet_ms = _state(driver, "body", None)
+        except Exception:
+            return False
+        if pending == 0 and quiet_ms >= idle_ms:
+            return True
+        if time.time() >= deadline:
+            return False
+        time.sleep(poll)
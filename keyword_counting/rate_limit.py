@@ -0,0 +1,38 @@
+# rate_limit.py — 프로세스 간 공유 호스트별 레이트 리밋
+# 워커 프로세스가 여러 개여도 같은 호스트에는 min_interval 초 간격으로만 요청이 나가도록,
+# "다음 요청 허용 시각"을 공유 메모리(multiprocessing.Array)에 두고 Lock으로 예약한다.
+# multiprocessing.Pool(initializer=..., initargs=(limiter,)) 로 워커에 넘겨 쓰면 됨.
+from __future__ import annotations
+import time
+import multiprocessing as mp
+from urllib.parse import urlparse
+
+DEFAULT_HOSTS = ("map.naver.com", "m.place.naver.com", "pcmap.place.naver.com")
+
+
+class HostRateLimiter:
+    def __init__(self, min_interval: float = 1.0, hosts=DEFAULT_HOSTS, ctx=None):
+        ctx = ctx or mp
+        self.min_interval = float(min_interval)
+        self.hosts = list(hosts)
+        self._next = ctx.Array("d", len(self.hosts) + 1, lock=False)   # 마지막 칸 = 그 외 호스트
+        self._lock = ctx.Lock()
+
+    def _slot(self, url_or_host: str) -> int:
+        host = urlparse(url_or_host).hostname or url_or_host
+        try:
+            return self.hosts.index(host)
+        except ValueError:
+            return len(self.hosts)
+
+    def wait(self, url_or_host: str) -> float:
+        """해당 호스트의 내 차례까지 대기하고, 실제로 기다린 시간(초)을 돌려줌"""
+        i = self._slot(url_or_host)
+        with self._lock:
+            now = time.time()
+            at = max(now, self._next[i])
+            self._next[i] = at + self.min_interval
+        delay = at - now
+        if delay > 0:
+            time.sleep(delay)
+        return max(delay, 0.0)
@@ -0,0 +1,153 @@
+# recrawl_scheduler.py — "지금 새로 고치면 값어치가 큰 가게"부터 고르는 재크롤 스케줄러
+#---호출법---#
+# python recrawl_scheduler.py --limit 300 --budget_min 45                        # 계획만 출력
+# python create_profiles_final.py --schedule --limit 300 --budget_min 45 --workers 4   # 계획대로 크롤
+#
+# run() 은 place_list.csv 를 start~end 순서대로 돌 뿐이라, 큰 목록을 정해진 시간 안에 신선하게 유지할 수 없었다.
+# 상태 DB(crawl_db.py)의 가게별 기록으로 점수를 매겨 높은 순으로, 시간 예산 안에 들어가는 만큼만 고른다.
+#   value = (예상 새 리뷰 비율 + 나이 가중) × (추천된 적 있으면 RECOMMENDED_BOOST)
+#     예상 새 리뷰 = 리뷰 증가 속도(건/일, 모르면 DEFAULT_VELOCITY) × 마지막 성공 이후 일수
+#     비율 = 예상 새 리뷰 / (리뷰 총수 + 예상 새 리뷰)  → 리뷰 많은 가게는 몇 건 늘어도 태그 분포가 거의 안 변함
+#   한 번도 성공 못 한 가게 = NEW_PLACE_SCORE (맨 앞)
+#   실패한 가게는 BACKOFF_HOURS × 2^(연속 실패-1) (최대 MAX_BACKOFF_DAYS) 동안 제외
+# 예산: value / 예상 소요시간 순으로 담고, 예상 소요 합 ÷ 동시 처리 수가 budget 을 넘으면 멈춘다.
+from __future__ import annotations
+import csv, math, argparse, datetime as dt
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set
+
+from crawl_db import CrawlDB, DEFAULT_DB_PATH, read_profile
+
+DEFAULT_VELOCITY  = 0.3     # 속도를 아직 모르는 가게의 가정치 (리뷰 건/일)
+AGE_WEIGHT        = 0.2     # 리뷰가 안 늘어도 오래되면 조금씩 올라가는 몫 (MAX_AGE_DAYS 에서 최대)
+MAX_AGE_DAYS      = 90
+MIN_AGE_HOURS     = 12      # 이보다 최근에 성공한 가게는 후보에서 제외
+NEW_PLACE_SCORE   = 10.0
+RECOMMENDED_BOOST = 2.0
+BACKOFF_HOURS     = 6
+MAX_BACKOFF_DAYS  = 7
+
+
+def _parse_ts(s: str | None) -> dt.datetime | None:
+    if not s:
+        return None
+    try:
+        return dt.datetime.fromisoformat(str(s))
+    except ValueError:
+        return None
+
+
+def _truthy(v) -> bool:
+    return str(v or "").strip().lower() in ("1", "y", "yes", "true", "o")
+
+
+def load_recommended(path: str | Path) -> Set[str]:
+    """추천된 가게 목록 파일 → place_id 집합 (place_id 열이 있는 CSV 또는 한 줄에 하나)"""
+    path = Path(path)
+    with path.open(encoding="utf-8-sig", newline="") as f:
+        head = f.readline()
+        f.seek(0)
+        if "place_id" in head:
+            return {(r.get("place_id") or "").strip() for r in csv.DictReader(f)} - {""}
+        return {line.strip() for line in f if line.strip()}
+
+
+def in_backoff(place: Dict[str, Any] | None, now: dt.datetime) -> bool:
+    if not place or not place["fail_streak"] or place["status"] != "FAIL":
+        return False
+    last = _parse_ts(place["last_attempt_at"])
+    if last is None:
+        return False
+    hours = min(BACKOFF_HOURS * 2 ** (place["fail_streak"] - 1), MAX_BACKOFF_DAYS * 24)
+    return now < last + dt.timedelta(hours=hours)
+
+
+def score(place: Dict[str, Any] | None, now: dt.datetime, recommended: bool = False,
+          profile: Dict[str, Any] | None = None) -> float:
+    """재크롤 가치 (0 이하 = 지금은 안 함). place: crawl_db places 행, profile: DB에 없을 때 쓰는 프로필 JSON 정보"""
+    if in_backoff(place, now):
+        return 0.0
+    last_ok = _parse_ts(place["last_ok_at"]) if place else None
+    total = place["review_total"] if place else None
+    if last_ok is None and profile:                  # DB 이전에 만든 프로필: 파일의 crawled_at 으로 대신
+        last_ok, total = _parse_ts(profile.get("crawled_at")), profile.get("review_total")
+    boost = RECOMMENDED_BOOST if recommended or (place and place["recommended"]) else 1.0
+    if last_ok is None:
+        return NEW_PLACE_SCORE * boost
+    age_days = (now - last_ok).total_seconds() / 86400
+    if age_days * 24 < MIN_AGE_HOURS:
+        return 0.0
+    velocity = place["review_velocity"] if place and place["review_velocity"] is not None else DEFAULT_VELOCITY
+    expected_new = velocity * age_days
+    stale = expected_new / ((total or 0) + expected_new) if expected_new > 0 else 0.0
+    return (stale + AGE_WEIGHT * min(age_days / MAX_AGE_DAYS, 1.0)) * boost
+
+
+def plan(rows: Iterable[Dict[str, Any]], db: CrawlDB, limit: int | None = None, budget_sec: float | None = None,
+         parallel: int = 1, profile_dir: str | Path | None = None, recommended: Set[str] | None = None,
+         now: dt.datetime | None = None) -> List[Dict[str, Any]]:
+    """
+    place_list 행들 → 크롤할 순서대로 [{"row", "place_id", "score", "cost_sec"}, ...]
+    limit 개 또는 예상 소요 합 / parallel 이 budget_sec 에 닿을 때까지.
+    """
+    now = now or dt.datetime.now()
+    places = db.place_map()
+    default_cost = db.median_elapsed_ms() / 1000
+    recommended = recommended or set()
+    cands = []
+    for row in rows:
+        pid = (row.get("place_id") or "").strip()
+        if not pid:
+            continue
+        place = places.get(pid)
+        profile = None
+        if (place is None or not place["last_ok_at"]) and profile_dir:
+            profile = read_profile(Path(profile_dir) / f"{pid}_tags.json") or None
+        s = score(place, now, recommended=pid in recommended or _truthy(row.get("recommended")), profile=profile)
+        if s <= 0:
+            continue
+        cost = (place["last_elapsed_ms"] / 1000) if place and place["last_elapsed_ms"] else default_cost
+        cands.append({"row": row, "place_id": pid, "score": round(s, 4), "cost_sec": round(cost, 1)})
+
+    cands.sort(key=lambda c: c["score"] / max(c["cost_sec"], 1.0), reverse=True)
+    picked, spent = [], 0.0
+    for c in cands:
+        if limit is not None and len(picked) >= limit:
+            break
+        if budget_sec is not None and spent + c["cost_sec"] / max(parallel, 1) > budget_sec:
+            break
+        picked.append(c)
+        spent += c["cost_sec"] / max(parallel, 1)
+    return picked
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="staleness-driven recrawl plan")
+    ap.add_argument("--place_list", default="place_list.csv")
+    ap.add_argument("--db", default=str(DEFAULT_DB_PATH))
+    ap.add_argument("--profile_dir", default="./outputs/places_json")
+    ap.add_argument("--recommended", default=None, help="추천된 가게 place_id 목록 파일 (DB 에 표시해 둠)")
+    ap.add_argument("--limit", type=int, default=None)
+    ap.add_argument("--budget_min", type=float, default=None)
+    ap.add_argument("--parallel", type=int, default=1, help="동시 처리 수 (workers/concurrency)")
+    args = ap.parse_args(argv)
+
+    from create_profiles_final import _open_csv_with_fallback
+    f, reader = _open_csv_with_fallback(Path(args.place_list))
+    with f:
+        rows = list(reader)
+    with CrawlDB(args.db) as db:
+        if args.recommended:
+            db.mark_recommended(load_recommended(args.recommended))
+        picked = plan(rows, db, limit=args.limit, budget_sec=args.budget_min * 60 if args.budget_min else None,
+                      parallel=args.parallel, profile_dir=args.profile_dir)
+    for c in picked:
+        name = c["row"].get("store_name") or c["row"].get("name") or ""
+        print(f"{c['place_id']:>12}  score {c['score']:>7}  ~{c['cost_sec']:>5}s  {name}")
+    est = sum(c["cost_sec"] for c in picked) / max(args.parallel, 1)
+    print(f"후보 {len(rows)}곳 중 {len(picked)}곳, 예상 {math.ceil(est / 60)}분")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,221 @@
+# review_capture.py — 리뷰 API(GraphQL/XHR) 응답을 그대로 받아 레코드를 만드는 네트워크 캡처 모드
+#---호출법---#
+# python make_place_profile.py --place_id 31751923 --store_name "신통치킨 단국대점" --cuisine 치킨 --mode network
+# python review_capture.py --har fixtures/31751923.har           # 녹화한 HAR 로 파서만 검증 (브라우저 불필요)
+#
+# '더보기'를 누를 때마다 모바일 리뷰 페이지는 리뷰/칩이 이미 들어있는 JSON 을 받아온다.
+# DOM(난수 클래스 span.pui__jhpEyP 등)을 긁는 대신,
+#  - 첫 화면 분은 window.__APOLLO_STATE__ (SSR 캐시)에서,
+#  - 이후 분은 Chrome performance 로그(Network.*)로 응답을 찾아 Network.getResponseBody 로 본문을 받아
+# parse_review_payload() 로 {review_id, nickname, content, tags, visited} 레코드를 만든다.
+# 드라이버는 performance 로그가 켜져 있어야 함 (make_driver(perf_log=True) / browser_profile.build_options).
+from __future__ import annotations
+import json, base64, argparse
+from typing import Any, Dict, Iterable, Iterator, List
+
+# 리뷰 응답으로 볼 URL 조각 (GraphQL 엔드포인트 / REST 폴백)
+REVIEW_API_PATTERNS = ("/graphql", "visitorReviews", "/review/visitor")
+# getResponseBody 가 페이지 이동 전까지 본문을 잡아두도록 버퍼를 넉넉히
+NETWORK_BUFFER = {"maxTotalBufferSize": 100_000_000, "maxResourceBufferSize": 10_000_000}
+
+_REVIEW_TYPENAMES = ("VisitorReview",)
+
+
+def _is_review_url(url: str) -> bool:
+    return any(p in (url or "") for p in REVIEW_API_PATTERNS)
+
+
+# -----------------------------
+# 페이로드 → 레코드
+# -----------------------------
+def _keyword_names(keywords, resolve=lambda x: x) -> List[str]:
+    out = []
+    for k in keywords or []:
+        k = resolve(k)
+        if isinstance(k, dict):
+            name = k.get("displayName") or k.get("name") or k.get("code")
+        else:
+            name = k
+        if isinstance(name, str) and name.strip():
+            out.append(name.strip())
+    return list(dict.fromkeys(out))
+
+
+def _record(item: dict, resolve=lambda x: x) -> Dict[str, Any] | None:
+    author = resolve(item.get("author")) or {}
+    tags = _keyword_names(item.get("votedKeywords"), resolve)
+    content = (item.get("body") or "").strip()
+    rid = str(item.get("id") or item.get("reviewId") or "")
+    if not (rid or content or tags):
+        return None
+    return {
+        "review_id": rid,
+        "nickname": (author.get("nickname") if isinstance(author, dict) else "") or "",
+        "content": content,
+        "tags": tags,
+        "visited": item.get("visited") or item.get("visitedDate") or "",
+    }
+
+
+def _walk(node) -> Iterator[dict]:
+    """응답 구조가 바뀌어도 'votedKeywords 를 가진 dict' 를 리뷰로 보고 재귀 탐색"""
+    if isinstance(node, dict):
+        if "votedKeywords" in node and ("body" in node or "id" in node):
+            yield node
+            return
+        for v in node.values():
+            yield from _walk(v)
+    elif isinstance(node, list):
+        for v in node:
+            yield from _walk(v)
+
+
+def parse_review_payload(doc) -> List[Dict[str, Any]]:
+    """GraphQL 응답(단건 dict 또는 배치 list) → 리뷰 레코드 목록"""
+    out = []
+    for item in _walk(doc):
+        r = _record(item)
+        if r:
+            out.append(r)
+    return out
+
+
+def parse_apollo_state(state: dict | None) -> List[Dict[str, Any]]:
+    """window.__APOLLO_STATE__ (정규화 캐시, {"__ref": key} 참조) → 리뷰 레코드 목록"""
+    if not isinstance(state, dict):
+        return []
+
+    def resolve(x):
+        if isinstance(x, dict) and "__ref" in x:
+            return state.get(x["__ref"]) or {}
+        return x
+
+    out = []
+    for key, obj in state.items():
+        if not isinstance(obj, dict):
+            continue
+        if obj.get("__typename") in _REVIEW_TYPENAMES or key.split(":", 1)[0] in _REVIEW_TYPENAMES:
+            r = _record(obj, resolve)
+            if r:
+                out.append(r)
+    return out
+
+
+def merge_records(*groups: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """review_id 기준 중복 제거 (id 가 없으면 닉네임+본문으로)"""
+    seen, out = set(), []
+    for g in groups:
+        for r in g:
+            key = r.get("review_id") or (r.get("nickname", ""), r.get("content", ""))
+            if key in seen:
+                continue
+            seen.add(key)
+            out.append(r)
+    return out
+
+
+# -----------------------------
+# 라이브 드라이버에서 캡처
+# -----------------------------
+def enable_capture(driver) -> bool:
+    try:
+        driver.execute_cdp_cmd("Network.enable", dict(NETWORK_BUFFER))
+        return True
+    except Exception:
+        return False
+
+
+def flush_log(driver) -> bool:
+    """쌓인 performance 로그 비우기 (풀에서 빌린 드라이버의 이전 가게 기록 제거). 로그가 꺼져 있으면 False"""
+    try:
+        driver.get_log("performance")
+        return True
+    except Exception:
+        return False
+
+
+def drain_review_payloads(driver) -> List[Any]:
+    """지금까지 완료된 리뷰 응답 본문(JSON) 목록. performance 로그를 읽으면 로그는 비워짐"""
+    pending: Dict[str, str] = {}
+    bodies: List[Any] = []
+    for entry in driver.get_log("performance"):
+        try:
+            msg = json.loads(entry["message"])["message"]
+        except Exception:
+            continue
+        method, params = msg.get("method"), msg.get("params") or {}
+        if method == "Network.responseReceived":
+            resp = params.get("response") or {}
+            if _is_review_url(resp.get("url")) and "json" in (resp.get("mimeType") or ""):
+                pending[params.get("requestId")] = resp.get("url")
+        elif method == "Network.loadingFinished" and params.get("requestId") in pending:
+            rid = params["requestId"]
+            try:
+                res = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": rid})
+                text = res.get("body") or ""
+                if res.get("base64Encoded"):
+                    text = base64.b64decode(text).decode("utf-8", "replace")
+                bodies.append(json.loads(text))
+            except Exception:
+                pass
+            pending.pop(rid, None)
+    return bodies
+
+
+def capture_records(driver, include_initial: bool = True) -> List[Dict[str, Any]]:
+    """SSR 캐시 + 지금까지 캡처한 응답 → 중복 제거한 리뷰 레코드"""
+    initial = []
+    if include_initial:
+        try:
+            initial = parse_apollo_state(driver.execute_script("return window.__APOLLO_STATE__ || null;"))
+        except Exception:
+            initial = []
+    captured = [r for body in drain_review_payloads(driver) for r in parse_review_payload(body)]
+    return merge_records(initial, captured)
+
+
+# -----------------------------
+# HAR 픽스처
+# -----------------------------
+def iter_har_payloads(har_path: str) -> Iterator[Any]:
+    """녹화한 HAR 파일에서 리뷰 API 응답 본문(JSON)만 꺼냄"""
+    with open(har_path, encoding="utf-8") as f:
+        har = json.load(f)
+    for e in (har.get("log") or {}).get("entries") or []:
+        if not _is_review_url((e.get("request") or {}).get("url")):
+            continue
+        content = (e.get("response") or {}).get("content") or {}
+        text = content.get("text")
+        if not text:
+            continue
+        if content.get("encoding") == "base64":
+            text = base64.b64decode(text).decode("utf-8", "replace")
+        try:
+            yield json.loads(text)
+        except ValueError:
+            continue
+
+
+def records_from_har(har_path: str) -> List[Dict[str, Any]]:
+    return merge_records(*(parse_review_payload(b) for b in iter_har_payloads(har_path)))
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="HAR → 리뷰 레코드/태그 집계 (네트워크 캡처 파서 검증)")
+    ap.add_argument("--har", required=True)
+    ap.add_argument("--show", type=int, default=3, help="앞에서 몇 건 출력")
+    args = ap.parse_args(argv)
+
+    from collections import Counter
+    recs = records_from_har(args.har)
+    counts = Counter(t for r in recs for t in r["tags"])
+    print(f"[HAR] {len(recs)} reviews, {len(counts)} tags")
+    for r in recs[:args.show]:
+        print(json.dumps(r, ensure_ascii=False))
+    for tag, n in counts.most_common(10):
+        print(f"  {n:>5}  {tag}")
+    return 0 if recs else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
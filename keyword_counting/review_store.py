@@ -0,0 +1,73 @@
+# review_store.py — 가게별 리뷰 누적 저장소 (append-only JSONL) + 워터마크
+# naver_place_crolling.fetch_reviews 는 매번 리뷰 전체를 새 타임스탬프 파일로 받아서,
+# 매일 갱신해도 가게마다 '더보기' 50번을 다시 눌렀다.
+# 증분 모드(--incremental, sort=recent)에서는
+#  - 이미 저장된 리뷰의 review_key 집합 + 워터마크(지난 크롤의 최신 리뷰 키 몇 개)를 기준으로
+#  - 본 적 있는 리뷰가 STOP_AFTER_SEEN 개 나오면 클릭을 멈추고
+#  - 새 리뷰만 outputs/review_store/{place_id}.jsonl 에 이어 붙인다.
+#
+# {place_id}.jsonl       : 리뷰 1건 = 1줄 (review_key, fetched_at 포함), 지우지 않고 계속 append
+# {place_id}.meta.json   : {"head": [최신 리뷰 키...], "crawled_at": "...", "sort": "recent", "added": 3, "clicks": 1}
+from __future__ import annotations
+import os, re, json, time, hashlib
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+DEFAULT_STORE_DIR = Path("./outputs/review_store")
+WATERMARK_SIZE = 20     # 워터마크에 남길 최신 리뷰 키 수
+STOP_AFTER_SEEN = 3     # 본 리뷰가 이만큼 나오면 '따라잡았다'고 판단 (고정/상단 노출 리뷰 1~2개에 속지 않도록)
+
+
+def review_key(nickname: str, content: str) -> str | None:
+    """리뷰 식별 키 (작성자 + 본문 앞부분 해시). 둘 다 비어 있으면 None → 중복 판정 안 함"""
+    nick = re.sub(r"\s+", " ", nickname or "").strip()
+    body = re.sub(r"\s+", " ", content or "").strip()[:200]
+    if not nick and not body:
+        return None
+    return hashlib.sha1(f"{nick}\x1f{body}".encode("utf-8")).hexdigest()[:16]
+
+
+class ReviewStore:
+    def __init__(self, place_id: str, store_dir: str | Path = DEFAULT_STORE_DIR):
+        self.place_id = str(place_id)
+        self.dir = Path(store_dir)
+        self.path = self.dir / f"{self.place_id}.jsonl"
+        self.meta_path = self.dir / f"{self.place_id}.meta.json"
+
+    def watermark(self) -> Dict[str, Any]:
+        try:
+            with open(self.meta_path, encoding="utf-8") as f:
+                doc = json.load(f)
+            return doc if isinstance(doc, dict) else {}
+        except Exception:
+            return {}
+
+    def known_keys(self) -> Set[str]:
+        """저장소의 모든 review_key + 워터마크 head (저장소 파일이 지워졌어도 head 까지는 멈춤 기준으로 씀)"""
+        keys = set(self.watermark().get("head") or [])
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        k = json.loads(line).get("review_key")
+                    except ValueError:
+                        continue                  # 중단으로 잘린 마지막 줄
+                    if k:
+                        keys.add(k)
+        except FileNotFoundError:
+            pass
+        return keys
+
+    def save_watermark(self, new_keys: List[str], **meta):
+        """이번에 새로 받은 키(최신순)를 기존 head 앞에 붙여 WATERMARK_SIZE 개만 유지, 원자적 교체"""
+        old = self.watermark()
+        head = list(dict.fromkeys(list(new_keys) + list(old.get("head") or [])))[:WATERMARK_SIZE]
+        doc = {"place_id": self.place_id, "head": head,
+               "crawled_at": time.strftime("%Y-%m-%d %H:%M:%S"), **meta}
+        self.dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.meta_path.with_name(f".{self.meta_path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(doc, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, self.meta_path)
@@ -0,0 +1,95 @@
+# scope_memo.py — place_id 별로 "어느 URL 스코프/모드가 통했는지" 기억하는 메모 (JSON)
+# build_review_urls 는 항상 /restaurant/{id} → /place/{id} 순서라서, 실제로는 /place/ 인 가게는
+# 매번 페이지 로드 + WebDriverWait(12) 타임아웃을 한 번씩 버린다.
+# 성공한 스코프를 기록해두고 다음 실행부터 그 URL 을 맨 앞으로 돌린다 (틀렸으면 나머지로 자연 폴백).
+# 배치는 가게별로 통한 모드(summary/chips)도 같이 기록해서 summary 가 안 되는 가게는 바로 chips 로 간다.
+#
+# {"31751923": {"chips": "restaurant", "summary": "restaurant", "mode": "summary", "updated_at": "..."}}
+# 저장 시 파일을 다시 읽어 내 변경분만 덮어쓰고 교체 → 병렬 워커가 각자 저장해도 서로의 기록이 안 지워짐
+from __future__ import annotations
+import os, json, time
+from pathlib import Path
+from typing import Dict, List
+from urllib.parse import urlparse
+
+DEFAULT_MEMO_PATH = Path("./outputs/scope_memo.json")
+
+
+def scope_of(url: str) -> str:
+    """https://m.place.naver.com/restaurant/123/review/... → 'restaurant'"""
+    parts = [p for p in urlparse(url).path.split("/") if p]
+    return parts[0] if parts else ""
+
+
+class ScopeMemo:
+    def __init__(self, path: str | Path = DEFAULT_MEMO_PATH):
+        self.path = Path(path)
+        self._data: Dict[str, dict] | None = None
+        self._dirty: Dict[str, dict] = {}
+
+    def _load_file(self) -> Dict[str, dict]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                doc = json.load(f)
+            return doc if isinstance(doc, dict) else {}
+        except Exception:
+            return {}
+
+    @property
+    def data(self) -> Dict[str, dict]:
+        if self._data is None:
+            self._data = self._load_file()
+        return self._data
+
+    def get(self, place_id: str, key: str) -> str | None:
+        return (self.data.get(str(place_id)) or {}).get(key)
+
+    def _set(self, place_id: str, key: str, value: str):
+        pid = str(place_id)
+        if self.get(pid, key) == value:
+            return
+        entry = self.data.setdefault(pid, {})
+        entry[key] = value
+        entry["updated_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        self._dirty.setdefault(pid, {}).update({key: value, "updated_at": entry["updated_at"]})
+
+    # -----------------------------
+    # URL 스코프 (kind = "chips": 리뷰 목록 페이지 — naver_place_crolling 도 이 기본값 / "summary": 리뷰 요약 페이지)
+    # -----------------------------
+    def order(self, place_id: str, urls: List[str], kind: str = "chips") -> List[str]:
+        """기억해둔 스코프의 URL 을 맨 앞으로 (나머지 순서는 유지)"""
+        known = self.get(place_id, kind)
+        if not known:
+            return list(urls)
+        return sorted(urls, key=lambda u: scope_of(u) != known)
+
+    def record(self, place_id: str, url: str, kind: str = "chips"):
+        scope = scope_of(url)
+        if scope:
+            self._set(place_id, kind, scope)
+
+    # -----------------------------
+    # 배치 모드 (summary / chips / network)
+    # -----------------------------
+    def mode(self, place_id: str) -> str | None:
+        return self.get(place_id, "mode")
+
+    def record_mode(self, place_id: str, mode: str):
+        self._set(place_id, "mode", mode)
+
+    # -----------------------------
+    # 저장
+    # -----------------------------
+    def save(self):
+        if not self._dirty:
+            return
+        doc = self._load_file()                 # 다른 프로세스가 그 사이 저장한 것과 병합
+        for pid, upd in self._dirty.items():
+            doc.setdefault(pid, {}).update(upd)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(doc, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, self.path)
+        self._data = doc
+        self._dirty.clear()
@@ -0,0 +1,198 @@
+# selector_registry.py — 셀렉터 후보를 최근 적중률 순으로 시도하는 레지스트리
+# find_element(XPATH)가 없는 요소를 찾으면 implicit wait(8~10초)만큼 블록된다.
+# 여기서는 조회 동안 implicit wait를 0으로 내리고(find_elements 사용), 후보별 적중/실패/지연을 기록해
+# 가장 잘 맞는 전략을 먼저 시도한다.
+#
+# 전략 = (by, value, text)
+#   by   : "xpath" | "css" | "js"
+#   text : 요소 텍스트에 포함돼야 하는 문자열 (CSS는 텍스트 매칭이 안 되므로 여기서 거름), 없으면 None
+#   "js" 는 value(CSS) + text 필터 + 가시성 검사를 페이지 안에서 한 번에 수행 (요소마다 .text/.is_displayed
+#   왕복이 없음) — 전수조사형 폴백은 이걸로 쓰는 게 좋다.
+#
+# 루트 스크립트와 keyword_counting/ 양쪽에서 같이 씀 → selenium 외 의존성 없음
+from __future__ import annotations
+import os, json, time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from selenium.webdriver.common.by import By
+
+from page_scripts import FIND_BY_TEXT_JS
+
+_BY = {"xpath": By.XPATH, "css": By.CSS_SELECTOR}
+
+Strategy = Tuple[str, str, Optional[str]]
+
+
+@contextmanager
+def zero_implicit_wait(driver):
+    """조회하는 동안만 implicit wait = 0 (끝나면 원래 값 복구)"""
+    try:
+        prev = driver.timeouts.implicit_wait
+    except Exception:
+        prev = None
+    driver.implicitly_wait(0)
+    try:
+        yield
+    finally:
+        if prev:
+            driver.implicitly_wait(prev)
+
+
+class SelectorRegistry:
+    def __init__(self, name: str, strategies: List[Strategy], window: int = 20,
+                 stats_path: str | Path | None = None):
+        self.name = name
+        self.strategies = [(by, value, text) for by, value, text in strategies]
+        self.window = window
+        self.stats_path = Path(stats_path) if stats_path else None
+        self._recent: Dict[str, deque] = {}
+        self.stats: Dict[str, Dict[str, float]] = {}
+        # 마지막 load/save 이후 이 프로세스에서 쌓인 몫 (save 때 디스크 값에 더함)
+        self._delta: Dict[str, Dict[str, float]] = {}
+        self._fresh: Dict[str, List[int]] = {}
+        for s in self.strategies:
+            k = self.key(s)
+            self._recent[k] = deque(maxlen=window)
+            self.stats[k] = self._zero()
+            self._delta[k] = self._zero()
+            self._fresh[k] = []
+        if self.stats_path and self.stats_path.exists():
+            self.load(self.stats_path)
+
+    @staticmethod
+    def _zero() -> Dict[str, float]:
+        return {"hits": 0, "misses": 0, "total_ms": 0.0}
+
+    @staticmethod
+    def key(strategy: Strategy) -> str:
+        by, value, text = strategy
+        return f"{by}:{value}" + (f" ~'{text}'" if text else "")
+
+    # -----------------------------
+    # 순위/기록
+    # -----------------------------
+    def _score(self, idx_strategy):
+        idx, s = idx_strategy
+        k = self.key(s)
+        recent = self._recent[k]
+        hit_rate = (sum(recent) + 1) / (len(recent) + 2)      # 라플라스 보정: 안 써본 전략은 0.5
+        st = self.stats[k]
+        n = st["hits"] + st["misses"]
+        avg_ms = st["total_ms"] / n if n else 0.0
+        return (-hit_rate, avg_ms, idx)
+
+    def ranked(self) -> List[Strategy]:
+        return [s for _, s in sorted(enumerate(self.strategies), key=self._score)]
+
+    def record(self, strategy: Strategy, hit: bool, ms: float):
+        k = self.key(strategy)
+        self._recent[k].append(1 if hit else 0)
+        self._fresh[k].append(1 if hit else 0)
+        for st in (self.stats[k], self._delta[k]):
+            st["hits" if hit else "misses"] += 1
+            st["total_ms"] += ms
+
+    # -----------------------------
+    # 조회
+    # -----------------------------
+    def _try(self, driver, root, strategy: Strategy, displayed_only: bool):
+        by, value, text = strategy
+        if by == "js":
+            return driver.execute_script(FIND_BY_TEXT_JS, None if root is driver else root, value, text or "")
+        for el in root.find_elements(_BY[by], value):
+            try:
+                if text and text not in (el.text or ""):
+                    continue
+                if displayed_only and not el.is_displayed():
+                    continue
+                return el
+            except Exception:
+                continue
+        return None
+
+    def find(self, driver, root=None, displayed_only: bool = True):
+        """순위대로 후보를 0-wait로 시도, 처음 맞는 요소(없으면 None)"""
+        root = root or driver
+        with zero_implicit_wait(driver):
+            for s in self.ranked():
+                t0 = time.perf_counter()
+                try:
+                    el = self._try(driver, root, s, displayed_only)
+                except Exception:
+                    el = None
+                self.record(s, el is not None, (time.perf_counter() - t0) * 1000)
+                if el is not None:
+                    return el
+        return None
+
+    # -----------------------------
+    # 통계
+    # -----------------------------
+    def report(self) -> List[Dict[str, object]]:
+        out = []
+        for s in self.ranked():
+            k = self.key(s)
+            st = self.stats[k]
+            n = st["hits"] + st["misses"]
+            out.append({
+                "selector": k,
+                "hits": int(st["hits"]),
+                "misses": int(st["misses"]),
+                "hit_rate": round(st["hits"] / n, 3) if n else None,
+                "avg_ms": round(st["total_ms"] / n, 1) if n else None,
+            })
+        return out
+
+    def print_report(self):
+        print(f"[SELECTOR] {self.name}")
+        for r in self.report():
+            print(f"  {r['hits']:>4} hit / {r['misses']:>4} miss  avg {r['avg_ms']} ms  {r['selector']}")
+
+    def save(self, path: str | Path | None = None):
+        """
+        디스크의 기록과 병합해서 저장 (scope_memo.ScopeMemo.save 와 같은 방식)
+        같은 파일을 후보 목록이 다른 레지스트리(루트 스크립트/keyword_counting)와 --workers 프로세스들이 같이 쓰므로
+        내 후보에 없는 키는 그대로 두고, 내 후보 키는 디스크 값에 '지난 저장 이후 내가 쌓은 몫'만 더함
+        (시작할 때 읽은 값 + 내 몫으로 덮으면 그 사이 다른 워커가 저장한 기록이 사라짐).
+        """
+        path = Path(path or self.stats_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(path, encoding="utf-8") as f:
+                doc = json.load(f)
+            if not isinstance(doc, dict):
+                doc = {}
+        except Exception:
+            doc = {}
+        for k in self.stats:
+            disk = doc.get(k) if isinstance(doc.get(k), dict) else {}
+            d = self._delta[k]
+            recent = (list(disk.get("recent") or []) + self._fresh[k])[-self.window:]
+            doc[k] = {"hits": disk.get("hits", 0) + d["hits"], "misses": disk.get("misses", 0) + d["misses"],
+                      "total_ms": disk.get("total_ms", 0.0) + d["total_ms"], "recent": recent}
+            # 저장한 값(다른 워커 몫 포함)을 이후 순위에도 쓰고, 내 몫은 비움 → 다시 save 해도 두 번 더하지 않음
+            self.stats[k] = {n: doc[k][n] for n in ("hits", "misses", "total_ms")}
+            self._recent[k] = deque(recent, maxlen=self.window)
+            self._delta[k] = self._zero()
+            self._fresh[k] = []
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(doc, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, path)
+
+    def load(self, path: str | Path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                doc = json.load(f)
+        except Exception:
+            return
+        for k, st in doc.items():
+            if k not in self.stats:
+                continue                          # 내 후보가 아닌 키 (다른 스크립트의 후보/옛 후보): 읽지만 않고 save 때 보존
+            self.stats[k] = {"hits": st.get("hits", 0) + self._delta[k]["hits"],
+                             "misses": st.get("misses", 0) + self._delta[k]["misses"],
+                             "total_ms": st.get("total_ms", 0.0) + self._delta[k]["total_ms"]}
+            self._recent[k] = deque(list(st.get("recent", [])) + self._fresh[k], maxlen=self.window)
@@ -0,0 +1,255 @@
+# tab_crawler.py — 브라우저 하나에서 여러 리뷰 탭을 번갈아 돌리는 chips 크롤 엔진
+#---호출법---#
+# python tab_crawler.py --place_list place_list.csv --tabs 4 --headless
+# python tab_crawler.py --place_list place_list.csv --tabs 4 --start 0 --end 100 --headless
+#
+# Chrome 프로세스 하나가 가게 하나만 처리하면 '더보기' 응답을 기다리는 동안 놀게 된다.
+# 여기서는 탭 N개에 가게를 하나씩 올려두고 라운드로빈으로 돌면서,
+#   탭마다 page_scripts.TAB_STEP_JS 한 번(상태 확인 + '더보기' 클릭, 기다리지 않음)만 실행한다.
+# 한 탭의 네트워크 대기가 다른 탭의 클릭/추출과 겹치므로 같은 브라우저에서 처리량이 늘어난다.
+# 탭이 끝나면 '+N' 칩 펼치기 → 리뷰 추출 → tag_counts JSON 저장 후 다음 가게를 그 탭에 올린다.
+from __future__ import annotations
+import time, argparse
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+import make_place_profile as mpp
+from browser_profile import MULTI_TAB_ARGS, apply_request_blocking, emulate_mobile, make_chrome
+from page_scripts import REVIEW_LI_SELECTOR, TAB_STEP_JS, click_plus_chips
+from page_waits import wait_until_quiet
+
+Job = Tuple[str, str, List[str]]          # (place_id, store_name, cuisine)
+
+
+class _Tab:
+    def __init__(self, handle: str):
+        self.handle = handle
+        self.job: Job | None = None
+        self.urls: List[str] = []
+        self.url_idx = 0
+        self.t0 = 0.0
+        self.nav_at = 0.0
+        self.loaded_at: float | None = None
+        self.clicks = 0
+        self.last_count = 0
+        self.last_change = 0.0
+
+
+class TabCrawler:
+    def __init__(self, driver, tabs: int = 4, sort: str = "recent", max_clicks: int = 60,
+                 dedup_within_row: bool = True, out_dir: str = "./outputs/places_json",
+                 load_timeout: float = 12.0, click_wait_ms: int = 8000, stall_sec: float = 10.0,
+                 poll: float = 0.03):
+        self.driver = driver
+        self.n_tabs = max(int(tabs), 1)
+        self.sort = sort
+        self.max_clicks = max_clicks
+        self.dedup_within_row = dedup_within_row
+        self.out_dir = out_dir
+        self.load_timeout = load_timeout
+        self.click_wait_ms = click_wait_ms
+        self.stall_sec = stall_sec
+        self.poll = poll
+        self.tabs: List[_Tab] = []
+
+    # -----------------------------
+    # 탭 준비
+    # -----------------------------
+    def _open_tabs(self):
+        d = self.driver
+        handles = [d.current_window_handle]
+        for _ in range(self.n_tabs - 1):
+            d.switch_to.new_window("tab")
+            handles.append(d.current_window_handle)
+        for h in handles:
+            d.switch_to.window(h)
+            apply_request_blocking(d)              # CDP 차단/에뮬레이션은 탭(타깃) 단위
+            emulate_mobile(d)
+        self.tabs = [_Tab(h) for h in handles]
+
+    def warm_up(self) -> int:
+        """탭을 미리 열어 둠 (run() 도 필요하면 부르지만, 벤치에서 탭 여는 시간을 빼고 싶을 때) → 탭 수"""
+        if not self.tabs:
+            self._open_tabs()
+        return len(self.tabs)
+
+    def _navigate(self, tab: _Tab):
+        url = tab.urls[tab.url_idx]
+        tab.nav_at = time.time()
+        tab.loaded_at = None
+        tab.clicks = tab.last_count = 0
+        if mpp.RATE_LIMITER is not None:
+            mpp.RATE_LIMITER.wait(url)
+        # driver.get 은 로딩 완료까지 블록 → location 변경으로 비동기 이동 (이전 문서엔 __leaving 표시)
+        self.driver.execute_script("window.__leaving = true; window.location.href = arguments[0];", url)
+
+    def _start(self, tab: _Tab, job: Job):
+        self.driver.switch_to.window(tab.handle)
+        tab.job = job
+        tab.urls = mpp.SCOPE_MEMO.order(job[0], mpp.build_review_urls(job[0], sort=self.sort))
+        tab.url_idx = 0
+        tab.t0 = time.time()
+        self._navigate(tab)
+
+    # -----------------------------
+    # 종료 처리
+    # -----------------------------
+    def _result(self, tab: _Tab, status: str, json_path: str = "", reviews: int = 0, error: str = "") -> dict:
+        place_id, store_name, _ = tab.job
+        r = {"place_id": place_id, "store_name": store_name, "status": status, "json_path": json_path,
+             "reviews": reviews, "clicks": tab.clicks, "sec": round(time.time() - tab.t0, 2), "error": error}
+        tab.job = None
+        return r
+
+    def _next_url_or_fail(self, tab: _Tab, err: str) -> dict | None:
+        tab.url_idx += 1
+        if tab.url_idx < len(tab.urls):
+            self._navigate(tab)
+            return None
+        print(f"[FAIL/TAB] {tab.job[1]} ({tab.job[0]}) -> {err}")
+        return self._result(tab, "FAIL", error=err)
+
+    def _finish(self, tab: _Tab, stop_reason: str) -> dict | None:
+        """stop_reason: exhausted(더보기 없음) / max_clicks / stalled — Selenium chips 경로와 같은 값"""
+        place_id, store_name, cuisine = tab.job
+        d = self.driver
+        for _ in range(3):
+            if not click_plus_chips(d):
+                break
+            wait_until_quiet(d, idle_ms=150, timeout=1.0)
+        rows = mpp.dedup_reviews(mpp.collect_review_rows(d, place_id=place_id, cuisine=cuisine, store_name=store_name))
+        if not rows:
+            return self._next_url_or_fail(tab, "리뷰/태그 요소를 찾지 못했어요.")
+        mpp.SCOPE_MEMO.record(place_id, tab.urls[tab.url_idx])
+        counts = mpp.count_tags(rows, dedup_within_row=self.dedup_within_row)
+        # reviews = 이번에 펼쳐서 모은 행 수, review_total = 가게 전체 리뷰 수 (fetch_chips 의 meta 와 같은 모양)
+        meta = {"mode": "chips", "stop_reason": stop_reason, "clicks": tab.clicks, "reviews": len(rows)}
+        review_total = mpp.read_review_total(d)
+        if review_total is not None:
+            meta["review_total"] = review_total
+        out_json = mpp.save_store_tag_json(place_id, cuisine, store_name, counts, out_dir=self.out_dir, meta=meta)
+        print(f"[OK/TAB] {store_name} ({place_id}) -> {out_json}  "
+              f"({len(rows)} reviews, {tab.clicks} clicks, stop={stop_reason})")
+        return self._result(tab, "OK", json_path=out_json, reviews=len(rows))
+
+    # -----------------------------
+    # 한 탭 한 스텝
+    # -----------------------------
+    def _step(self, tab: _Tab) -> Tuple[bool, dict | None]:
+        """→ (이번 스텝에서 진전이 있었는지, 끝났으면 결과 dict)"""
+        d = self.driver
+        d.switch_to.window(tab.handle)
+        allow_click = tab.clicks < self.max_clicks
+        st = d.execute_script(TAB_STEP_JS, REVIEW_LI_SELECTOR, self.click_wait_ms, allow_click)
+        now = time.time()
+
+        if tab.loaded_at is None:
+            if st["ready"] and st["count"] > 0:
+                tab.loaded_at = tab.last_change = now
+                tab.last_count = st["count"]
+                return True, None
+            if now - tab.nav_at > self.load_timeout:
+                return True, self._next_url_or_fail(tab, "리뷰 목록 로딩 시간 초과")
+            return False, None
+
+        progressed = False
+        if st["clicked"]:
+            tab.clicks += 1
+            progressed = True
+        if st["count"] != tab.last_count:
+            tab.last_count, tab.last_change = st["count"], now
+            progressed = True
+
+        finished = st["ready"] and not st["loading"] and (not st["button"] or not allow_click)
+        stalled = now - tab.last_change > self.stall_sec
+        if finished:
+            return True, self._finish(tab, "max_clicks" if st["button"] else "exhausted")
+        if stalled:
+            return True, self._finish(tab, "stalled")
+        return progressed, None
+
+    # -----------------------------
+    # 실행
+    # -----------------------------
+    def run(self, jobs: Iterable[Job], on_result=None) -> List[Dict[str, Any]]:
+        self.warm_up()
+        pending = deque(jobs)
+        results: List[Dict[str, Any]] = []
+
+        def done(r):
+            if r is not None:
+                results.append(r)
+                if on_result:
+                    on_result(r)
+
+        while True:
+            active = progressed = False
+            for tab in self.tabs:
+                if tab.job is None:
+                    if not pending:
+                        continue
+                    self._start(tab, pending.popleft())
+                active = True
+                try:
+                    p, r = self._step(tab)
+                except Exception as e:
+                    p, r = True, self._next_url_or_fail(tab, f"{type(e).__name__}: {e}")
+                progressed |= p
+                done(r)
+            if not active:
+                break
+            if not progressed:
+                time.sleep(self.poll)          # 모든 탭이 네트워크 대기 중 → 잠깐 쉼
+        return results
+
+
+def make_tab_driver(headless: bool = False):
+    return make_chrome(headless=headless, lean=True, mobile=True, implicit_wait=0,
+                       page_load_timeout=20, extra_args=MULTI_TAB_ARGS)
+
+
+def read_jobs(path: str, start: int | None = None, end: int | None = None) -> List[Job]:
+    from create_profiles_final import _open_csv_with_fallback     # 엑셀 저장본(cp949)도 읽도록 배치와 같은 방식
+    f, reader = _open_csv_with_fallback(Path(path))
+    with f:
+        rows = list(reader)
+    rows = rows[(start or 0):end]
+    jobs = []
+    for row in rows:
+        place_id = (row.get("place_id") or "").strip()
+        store_name = (row.get("store_name") or row.get("name") or "").strip()
+        cuisine_raw = (row.get("cuisine") or "").strip()
+        if place_id and store_name:
+            jobs.append((place_id, store_name, mpp.parse_cuisine_tokens([cuisine_raw]) if cuisine_raw else []))
+    return jobs
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="탭 멀티플렉싱 chips 크롤 (브라우저 1개, 탭 N개)")
+    ap.add_argument("--place_list", default="place_list.csv")
+    ap.add_argument("--tabs", type=int, default=4)
+    ap.add_argument("--start", type=int, default=None)
+    ap.add_argument("--end", type=int, default=None)
+    ap.add_argument("--max_clicks", type=int, default=60)
+    ap.add_argument("--headless", action="store_true")
+    args = ap.parse_args(argv)
+
+    jobs = read_jobs(args.place_list, args.start, args.end)
+    driver = make_tab_driver(headless=args.headless)
+    t0 = time.time()
+    try:
+        results = TabCrawler(driver, tabs=args.tabs, max_clicks=args.max_clicks).run(jobs)
+    finally:
+        driver.quit()
+        mpp.SCOPE_MEMO.save()
+    ok = sum(r["status"] == "OK" for r in results)
+    minutes = (time.time() - t0) / 60
+    print("-" * 60)
+    print(f"Done. 총 {len(results)} / 성공 {ok} / 실패 {len(results) - ok}  "
+          f"({len(results) / minutes if minutes else 0:.1f} places/min, tabs={args.tabs})")
+    return 0 if ok == len(results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
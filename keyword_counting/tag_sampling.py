@@ -0,0 +1,70 @@
+# tag_sampling.py — chips 샘플링 모드: 태그 분포가 수렴하면 '더보기'를 그만 누름
+# 인기 가게는 max_clicks(60)번을 다 눌러도 태그 비율은 처음 몇백 건 이후로 거의 안 변한다.
+# 리뷰가 들어올 때마다 "태그를 단 리뷰 비율"(태그 수 / 리뷰 수)을 다시 계산해서
+#  - 직전 대비 모든 태그의 비율 변화(최대 절대값)가 tol 미만인 상태가 patience 번 연속이면 → "converged"
+#  - 리뷰 수가 target_reviews 에 도달하면 → "target_reached"
+# 멈추고, 그 이유를 결과 JSON(meta.stop_reason)에 남긴다.
+from __future__ import annotations
+from collections import Counter
+from typing import Any, Dict, Iterable, List
+
+
+class TagSampler:
+    def __init__(self, tol: float = 0.01, patience: int = 3, min_reviews: int = 30,
+                 target_reviews: int | None = None, dedup_within_row: bool = True):
+        self.tol = float(tol)
+        self.patience = max(int(patience), 1)
+        self.min_reviews = int(min_reviews)
+        self.target_reviews = target_reviews
+        self.dedup_within_row = dedup_within_row
+        self.counts: Counter = Counter()
+        self.rows: List[Dict[str, Any]] = []
+        self.stop_reason: str | None = None
+        self.last_delta: float | None = None
+        self._seen = set()
+        self._prev: Dict[str, float] = {}
+        self._stable = 0
+
+    @property
+    def n_reviews(self) -> int:
+        return len(self.rows)
+
+    def proportions(self) -> Dict[str, float]:
+        n = self.n_reviews or 1
+        return {t: c / n for t, c in self.counts.items()}
+
+    def update(self, rows: Iterable[Dict[str, Any]]) -> bool:
+        """새로 들어온 리뷰 행 반영 → 계속 펼쳐야 하면 True, 멈출 때가 됐으면 False"""
+        added = 0
+        for r in rows:
+            k = r.get("review_key")
+            if k:
+                if k in self._seen:
+                    continue
+                self._seen.add(k)
+            tags = [t.strip() for t in (r.get("option_tags") or []) if str(t).strip()]
+            self.counts.update(set(tags) if self.dedup_within_row else tags)
+            self.rows.append(r)
+            added += 1
+        if not added:
+            return self.stop_reason is None
+
+        cur = self.proportions()
+        if self._prev:
+            keys = set(cur) | set(self._prev)
+            self.last_delta = max(abs(cur.get(t, 0.0) - self._prev.get(t, 0.0)) for t in keys)
+            self._stable = self._stable + 1 if self.last_delta < self.tol else 0
+        self._prev = cur
+
+        if self.target_reviews and self.n_reviews >= self.target_reviews:
+            self.stop_reason = "target_reached"
+        elif self.n_reviews >= self.min_reviews and self._stable >= self.patience:
+            self.stop_reason = "converged"
+        return self.stop_reason is None
+
+    def meta(self) -> Dict[str, Any]:
+        return {
+            "tol": self.tol, "patience": self.patience, "min_reviews": self.min_reviews,
+            "target_reviews": self.target_reviews, "reviews": self.n_reviews,
+            "last_delta": round(self.last_delta, 5) if self.last_delta is not None else None,
+        }
@@ -0,0 +1,15 @@
+# keyword_counting 모듈들은 서로를 평평하게 import 함 (python create_profiles_final.py 처럼 폴더 안에서 실행)
+# → 테스트도 keyword_counting/ 를 import 경로에 넣고 같은 방식으로 불러온다.
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+@pytest.fixture
+def fixtures_dir() -> Path:
+    return FIXTURES
@@ -0,0 +1,57 @@
+# create_profiles_final 의 async 경로 — HTTP 우선 시도가 --concurrency 안에서 도는지 (브라우저 불필요)
+# + _mode_order: 메모된 모드를 지금 드라이버 설정으로 돌릴 수 있는지
+import asyncio
+import threading
+import time
+
+import pytest
+
+import create_profiles_final as cpf
+import make_place_profile as mpp
+from async_engine import AsyncEngine
+from scope_memo import ScopeMemo
+
+
+def test_http_first_is_bounded_by_engine_concurrency(monkeypatch):
+    state = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def fake_try_http(place_id, store_name, cuisine_raw, cuisine_tokens):
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+        time.sleep(0.05)
+        with lock:
+            state["now"] -= 1
+        return cpf._summary_row(place_id, store_name, cuisine_raw, json_path=f"{place_id}.json", mode_used="summary/http")
+
+    monkeypatch.setattr(cpf, "_try_http", fake_try_http)
+    monkeypatch.setattr(cpf, "_record_review_total", lambda *a, **kw: None)
+    monkeypatch.setattr(cpf, "TRY_HTTP_FIRST", True)
+    monkeypatch.setattr(cpf, "REFRESH_CHANGED", False)
+    monkeypatch.setattr(cpf, "DEADLINE", None)
+    monkeypatch.setattr(cpf, "CONTROLLER", None)
+
+    async def main():
+        engine = AsyncEngine(concurrency=2)             # 브라우저는 안 띄움 (HTTP 로 끝나는 가게만)
+        return await asyncio.gather(*(cpf.crawl_guarded_async(engine, str(i), f"가게{i}", "치킨") for i in range(8)))
+
+    rows = asyncio.run(main())
+    assert [r["status"] for r in rows] == ["OK"] * 8
+    assert state["peak"] == 2
+
+
+@pytest.mark.parametrize("memo, mode, expected", [
+    ("network", "summary", ["summary", "chips"]),     # perf_log 없는 드라이버 → network 건너뜀
+    ("network", "network", ["network", "chips"]),
+    ("chips", "summary", ["chips", "summary"]),
+    (None, "summary", ["summary", "chips"]),
+])
+def test_mode_order_skips_modes_driver_cannot_run(tmp_path, monkeypatch, memo, mode, expected):
+    memo_store = ScopeMemo(tmp_path / "scope_memo.json")
+    if memo:
+        memo_store.record_mode("1", memo)
+    monkeypatch.setattr(mpp, "SCOPE_MEMO", memo_store)
+    monkeypatch.setattr(cpf, "MODE", mode)
+    monkeypatch.setattr(cpf, "FALLBACK_TO_CHIPS_ON_FAIL", True)
+    assert cpf._mode_order("1") == expected
@@ -0,0 +1,31 @@
+# browser_profile.BLOCKED_URL_PATTERNS — CDP Network.setBlockedURLs 와일드카드('*' 만 특수문자)로 매칭
+import re
+
+import pytest
+
+from browser_profile import BLOCKED_URL_PATTERNS
+
+
+def _blocked(url):
+    return any(re.fullmatch(".*".join(map(re.escape, p.split("*"))), url) for p in BLOCKED_URL_PATTERNS)
+
+
+@pytest.mark.parametrize("url", [
+    "https://ssl.pstatic.net/static/favicon.ico",
+    "https://ssl.pstatic.net/static/maps/m/logo.png?v=20261001",
+    "https://fonts.example.com/NanumGothic.woff2",
+    "https://search.pstatic.net/common/?src=https%3A%2F%2Fx.jpg&type=f180",
+    "https://wcs.naver.com/m?u=https://m.place.naver.com",
+])
+def test_static_assets_and_trackers_blocked(url):
+    assert _blocked(url)
+
+
+@pytest.mark.parametrize("url", [
+    "https://api.place.naver.com/graphql?q=.icon-list&id=1",                 # 쿼리 안의 ".ico"
+    "https://m.place.naver.com/restaurant/1/review/visitor?img=a.jpg.bak",
+    "https://pcmap-api.place.naver.com/place/graphql?fmt=.pngx",
+    "https://m.place.naver.com/restaurant/31751923/review/visitor?reviewSort=recent",
+])
+def test_api_and_review_pages_not_blocked(url):
+    assert not _blocked(url)
@@ -0,0 +1,116 @@
+# crawl_db — tmp_path 의 SQLite 파일로 스키마/재개 집합/리뷰 증가 속도(EWMA) 검증
+import datetime as dt
+import json
+import sqlite3
+
+import pytest
+
+import crawl_db
+from crawl_db import CrawlDB, read_profile
+
+
+def _profile(tmp_path, place_id, tags, **meta):
+    path = tmp_path / f"{place_id}_tags.json"
+    doc = {"place_id": place_id, "cuisine": ["치킨"], "store_name": f"가게{place_id}", "tag_counts": tags,
+           "meta": {"crawled_at": "2026-10-01T12:00:00", **meta}}
+    path.write_text(json.dumps(doc, ensure_ascii=False), encoding="utf-8")
+    return str(path)
+
+
+def _row(place_id, status="OK", json_path="", error="", elapsed_ms=1500):
+    return {"place_id": place_id, "store_name": f"가게{place_id}", "cuisine_raw": "치킨", "json_path": json_path,
+            "status": status, "error": error, "mode_used": "summary", "elapsed_ms": elapsed_ms}
+
+
+@pytest.fixture
+def db(tmp_path):
+    with CrawlDB(tmp_path / "crawl_state.sqlite") as d:
+        yield d
+
+
+def _backdate_ok(db, place_id, days):
+    """마지막 성공 시각을 days 일 전으로 (두 번째 기록에서 경과 시간이 생기게)"""
+    ts = (dt.datetime.now() - dt.timedelta(days=days)).isoformat(timespec="seconds")
+    with db.conn:
+        db.conn.execute("UPDATE places SET last_ok_at = ? WHERE place_id = ?", (ts, place_id))
+
+
+def test_schema_tables(db):
+    names = {r[0] for r in db.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert {"runs", "attempts", "places", "tags"} <= names
+
+
+def test_record_ok_fail_and_tags(db, tmp_path):
+    run = db.start_run(mode="summary", engine="selenium", start_row=0, end_row=3)
+    db.record(_row("1", json_path=_profile(tmp_path, "1", {"맛있어요": 5, "친절해요": 2}, review_total=40)), run_id=run)
+    db.record(_row("2", status="FAIL", error="Throttled: x"), run_id=run)
+    db.record(_row("2", status="FAIL", error="Throttled: x"), run_id=run)
+    p1, p2 = db.place("1"), db.place("2")
+    assert p1["status"] == "OK" and p1["review_total"] == 40 and p1["last_ok_at"]
+    assert p2["status"] == "FAIL" and p2["attempts"] == 2 and p2["fail_streak"] == 2 and p2["last_ok_at"] is None
+    assert db.tag_counts("1") == {"맛있어요": 5, "친절해요": 2}
+    assert len(db.history("2")) == 2
+    assert db.status_counts() == {"OK": 1, "FAIL": 1}
+
+    db.record(_row("2", json_path=_profile(tmp_path, "2", {"양이 많아요": 1})), run_id=run)
+    assert db.place("2")["fail_streak"] == 0                # 성공하면 연속 실패 초기화
+
+
+def test_resume_excludes_finished_places(db, tmp_path):
+    run = db.start_run(mode="summary", start_row=0, end_row=4)
+    db.record(_row("1", json_path=_profile(tmp_path, "1", {"a": 1})), run_id=run)
+    db.record(_row("2", status="SKIP"), run_id=run)
+    db.record(_row("3", status="FAIL", error="TimeoutException: x"), run_id=run)
+    assert db.last_unfinished_run()["run_id"] == run         # 중단됨 → --resume 대상
+    assert db.done_in_run(run) == {"1", "2"}                 # FAIL 은 다시 시도
+
+    db.finish_run(run, total=3, ok=1, fail=1, skip=1)
+    assert db.last_unfinished_run() is None
+    other = db.start_run()
+    assert db.done_in_run(other) == set()                    # 다른 실행의 기록은 안 섞임
+
+
+def test_velocity_from_two_totals_then_ewma(db, tmp_path):
+    db.record(_row("1", json_path=_profile(tmp_path, "1", {"a": 1}, review_total=100)))
+    assert db.place("1")["review_velocity"] is None          # 관측 1번으로는 모름
+
+    _backdate_ok(db, "1", 2)
+    db.record(_row("1", json_path=_profile(tmp_path, "1", {"a": 1}, review_total=110)))
+    assert db.place("1")["review_velocity"] == pytest.approx(5.0, rel=1e-3)    # 10건 / 2일
+
+    _backdate_ok(db, "1", 2)
+    db.record(_row("1", json_path=_profile(tmp_path, "1", {"a": 1}, review_total=140)))
+    expected = crawl_db.VELOCITY_ALPHA * 15.0 + (1 - crawl_db.VELOCITY_ALPHA) * 5.0
+    assert db.place("1")["review_velocity"] == pytest.approx(expected, rel=1e-3)
+
+
+def test_velocity_ignores_short_gap_and_failures(db, tmp_path):
+    db.record(_row("1", json_path=_profile(tmp_path, "1", {"a": 1}, review_total=100)))
+    db.record(_row("1", json_path=_profile(tmp_path, "1", {"a": 1}, review_total=130)))   # 0.5일 미만
+    assert db.place("1")["review_velocity"] is None
+    _backdate_ok(db, "1", 1)
+    db.record(_row("1", status="FAIL", error="x"))
+    assert db.place("1")["review_total"] == 130               # 실패는 총수/속도를 안 건드림
+
+
+def test_read_profile_uses_place_total_not_rows(tmp_path):
+    # meta.reviews = 이번에 펼친 행 수 → 가게 전체 리뷰 수로 쓰면 안 됨
+    assert read_profile(_profile(tmp_path, "1", {"a": 1}, reviews=60))["review_total"] is None
+    assert read_profile(_profile(tmp_path, "2", {"a": 1}, reviews=60, review_total=900))["review_total"] == 900
+    assert read_profile(_profile(tmp_path, "3", {"a": 1}, probe={"review_total": 77}))["review_total"] == 77
+    assert read_profile(tmp_path / "missing.json") == {}
+
+
+def test_migrates_old_places_table(tmp_path):
+    path = tmp_path / "old.sqlite"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE places (place_id TEXT PRIMARY KEY, store_name TEXT, cuisine_raw TEXT, status TEXT, "
+                 "mode_used TEXT, json_path TEXT, error TEXT, attempts INTEGER DEFAULT 0, fail_streak INTEGER DEFAULT 0, "
+                 "review_total INTEGER, last_elapsed_ms INTEGER, last_attempt_at TEXT, last_ok_at TEXT)")
+    conn.commit()
+    conn.close()
+    with CrawlDB(path) as db:
+        cols = {r["name"] for r in db.conn.execute("PRAGMA table_info(places)")}
+        assert {"review_velocity", "recommended"} <= cols
+        assert db.mark_recommended(["9"]) == 1
+        assert db.place("9")["recommended"] == 1
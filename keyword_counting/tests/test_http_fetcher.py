@@ -0,0 +1,85 @@
+# http_fetcher — fixtures/http 의 녹화 응답(RecordedTransport)으로 검증 (네트워크 불필요)
+#   1001: 리뷰 3건이 전부 SSR 에 들어있는 가게
+#   1002: 전체 120건 중 첫 2건만 SSR → chips 는 HttpIncomplete
+#   1003: 두 스코프 모두 HTTP 429
+#   1004: 두 스코프 모두 HTTP 403
+import json
+
+import pytest
+
+import create_profiles_final as cpf
+import http_fetcher as hf
+import make_place_profile as mpp
+import throttle
+from scope_memo import ScopeMemo
+from throttle import Throttled
+
+
+@pytest.fixture
+def transport(fixtures_dir):
+    return hf.RecordedTransport(str(fixtures_dir / "http"))
+
+
+@pytest.fixture(autouse=True)
+def _isolated(tmp_path, monkeypatch):
+    # 프로필 JSON(./outputs/places_json)과 스코프 메모가 작업 폴더를 건드리지 않게
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(mpp, "SCOPE_MEMO", ScopeMemo(tmp_path / "scope_memo.json"))
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_fetch_summary_http(transport):
+    out = hf.fetch_summary_http("1001", ["치킨"], "신통치킨", transport=transport)
+    doc = _read(out)
+    assert doc["tag_counts"] == {"음식이 맛있어요": 57, "양이 많아요": 31, "친절해요": 12}
+    assert doc["meta"]["review_total"] == 3
+    assert doc["cuisine"] == ["치킨"] and doc["store_name"] == "신통치킨"
+
+
+def test_fetch_chips_http_counts_embedded_reviews(transport):
+    out = hf.fetch_chips_http("1001", ["치킨"], "신통치킨", transport=transport)
+    doc = _read(out)
+    assert doc["tag_counts"] == {"음식이 맛있어요": 2, "양이 많아요": 1, "친절해요": 1}
+    assert doc["meta"]["review_total"] == 3
+
+
+def test_fetch_chips_http_incomplete_when_total_exceeds_embedded(transport):
+    with pytest.raises(hf.HttpIncomplete, match="2/120"):
+        hf.fetch_chips_http("1002", [], "큰 가게", transport=transport)
+
+
+def test_fetch_summary_http_still_works_for_partial_page(transport):
+    # summary 는 통계만 쓰므로 첫 페이지가 일부여도 됨
+    doc = _read(hf.fetch_summary_http("1002", [], "큰 가게", transport=transport))
+    assert doc["tag_counts"] == {"음식이 맛있어요": 80}
+    assert doc["meta"]["review_total"] == 120
+
+
+def test_http_429_maps_to_throttled(transport):
+    with pytest.raises(Throttled, match="HTTP 429"):
+        hf.fetch_summary_http("1003", [], "막힌 가게", transport=transport)
+    with pytest.raises(Throttled):
+        hf.fetch_chips_http("1003", [], "막힌 가게", transport=transport)
+
+
+def test_http_403_maps_to_throttled(transport):
+    with pytest.raises(Throttled, match="HTTP 403"):
+        hf.fetch_summary_http("1004", [], "막힌 가게", transport=transport)
+
+
+def test_try_http_403_is_fail_row_not_browser_fallback(transport, monkeypatch):
+    # None(→ 브라우저 폴백)이 아니라 FAIL 행 → 컨트롤러가 스로틀로 셈
+    monkeypatch.setattr(hf, "_DEFAULT_TRANSPORT", transport)
+    row = cpf._try_http("1004", "막힌 가게", "치킨", ["치킨"])
+    assert row is not None and row["status"] == "FAIL"
+    assert "HTTP 403" in row["error"]
+    assert throttle.outcome(row) == "throttled"
+
+
+def test_missing_recording_is_http_error(transport):
+    with pytest.raises(hf.HttpError, match="녹화된 응답 없음"):
+        hf.load_state("9999", transport=transport)
@@ -0,0 +1,88 @@
+# recrawl_scheduler — 점수(경과·속도·실패 백오프·추천) 와 --limit/--budget 컷 (표 기반)
+import datetime as dt
+
+import pytest
+
+import recrawl_scheduler as rs
+from crawl_db import CrawlDB
+
+NOW = dt.datetime(2026, 10, 18, 12, 0, 0)
+
+
+def _place(days_ago=None, total=None, velocity=None, recommended=0, status="OK", fail_streak=0,
+           attempt_hours_ago=None, elapsed_ms=None):
+    ts = lambda d: (NOW - d).isoformat(timespec="seconds")
+    return {"status": status, "fail_streak": fail_streak, "review_total": total, "review_velocity": velocity,
+            "recommended": recommended, "last_elapsed_ms": elapsed_ms,
+            "last_ok_at": ts(dt.timedelta(days=days_ago)) if days_ago is not None else None,
+            "last_attempt_at": ts(dt.timedelta(hours=attempt_hours_ago)) if attempt_hours_ago is not None else None}
+
+
+@pytest.mark.parametrize("higher, lower", [
+    # 추천 + 빠르게 느는 가게 > 오래됐지만 속도를 모르는 가게
+    (dict(place=_place(days_ago=10, total=100, velocity=5.0), recommended=True),
+     dict(place=_place(days_ago=60, total=100))),
+    # 한 번도 성공 못 한 가게가 맨 앞
+    (dict(place=None), dict(place=_place(days_ago=80, total=10, velocity=3.0))),
+    # 같은 조건이면 오래된 쪽
+    (dict(place=_place(days_ago=30, total=200, velocity=1.0)), dict(place=_place(days_ago=5, total=200, velocity=1.0))),
+    # 같은 경과·속도면 리뷰 적은 가게가 더 많이 변함
+    (dict(place=_place(days_ago=10, total=20, velocity=1.0)), dict(place=_place(days_ago=10, total=2000, velocity=1.0))),
+    # DB 의 추천 표시도 boost
+    (dict(place=_place(days_ago=10, total=100, recommended=1)), dict(place=_place(days_ago=10, total=100))),
+])
+def test_score_ordering(higher, lower):
+    assert rs.score(now=NOW, **higher) > rs.score(now=NOW, **lower)
+
+
+@pytest.mark.parametrize("place, excluded", [
+    (_place(days_ago=3, status="FAIL", fail_streak=1, attempt_hours_ago=2), True),      # 6h 백오프 중
+    (_place(days_ago=3, status="FAIL", fail_streak=1, attempt_hours_ago=7), False),     # 백오프 지남
+    (_place(days_ago=3, status="FAIL", fail_streak=3, attempt_hours_ago=20), True),     # 6h × 4 = 24h
+    (_place(days_ago=30, status="FAIL", fail_streak=10, attempt_hours_ago=24 * 6), True),   # 최대 7일
+    (_place(days_ago=30, status="FAIL", fail_streak=10, attempt_hours_ago=24 * 8), False),
+    (_place(days_ago=0.2, total=10), True),                                             # MIN_AGE_HOURS 안쪽
+])
+def test_backoff_and_recent_success_excluded(place, excluded):
+    assert (rs.score(place, NOW) <= 0) is excluded
+
+
+def test_profile_without_db_row_uses_crawled_at():
+    prof = {"crawled_at": (NOW - dt.timedelta(days=20)).isoformat(), "review_total": 50}
+    s = rs.score(None, NOW, profile=prof)
+    assert 0 < s < rs.NEW_PLACE_SCORE
+
+
+@pytest.fixture
+def db(tmp_path):
+    with CrawlDB(tmp_path / "crawl_state.sqlite") as d:
+        yield d
+
+
+def _rows(n):
+    return [{"place_id": str(i), "store_name": f"가게{i}"} for i in range(n)]
+
+
+@pytest.mark.parametrize("limit, budget_sec, parallel, expected", [
+    (None, None, 1, 6),
+    (3, None, 1, 3),
+    (None, 50, 1, 2),        # 기본 비용 20s: 20+20 ≤ 50 < 60
+    (None, 50, 2, 5),        # 동시 2 → 10s 씩
+    (2, 50, 2, 2),           # 둘 중 먼저 닿는 쪽
+    (None, 10, 1, 0),
+])
+def test_plan_limit_and_budget_cutoff(db, limit, budget_sec, parallel, expected):
+    assert db.median_elapsed_ms() == 20000
+    picked = rs.plan(_rows(6), db, limit=limit, budget_sec=budget_sec, parallel=parallel, now=NOW)
+    assert len(picked) == expected
+    assert all(c["cost_sec"] == 20.0 for c in picked)
+
+
+def test_plan_orders_recommended_first_and_drops_backoff(db):
+    rows = _rows(3)
+    places = {"0": _place(days_ago=60, total=100, elapsed_ms=20000),
+              "1": _place(days_ago=10, total=100, velocity=5.0, elapsed_ms=20000),
+              "2": _place(days_ago=3, status="FAIL", fail_streak=1, attempt_hours_ago=1)}
+    db.place_map = lambda: places
+    picked = rs.plan(rows, db, recommended={"1"}, now=NOW)
+    assert [c["place_id"] for c in picked] == ["1", "0"]
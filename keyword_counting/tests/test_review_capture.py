@@ -0,0 +1,80 @@
+# review_capture 파서 — 녹화한 HAR / __APOLLO_STATE__ 픽스처로 검증 (브라우저 불필요)
+import json
+
+import review_capture as rc
+
+
+def _load_state(fixtures_dir):
+    with open(fixtures_dir / "31751923_apollo.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# -----------------------------
+# records_from_har
+# -----------------------------
+def test_records_from_har_merges_pages_and_skips_bad_entries(fixtures_dir):
+    recs = rc.records_from_har(str(fixtures_dir / "31751923.har"))
+    # r1,r2 (1쪽) + r2(중복),r3 (base64 2쪽). js 응답/잘린 본문/빈 본문은 건너뜀
+    assert [r["review_id"] for r in recs] == ["r1", "r2", "r3"]
+    assert recs[0] == {"review_id": "r1", "nickname": "치킨러버", "content": "양념이 맛있어요",
+                       "tags": ["음식이 맛있어요", "양이 많아요"], "visited": "10.3.화"}
+
+
+def test_records_from_har_keeps_review_without_tags(fixtures_dir):
+    recs = {r["review_id"]: r for r in rc.records_from_har(str(fixtures_dir / "31751923.har"))}
+    assert recs["r2"]["tags"] == []
+    assert recs["r2"]["content"] == "포장했어요"
+
+
+def test_iter_har_payloads_only_review_json(fixtures_dir):
+    bodies = list(rc.iter_har_payloads(str(fixtures_dir / "31751923.har")))
+    assert len(bodies) == 2                        # 정상 1쪽 + base64 2쪽
+
+
+# -----------------------------
+# parse_review_payload
+# -----------------------------
+def test_parse_review_payload_dedups_tags_and_handles_missing_author(fixtures_dir):
+    page2 = list(rc.iter_har_payloads(str(fixtures_dir / "31751923.har")))[1]
+    recs = rc.parse_review_payload(page2)
+    r3 = recs[-1]
+    assert r3["tags"] == ["친절해요"]               # 중복/공백 이름 제거
+    assert r3["nickname"] == ""                    # author: null
+    assert r3["visited"] == "9.30.토"              # visitedDate 폴백
+
+
+def test_parse_review_payload_no_tags():
+    doc = {"data": {"items": [{"id": "x1", "body": "그냥 그래요", "votedKeywords": None}]}}
+    assert rc.parse_review_payload(doc) == [
+        {"review_id": "x1", "nickname": "", "content": "그냥 그래요", "tags": [], "visited": ""}]
+
+
+def test_parse_review_payload_malformed_body():
+    # 리뷰 모양이 아닌 응답 / 내용 없는 리뷰 / 타입이 틀린 값 → 예외 없이 빈 목록
+    assert rc.parse_review_payload({"errors": [{"message": "rate limited"}]}) == []
+    assert rc.parse_review_payload({"items": [{"id": "", "body": "", "votedKeywords": []}]}) == []
+    assert rc.parse_review_payload("not json") == []
+    assert rc.parse_review_payload(None) == []
+
+
+# -----------------------------
+# parse_apollo_state
+# -----------------------------
+def test_parse_apollo_state_resolves_refs(fixtures_dir):
+    recs = rc.parse_apollo_state(_load_state(fixtures_dir))
+    by_id = {r["review_id"]: r for r in recs}
+    assert set(by_id) == {"r1", "r2"}              # __typename 또는 키 접두어로 리뷰 판별
+    assert by_id["r1"]["nickname"] == "치킨러버"
+    assert by_id["r1"]["tags"] == ["음식이 맛있어요", "양이 많아요"]
+    assert by_id["r2"]["tags"] == []
+
+
+def test_parse_apollo_state_malformed():
+    assert rc.parse_apollo_state(None) == []
+    assert rc.parse_apollo_state(["VisitorReview:r1"]) == []
+    # 끊어진 참조/ dict 가 아닌 값은 무시
+    state = {"VisitorReview:r1": {"id": "r1", "body": "좋아요", "author": {"__ref": "VisitorReviewAuthor:gone"},
+                                  "votedKeywords": [{"__ref": "VotedKeyword:gone"}]},
+             "VisitorReview:r2": "broken"}
+    assert rc.parse_apollo_state(state) == [
+        {"review_id": "r1", "nickname": "", "content": "좋아요", "tags": [], "visited": ""}]
@@ -0,0 +1,45 @@
+# make_place_profile 의 BeautifulSoup 리뷰 파서 + review_key — JS 추출(page_scripts.EXTRACT_REVIEWS_JS)과 같은 규칙인지
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("lxml")
+
+import make_place_profile as mpp
+from review_store import review_key
+
+HTML = """
+<ul>
+ <li class="place_app">
+  <span class="pui__NMi-Dp">치킨 <b>러버</b></span>
+  <div class="pui__vn15t2">양념이 <b>진짜</b> 맛있어요<br>  또 올게요  </div>
+  <div class="pui__HLNvmI"><span class="pui__jhpEyP">음식이 맛있어요</span><span class="pui__jhpEyP">양이 많아요</span></div>
+ </li>
+ <li class="place_app">
+  <span class="pui__NMi-Dp">동네주민</span>
+  <div class="pui__vn15t2">포장했어요</div>
+  <span class="pui__jhpEyP">친절해요</span>
+ </li>
+ <li class="place_app">
+  <span class="pui__NMi-Dp">단골</span>
+  <div class="pui__vn15t2">무난</div>
+  <span>매장이 넓어요</span><span>+2</span>
+ </li>
+</ul>
+"""
+
+
+def test_tags_found_without_tag_box():
+    rows = mpp.parse_reviews_from_html(HTML, "1", ["치킨"], "가게")
+    assert [r["option_tags"] for r in rows] == [["음식이 맛있어요", "양이 많아요"], ["친절해요"], ["매장이 넓어요"]]
+
+
+def test_review_key_same_for_js_and_bs_text_joining():
+    from bs4 import BeautifulSoup
+    li = BeautifulSoup(HTML, "lxml").select_one("li.place_app")
+    nick, body = li.select_one("span.pui__NMi-Dp"), li.select_one("div.pui__vn15t2")
+    # JS 경로: 텍스트 노드마다 trim → 닉네임은 '' / 본문은 '\n' 으로 연결 (= get_text(sep, strip=True))
+    js_key = review_key(nick.get_text("", strip=True), body.get_text("\n", strip=True))
+    bs_row = mpp.parse_reviews_from_html(HTML, "1", [], "가게")[0]
+    assert bs_row["review_key"] == js_key
+    # 루트 스크립트(naver_place_crolling)의 본문도 '\n' 연결 → 같은 키
+    assert review_key("치킨러버", "양념이\n진짜\n맛있어요\n또 올게요") == js_key
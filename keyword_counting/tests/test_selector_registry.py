@@ -0,0 +1,57 @@
+# selector_registry — 같은 통계 파일을 여러 프로세스/스크립트가 저장해도 기록이 사라지지 않는지 (드라이버 불필요)
+import json
+
+from selector_registry import SelectorRegistry
+
+XP = ("xpath", '//*[@id="app-root"]//a[contains(.,"더보기")]', None)
+JS_A = ("js", "a, button", "더보기")
+JS_B = ("js", "a,button", "더보기")
+
+
+def _stats(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_workers_saving_same_file_add_up(tmp_path):
+    path = tmp_path / "more_button.json"
+    seed = SelectorRegistry("more_button", [XP], stats_path=path)
+    seed.record(XP, True, 10)
+    seed.save()
+
+    # --workers 2: 둘 다 같은 디스크 값(1 hit)을 읽고 시작
+    w1 = SelectorRegistry("more_button", [XP], stats_path=path)
+    w2 = SelectorRegistry("more_button", [XP], stats_path=path)
+    w1.record(XP, True, 10); w1.record(XP, True, 10)
+    w2.record(XP, False, 30)
+    w1.save()
+    w2.save()
+    st = _stats(path)[SelectorRegistry.key(XP)]
+    assert (st["hits"], st["misses"], st["total_ms"]) == (3, 1, 60.0)
+    assert sorted(st["recent"]) == [0, 1, 1, 1]
+
+    w2.save()                                       # 새로 쌓인 게 없으면 그대로 (두 번 더하지 않음)
+    assert _stats(path)[SelectorRegistry.key(XP)]["hits"] == 3
+    assert w2.stats[SelectorRegistry.key(XP)]["hits"] == 3   # 다른 워커 몫도 순위에 반영
+
+
+def test_other_registry_keys_are_kept(tmp_path):
+    path = tmp_path / "more_button.json"
+    a = SelectorRegistry("more_button", [XP, JS_A], stats_path=path)
+    a.record(JS_A, True, 3)
+    a.save()
+    b = SelectorRegistry("more_button", [XP, JS_B], stats_path=path)
+    b.record(JS_B, False, 5)
+    b.save()
+    doc = _stats(path)
+    assert doc[SelectorRegistry.key(JS_A)]["hits"] == 1
+    assert doc[SelectorRegistry.key(JS_B)]["misses"] == 1
+
+
+def test_recent_window_is_trimmed(tmp_path):
+    path = tmp_path / "s.json"
+    r = SelectorRegistry("s", [XP], window=3, stats_path=path)
+    for hit in (True, True, False, False):
+        r.record(XP, hit, 1)
+    r.save()
+    assert _stats(path)[SelectorRegistry.key(XP)]["recent"] == [1, 0, 0]
@@ -0,0 +1,51 @@
+# tab_crawler.TabCrawler._finish — 가짜 드라이버로 dedup / meta 저장 검증 (브라우저 불필요)
+import json
+
+import pytest
+
+import make_place_profile as mpp
+import tab_crawler
+from scope_memo import ScopeMemo
+from tab_crawler import TabCrawler, _Tab
+
+
+@pytest.fixture
+def crawler(tmp_path, monkeypatch):
+    monkeypatch.setattr(mpp, "SCOPE_MEMO", ScopeMemo(tmp_path / "scope_memo.json"))
+    monkeypatch.setattr(tab_crawler, "click_plus_chips", lambda d: False)
+    monkeypatch.setattr(mpp, "read_review_total", lambda d: 321)
+    return TabCrawler(driver=object(), out_dir=str(tmp_path / "out"))
+
+
+def _tab(clicks=4):
+    tab = _Tab("h1")
+    tab.job = ("1", "가게", ["치킨"])
+    tab.urls = mpp.build_review_urls("1")
+    tab.clicks = clicks
+    return tab
+
+
+def _row(key, tags):
+    return {"place_id": "1", "cuisine": ["치킨"], "store_name": "가게", "review_key": key, "option_tags": tags}
+
+
+@pytest.mark.parametrize("stop_reason", ["exhausted", "max_clicks", "stalled"])
+def test_finish_dedups_and_saves_meta(crawler, monkeypatch, stop_reason):
+    rows = [_row("k1", ["맛있어요"]), _row("k2", ["맛있어요", "친절해요"]), _row("k1", ["맛있어요"])]
+    monkeypatch.setattr(mpp, "collect_review_rows", lambda d, **kw: rows)
+    r = crawler._finish(_tab(), stop_reason)
+    assert r["status"] == "OK" and r["reviews"] == 2
+    with open(r["json_path"], encoding="utf-8") as f:
+        doc = json.load(f)
+    assert doc["tag_counts"] == {"맛있어요": 2, "친절해요": 1}
+    meta = doc["meta"]
+    assert meta["crawled_at"] and meta["mode"] == "chips" and meta["stop_reason"] == stop_reason
+    assert (meta["clicks"], meta["reviews"], meta["review_total"]) == (4, 2, 321)
+
+
+def test_finish_without_rows_fails_after_last_url(crawler, monkeypatch):
+    monkeypatch.setattr(mpp, "collect_review_rows", lambda d, **kw: [])
+    tab = _tab()
+    tab.url_idx = len(tab.urls) - 1
+    r = crawler._finish(tab, "exhausted")
+    assert r["status"] == "FAIL" and "리뷰/태그" in r["error"]
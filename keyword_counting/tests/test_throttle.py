@@ -0,0 +1,94 @@
+# throttle — outcome 분류 + AimdController (공유 메모리 상태만 쓰는 순수 로직, 브라우저 불필요)
+import time
+
+import pytest
+
+import throttle
+from throttle import AimdController, outcome
+
+
+def _fail(error):
+    return {"status": "FAIL", "error": error}
+
+
+@pytest.mark.parametrize("row, expected", [
+    ({"status": "OK"}, "ok"),
+    ({"status": "SKIP", "error": "time budget"}, "neutral"),
+    (None, "neutral"),
+    (_fail("Throttled: 차단/캡차 페이지"), "throttled"),
+    (_fail("Throttled: HTTP 429: https://m.place.naver.com/..."), "throttled"),
+    (_fail("Throttled: HTTP 403: https://m.place.naver.com/..."), "throttled"),
+    (_fail("TimeoutException: Message: timeout"), "suspect"),
+    (_fail("RuntimeError: 요약 패널을 파싱하지 못했어요."), "suspect"),
+    (_fail("RuntimeError: 리뷰/태그 요소를 찾지 못했어요."), "suspect"),
+    (_fail("HttpError: HTTP 500: https://m.place.naver.com/..."), "neutral"),
+])
+def test_outcome(row, expected):
+    assert outcome(row) == expected
+
+
+def _ctl(**kw):
+    kw.setdefault("base_backoff", 1.0)
+    kw.setdefault("max_backoff", 4.0)
+    return AimdController(8, **kw)
+
+
+def test_throttled_cuts_limit_multiplicatively():
+    c = _ctl()
+    c.release(time.time(), "throttled")
+    assert c.snapshot()["limit"] == 4.0
+    c.release(time.time(), "throttled")
+    assert c.snapshot()["limit"] == 2.0
+    for _ in range(5):
+        c.release(time.time(), "throttled")
+    assert c.snapshot()["limit"] == 1.0            # min_limit 아래로는 안 내려감
+
+
+def test_throttled_from_before_last_cut_is_same_incident():
+    c = _ctl()
+    started = time.time() - 1
+    c.release(time.time(), "throttled")
+    c.release(started, "throttled")                # 감속 전에 출발한 요청 → 또 깎지 않음
+    assert c.snapshot()["limit"] == 4.0
+
+
+def test_success_increases_additively():
+    c = _ctl(initial=4)
+    for _ in range(4):                             # 한 바퀴(허용 수만큼) 성공 → 약 +1
+        c.release(time.time(), "ok")
+    assert 4.9 < c.snapshot()["limit"] < 5.0
+    for _ in range(100):
+        c.release(time.time(), "ok")
+    assert c.snapshot()["limit"] == 8.0            # max_limit 이 상한
+
+
+def test_backoff_doubles_up_to_max():
+    c = _ctl()
+    waits = []
+    for _ in range(5):
+        c.release(time.time(), "throttled")
+        waits.append(round(c.snapshot()["backoff_left"]))
+    assert waits == [1, 2, 4, 4, 4]
+    assert c.snapshot()["streak"] == 5
+    c.release(time.time(), "ok")
+    assert c.snapshot()["streak"] == 0
+
+
+def test_single_suspect_is_neutral_three_in_a_row_throttle():
+    c = _ctl()
+    c.release(time.time(), "suspect")
+    assert c.snapshot()["limit"] == 8.0
+    c.release(time.time(), "suspect")
+    assert c.snapshot()["limit"] == 8.0
+    c.release(time.time(), "suspect")              # SUSPECT_STREAK(3) 번째
+    snap = c.snapshot()
+    assert throttle.SUSPECT_STREAK == 3
+    assert snap["limit"] == 4.0 and snap["suspects"] == 0
+
+
+def test_success_resets_suspect_streak():
+    c = _ctl()
+    for result in ("suspect", "suspect", "ok", "suspect", "suspect"):
+        c.release(time.time(), result)
+    snap = c.snapshot()
+    assert snap["limit"] == 8.0 and snap["suspects"] == 2
@@ -0,0 +1,197 @@
+# work_queue — SQLite(임시 파일) / Redis(fakeredis, 없으면 건너뜀) 두 백엔드에 같은 시나리오
+# + Heartbeat, create_profiles_final._queue_loop / collect (크롤 자체는 가짜로 바꿔 끼움)
+import json
+import time
+
+import pytest
+
+import work_queue
+from work_queue import RedisWorkQueue, SqliteWorkQueue
+
+LEASE = 0.2
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def make_queue(request, tmp_path):
+    """make_queue(lease_sec) → 같은 저장소를 보는 큐 (여러 번 부르면 워커 여러 개)"""
+    opened = []
+    if request.param == "sqlite":
+        def make(lease_sec=LEASE):
+            q = SqliteWorkQueue(tmp_path / "queue.sqlite", lease_sec=lease_sec)
+            opened.append(q)
+            return q
+    else:
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")                  # fakeredis 의 Lua(EVALSHA) 지원
+        server = fakeredis.FakeServer()
+
+        def make(lease_sec=LEASE):
+            q = RedisWorkQueue("redis://fake/0", lease_sec=lease_sec, client=fakeredis.FakeRedis(server=server))
+            opened.append(q)
+            return q
+    yield make
+    for q in opened:
+        q.close()
+
+
+def _job(pid, prio=0.0, **extra):
+    return (pid, {"place_id": pid, "store_name": f"가게{pid}", "cuisine_raw": "치킨", **extra}, prio)
+
+
+def test_lease_order_and_complete(make_queue):
+    q = make_queue()
+    assert q.enqueue([_job("a", 1), _job("b", 5), _job("c", 3)]) == 3
+    got = q.lease("w1", n=2)
+    assert [j["job_id"] for j in got] == ["b", "c"]          # priority 높은 순
+    assert got[0]["payload"]["store_name"] == "가게b" and got[0]["attempts"] == 1
+    assert q.complete("w1", "b", {"status": "OK"}) is True
+    assert q.stats() == {"queued": 1, "leased": 1, "done": 1}
+    assert q.pending() == 2
+    res = q.results()
+    assert [(r["job_id"], r["status"], r["result"]) for r in res] == [("b", "done", {"status": "OK"})]
+    q.mark_collected(["b"])
+    assert q.results() == []
+    assert len(q.results(only_new=False)) == 1
+
+
+def test_lease_expiry_reclaim_and_complete_after_lost_lease(make_queue):
+    q1, q2 = make_queue(), make_queue()
+    q1.enqueue([_job("a")])
+    assert [j["job_id"] for j in q1.lease("w1")] == ["a"]
+    assert q2.lease("w2") == []                                # 리스 중
+    time.sleep(LEASE * 1.5)
+    again = q2.lease("w2")                                     # 만료 → 다시 queued → w2 가 가져감
+    assert [j["job_id"] for j in again] == ["a"] and again[0]["attempts"] == 2
+    assert q1.heartbeat("w1", ["a"]) == []                     # w1 은 리스를 잃음
+    assert q1.complete("w1", "a", {"status": "OK"}) is False   # 늦게 온 결과는 버림
+    assert q2.complete("w2", "a", {"status": "OK", "by": "w2"}) is True
+    assert q2.results()[0]["result"]["by"] == "w2"
+
+
+def test_lease_expiry_past_max_attempts_fails(make_queue):
+    q = make_queue()
+    q.enqueue([_job("a")], max_attempts=1)
+    q.lease("w1")
+    time.sleep(LEASE * 1.5)
+    assert q.lease("w2") == []
+    res = q.results()
+    assert res[0]["status"] == "failed" and "lease expired (w1)" in res[0]["error"]
+
+
+def test_heartbeat_extends_lease(make_queue):
+    q = make_queue()
+    q.enqueue([_job("a")])
+    q.lease("w1")
+    for _ in range(3):
+        time.sleep(LEASE * 0.6)
+        assert q.heartbeat("w1", ["a"]) == ["a"]
+    assert q.lease("w2") == []                                 # 원래 리스 시간은 지났지만 연장됨
+
+
+def test_retry_backoff_doubles(make_queue, monkeypatch):
+    monkeypatch.setattr(work_queue, "RETRY_BACKOFF_SEC", 0.2)
+    q = make_queue(lease_sec=30)
+    q.enqueue([_job("a")], max_attempts=3)
+    q.lease("w1")
+    assert q.complete("w1", "a", ok=False, error="Timeout") is True
+    assert q.lease("w1") == []                                 # 0.2s 대기 중
+    time.sleep(0.3)
+    assert [j["attempts"] for j in q.lease("w1")] == [2]
+    q.complete("w1", "a", ok=False, error="Timeout")           # 이번엔 0.4s
+    time.sleep(0.25)
+    assert q.lease("w1") == []
+    time.sleep(0.25)
+    assert [j["attempts"] for j in q.lease("w1")] == [3]
+    q.complete("w1", "a", ok=False, error="Timeout")           # max_attempts → failed
+    assert q.pending() == 0
+    assert q.results()[0]["status"] == "failed"
+
+
+def test_requeue_failed(make_queue):
+    q = make_queue()
+    q.enqueue([_job("a"), _job("b")], max_attempts=1)
+    for j in q.lease("w1", n=2):
+        q.complete("w1", j["job_id"], ok=j["job_id"] == "b", error="" if j["job_id"] == "b" else "boom")
+    assert q.stats() == {"done": 1, "failed": 1}
+    assert q.requeue_failed() == 1
+    got = q.lease("w1")
+    assert [(j["job_id"], j["attempts"]) for j in got] == [("a", 1)]
+    assert q.requeue_failed() == 0
+
+
+def test_enqueue_replace(make_queue):
+    q = make_queue()
+    q.enqueue([_job("a", note="old")])
+    q.lease("w1")
+    assert q.enqueue([_job("a", note="new")], replace=True) == 0   # 리스 중인 작업은 안 건드림
+    q.complete("w1", "a", {"status": "OK"})
+    assert q.enqueue([_job("a", note="new")]) == 0                  # 기본: 있는 작업은 그대로
+    assert q.pending() == 0
+    assert q.enqueue([_job("a", note="new")], replace=True) == 1    # 끝난 작업도 다시 queued
+    got = q.lease("w1")
+    assert got[0]["payload"]["note"] == "new" and got[0]["attempts"] == 1
+    assert q.results() == []                                        # 이전 결과는 지워짐
+
+
+# -----------------------------
+# Heartbeat (스레드, SQLite)
+# -----------------------------
+def test_heartbeat_thread_keeps_lease_and_reports_lost(tmp_path):
+    path = tmp_path / "queue.sqlite"
+    with SqliteWorkQueue(path, lease_sec=0.3) as q:
+        q.enqueue([_job("a"), _job("b")])
+        q.lease("w1", n=1)                                          # a 만 w1 소유
+        with work_queue.Heartbeat(path, "w1", lease_sec=0.3) as hb:
+            hb.add("a")
+            hb.add("b")                                             # 내 리스가 아님 → lost 로 보고
+            time.sleep(0.7)
+            assert q.lease("w2") and q.lease("w2") == []            # b 만 나가고 a 는 연장돼서 안 나감
+            assert "b" in hb.lost and "a" not in hb.lost
+            hb.discard("b")
+            assert "b" not in hb.lost
+
+
+# -----------------------------
+# create_profiles_final: _queue_loop → collect
+# -----------------------------
+@pytest.fixture
+def cpf(tmp_path, monkeypatch):
+    import create_profiles_final as cpf
+    import make_place_profile as mpp
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cpf, "SLEEP_BETWEEN_SEC", (0, 0))
+    monkeypatch.setattr(cpf, "OUTPUT_DIR", tmp_path / "collected")
+    monkeypatch.setattr(cpf, "DB_PATH", tmp_path / "crawl_state.sqlite")
+    monkeypatch.setattr(cpf, "CONTROLLER", None)
+
+    def fake_crawl(place_id, store_name, cuisine_raw, pool=None):
+        if place_id == "bad":
+            return cpf._summary_row(place_id, store_name, cuisine_raw, status="FAIL", error="Throttled: x")
+        path = mpp.save_store_tag_json(place_id, [cuisine_raw], store_name, {"맛있어요": 3},
+                                       out_dir=str(tmp_path / "worker_out"), meta={"review_total": 10})
+        return cpf._summary_row(place_id, store_name, cuisine_raw, json_path=path, mode_used="summary")
+
+    monkeypatch.setattr(cpf, "crawl_guarded", fake_crawl)
+    return cpf
+
+
+def test_queue_loop_then_collect(cpf, tmp_path):
+    qpath = tmp_path / "queue.sqlite"
+    with SqliteWorkQueue(qpath) as q:
+        q.enqueue([_job("p1", 2), _job("p2", 1), _job("bad", 0)], max_attempts=1)
+    assert cpf._queue_loop(qpath) == 3
+
+    assert cpf.collect(qpath) == 0
+    with open(tmp_path / "collected" / "p1_tags.json", encoding="utf-8") as f:
+        doc = json.load(f)
+    assert doc["tag_counts"] == {"맛있어요": 3} and doc["meta"]["review_total"] == 10
+    assert not (tmp_path / "collected" / "bad_tags.json").exists()
+
+    from crawl_db import CrawlDB
+    with CrawlDB(tmp_path / "crawl_state.sqlite") as db:
+        places = db.place_map()
+    assert places["p1"]["status"] == "OK" and places["bad"]["status"] == "FAIL"
+
+    with SqliteWorkQueue(qpath) as q:
+        assert q.results() == []                                    # 다시 collect 해도 중복 반영 없음
+        assert q.stats() == {"done": 2, "failed": 1}
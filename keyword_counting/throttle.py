@@ -0,0 +1,133 @@
+# throttle.py — 차단/스로틀링 감지 + 워커 공유 AIMD 동시성 제어
+# 배치의 예절은 가게 간 랜덤 sleep(SLEEP_BETWEEN_SEC) 하나뿐이라, 네이버가 빈 페이지/차단 페이지를 주기 시작해도
+# run() 은 그대로 달려서 목록 전체를 FAIL 로 태워버렸다.
+#  - 감지: 캡차·접근 제한 문구(Throttled), HTTP 429/403 → 바로 스로틀
+#          타임아웃, 빈 요약/빈 리뷰 목록 → 가게 하나만의 문제일 수 있어서 '의심'. SUSPECT_STREAK 번 연속일 때만 스로틀
+#  - 제어(AIMD): 스로틀 → 허용 동시 처리 수 × decrease(곱셈 감소) + 지수 백오프(전원 대기)
+#                성공 → 허용 수 + increase/허용 수 (한 바퀴 다 성공하면 +increase, 덧셈 증가)
+# 상태는 공유 메모리(multiprocessing.Array)에 있어서 Pool(initargs=(controller,)) 로 워커들이 같이 씀 (rate_limit.py 와 같은 방식).
+from __future__ import annotations
+import time, asyncio
+import multiprocessing as mp
+from typing import Any, Dict
+
+BLOCK_MARKERS = ("자동입력 방지", "자동 입력 방지", "보안 절차", "비정상적인 접근", "일시적으로 제한",
+                 "접근이 제한", "과도한 요청", "captcha", "too many requests")
+# 요약 행 error("타입명: 메시지")에 이 문자열이 있으면 스로틀로 봄
+THROTTLE_ERRORS = ("Throttled", "HTTP 429", "HTTP 403")
+# 이 문자열은 '의심': 리뷰 없는 가게/느린 페이지에서도 나므로 연속으로 쌓일 때만 스로틀로 침
+SUSPECT_ERRORS = ("TimeoutException", "TimeoutError",
+                  "요약 패널을 파싱하지 못했어요", "요약 키워드 통계를 찾지 못했어요", "리뷰/태그 요소를 찾지 못했어요")
+SUSPECT_STREAK = 3
+
+_LIMIT, _IN_FLIGHT, _BACKOFF_UNTIL, _STREAK, _LAST_CUT, _SUSPECTS = range(6)
+
+
+class Throttled(RuntimeError):
+    """차단/캡차 페이지를 받음 (다른 모드로 재시도해도 소용없음 → 바로 FAIL, 컨트롤러가 속도를 줄임)"""
+
+
+def looks_blocked(text: str | None) -> bool:
+    low = (text or "").lower()
+    return any(m in low for m in BLOCK_MARKERS)
+
+
+def outcome(row: Dict[str, Any] | None) -> str:
+    """create_profiles_final 요약 행 → "ok" / "throttled" / "suspect" / "neutral" (SKIP, 스로틀과 무관한 실패)"""
+    if not row:
+        return "neutral"
+    if row.get("status") == "OK":
+        return "ok"
+    if row.get("status") != "FAIL":
+        return "neutral"
+    err = row.get("error") or ""
+    if any(s in err for s in THROTTLE_ERRORS):
+        return "throttled"
+    if any(s in err for s in SUSPECT_ERRORS):
+        return "suspect"
+    return "neutral"
+
+
+class AimdController:
+    def __init__(self, max_limit: int, min_limit: int = 1, initial: float | None = None,
+                 decrease: float = 0.5, increase: float = 1.0,
+                 base_backoff: float = 5.0, max_backoff: float = 300.0,
+                 suspect_streak: int = SUSPECT_STREAK, ctx=None):
+        ctx = ctx or mp
+        self.max_limit = max(int(max_limit), 1)
+        self.min_limit = max(min(int(min_limit), self.max_limit), 1)
+        self.decrease = float(decrease)
+        self.increase = float(increase)
+        self.base_backoff = float(base_backoff)
+        self.max_backoff = float(max_backoff)
+        self.suspect_streak = max(int(suspect_streak), 1)
+        self._s = ctx.Array("d", 6, lock=False)
+        self._s[_LIMIT] = float(initial or self.max_limit)
+        self._lock = ctx.Lock()
+
+    def try_acquire(self) -> float | None:
+        """자리가 있고 백오프 중이 아니면 슬롯을 잡고 시작 시각을, 아니면 None"""
+        with self._lock:
+            now = time.time()
+            s = self._s
+            if now >= s[_BACKOFF_UNTIL] and s[_IN_FLIGHT] < max(int(s[_LIMIT]), self.min_limit):
+                s[_IN_FLIGHT] += 1
+                return now
+            return None
+
+    def acquire(self, poll: float = 0.2) -> float:
+        while True:
+            started = self.try_acquire()
+            if started is not None:
+                return started
+            time.sleep(max(min(self._s[_BACKOFF_UNTIL] - time.time(), 5.0), poll))
+
+    async def acquire_async(self, poll: float = 0.2) -> float:
+        """이벤트 루프용 (스레드 풀을 대기로 채우지 않도록 sleep 으로 폴링)"""
+        while True:
+            started = self.try_acquire()
+            if started is not None:
+                return started
+            await asyncio.sleep(max(min(self._s[_BACKOFF_UNTIL] - time.time(), 5.0), poll))
+
+    def release(self, started: float, result: str = "neutral"):
+        """
+        result: outcome() 값. 마지막 감속 전에 출발한 요청의 스로틀은 같은 사건으로 보고 또 깎지 않음
+        "suspect" 는 suspect_streak 번 연속(중간에 성공 없이) 쌓여야 스로틀 한 번으로 침
+        """
+        with self._lock:
+            now = time.time()
+            s = self._s
+            s[_IN_FLIGHT] = max(s[_IN_FLIGHT] - 1, 0)
+            if result == "suspect":
+                if started < s[_LAST_CUT]:
+                    return
+                s[_SUSPECTS] += 1
+                if s[_SUSPECTS] < self.suspect_streak:
+                    return
+                result = "throttled"
+            if result == "throttled":
+                if started < s[_LAST_CUT]:
+                    return
+                s[_STREAK] += 1
+                s[_LIMIT] = max(float(self.min_limit), s[_LIMIT] * self.decrease)
+                backoff = min(self.base_backoff * 2 ** (s[_STREAK] - 1), self.max_backoff)
+                s[_BACKOFF_UNTIL] = now + backoff
+                s[_LAST_CUT] = now
+                s[_SUSPECTS] = 0
+                print(f"[AIMD] 스로틀 감지(연속 {int(s[_STREAK])}) → 동시 {int(s[_LIMIT])}, {backoff:.0f}s 대기")
+            elif result == "ok":
+                s[_SUSPECTS] = 0
+                if started >= s[_LAST_CUT]:         # 감속 이후에 출발해서 성공해야 '회복'
+                    s[_STREAK] = 0
+                before = int(s[_LIMIT])
+                s[_LIMIT] = min(float(self.max_limit), s[_LIMIT] + self.increase / max(s[_LIMIT], 1.0))
+                if int(s[_LIMIT]) > before:
+                    print(f"[AIMD] 회복 → 동시 {int(s[_LIMIT])}")
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            s = self._s
+            return {"limit": round(s[_LIMIT], 2), "in_flight": int(s[_IN_FLIGHT]), "streak": int(s[_STREAK]),
+                    "suspects": int(s[_SUSPECTS]),
+                    "backoff_left": round(max(s[_BACKOFF_UNTIL] - time.time(), 0.0), 1)}
@@ -0,0 +1,470 @@
+# work_queue.py — 여러 머신이 나눠 도는 크롤 작업 큐 (리스/하트비트/만료 시 재투입), 백엔드 = SQLite 파일(한 머신) / Redis(여러 머신)
+#---호출법---#
+# python work_queue.py --queue outputs/work_queue.sqlite              # 상태별 작업 수
+# python work_queue.py --queue outputs/work_queue.sqlite --requeue_failed
+# python work_queue.py --queue redis://queue-host:6379/0                # 여러 머신이 같이 쓸 때 (pip install redis)
+#
+# run(start, end) 는 수동 구간 나누기뿐이라 여러 머신에 나누려면 범위를 손으로 쪼개고 outputs/ 를 나중에 합쳐야 했다.
+#  1) 코디네이터: enqueue()            → 가게 1곳 = 작업 1개 (priority 높은 것부터 나감)
+#  2) 워커(호스트마다 여러 프로세스): lease() 로 작업을 빌려 가고, 도는 동안 heartbeat() 로 리스를 연장,
+#     끝나면 complete() 로 결과(요약 행 + 프로필 JSON 본문)를 큐에 올림
+#  3) 워커가 죽어서 리스가 만료되면 다음 lease() 가 그 작업을 다시 queued 로 돌림 (max_attempts 까지)
+#  4) 코디네이터: collected 안 된 결과를 가져와 places_json / 상태 DB 에 반영 (create_profiles_final --collect)
+# 백엔드 (둘 다 enqueue/lease/heartbeat/complete/results/mark_collected/stats/pending 같은 메서드, open_queue 로 선택)
+#   SqliteWorkQueue : 로컬 파일. 한 머신 안의 여러 프로세스 전용 (NFS 같은 네트워크 파일시스템은 잠금을 믿을 수 없음)
+#   RedisWorkQueue  : redis://host:port/db — 여러 머신이 같은 큐를 씀. 상태 변경은 Lua 스크립트로 원자적으로
+from __future__ import annotations
+import json, time, socket, sqlite3, argparse, threading, os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+DEFAULT_QUEUE_PATH = Path("./outputs/work_queue.sqlite")
+LEASE_SEC         = 300      # 하트비트 없이 이 시간이 지나면 다른 워커가 가져갈 수 있음
+MAX_ATTEMPTS      = 3
+RETRY_BACKOFF_SEC = 60       # 실패 후 재투입 대기 (시도마다 2배)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id        TEXT PRIMARY KEY,
+    payload       TEXT NOT NULL,
+    priority      REAL DEFAULT 0,
+    status        TEXT NOT NULL DEFAULT 'queued',     -- queued / leased / done / failed
+    attempts      INTEGER DEFAULT 0,
+    max_attempts  INTEGER DEFAULT 3,
+    available_at  REAL DEFAULT 0,
+    lease_owner   TEXT, lease_expires_at REAL, heartbeat_at REAL,
+    enqueued_at   REAL, finished_at REAL,
+    result        TEXT, error TEXT,
+    collected     INTEGER DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS ix_jobs_ready ON jobs(status, priority DESC, enqueued_at);
+CREATE INDEX IF NOT EXISTS ix_jobs_lease ON jobs(status, lease_expires_at);
+CREATE INDEX IF NOT EXISTS ix_jobs_collect ON jobs(collected, status);
+"""
+
+
+def worker_name() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class SqliteWorkQueue:
+    def __init__(self, path: str | Path = DEFAULT_QUEUE_PATH, lease_sec: float = LEASE_SEC):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease_sec = float(lease_sec)
+        # 트랜잭션은 직접 BEGIN IMMEDIATE 로 (lease 의 "조회 → 점유" 사이에 다른 워커가 끼지 못하게)
+        # 기본 rollback 저널 그대로: 한 머신 전용이고, WAL 은 공유 메모리 파일이 필요해 이점보다 제약이 큼
+        self.conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA busy_timeout=30000")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _tx(self):
+        return _Immediate(self.conn)
+
+    # -----------------------------
+    # 코디네이터
+    # -----------------------------
+    def enqueue(self, jobs: Iterable[Tuple[str, Dict[str, Any], float]], max_attempts: int = MAX_ATTEMPTS,
+                replace: bool = False) -> int:
+        """jobs: (job_id, payload, priority). 이미 있는 작업은 그대로 (replace=True 면 끝난 작업도 다시 queued)"""
+        now = time.time()
+        rows = [(str(jid), json.dumps(payload, ensure_ascii=False), float(prio), max_attempts, now)
+                for jid, payload, prio in jobs]
+        upsert = ("ON CONFLICT(job_id) DO UPDATE SET payload = excluded.payload, priority = excluded.priority, "
+                  "status = 'queued', attempts = 0, available_at = 0, lease_owner = NULL, result = NULL, "
+                  "error = NULL, collected = 0 WHERE jobs.status != 'leased'") if replace else "ON CONFLICT(job_id) DO NOTHING"
+        with self._tx():
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT INTO jobs (job_id, payload, priority, max_attempts, enqueued_at) VALUES (?, ?, ?, ?, ?) " + upsert,
+                rows)
+            return self.conn.total_changes - before
+
+    def requeue_failed(self) -> int:
+        with self._tx():
+            return self.conn.execute("UPDATE jobs SET status = 'queued', attempts = 0, available_at = 0 "
+                                     "WHERE status = 'failed'").rowcount
+
+    def results(self, only_new: bool = True) -> List[Dict[str, Any]]:
+        """끝난(done/failed) 작업 결과. only_new 면 아직 collect 안 한 것만"""
+        q = "SELECT job_id, status, result, error FROM jobs WHERE status IN ('done', 'failed')"
+        if only_new:
+            q += " AND collected = 0"
+        return [{"job_id": r["job_id"], "status": r["status"], "error": r["error"],
+                 "result": json.loads(r["result"]) if r["result"] else None} for r in self.conn.execute(q)]
+
+    def mark_collected(self, job_ids: Iterable[str]):
+        with self._tx():
+            self.conn.executemany("UPDATE jobs SET collected = 1 WHERE job_id = ?", [(str(j),) for j in job_ids])
+
+    def stats(self) -> Dict[str, int]:
+        return {r["status"]: r["n"] for r in self.conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status")}
+
+    def pending(self) -> int:
+        """아직 안 끝난 작업 수 (queued + leased)"""
+        return self.conn.execute("SELECT COUNT(*) FROM jobs WHERE status IN ('queued', 'leased')").fetchone()[0]
+
+    # -----------------------------
+    # 워커
+    # -----------------------------
+    def _reclaim_expired(self, now: float) -> int:
+        """리스 만료(워커 사망/멈춤) → 다시 queued, 시도 횟수를 다 썼으면 failed"""
+        cur = self.conn.execute(
+            "UPDATE jobs SET status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'queued' END, "
+            "error = 'lease expired (' || COALESCE(lease_owner, '?') || ')', lease_owner = NULL, "
+            "finished_at = CASE WHEN attempts >= max_attempts THEN ? END "
+            "WHERE status = 'leased' AND lease_expires_at < ?", (now, now))
+        return cur.rowcount
+
+    def lease(self, worker_id: str, n: int = 1) -> List[Dict[str, Any]]:
+        """준비된 작업을 최대 n 개 빌림 → [{"job_id", "payload", "attempts"}, ...]"""
+        now = time.time()
+        with self._tx():
+            self._reclaim_expired(now)
+            rows = self.conn.execute(
+                "SELECT job_id, payload, attempts FROM jobs WHERE status = 'queued' AND available_at <= ? "
+                "ORDER BY priority DESC, enqueued_at LIMIT ?", (now, int(n))).fetchall()
+            self.conn.executemany(
+                "UPDATE jobs SET status = 'leased', lease_owner = ?, lease_expires_at = ?, heartbeat_at = ?, "
+                "attempts = attempts + 1 WHERE job_id = ?",
+                [(worker_id, now + self.lease_sec, now, r["job_id"]) for r in rows])
+        return [{"job_id": r["job_id"], "payload": json.loads(r["payload"]), "attempts": r["attempts"] + 1}
+                for r in rows]
+
+    def heartbeat(self, worker_id: str, job_ids: Iterable[str]) -> List[str]:
+        """리스 연장 → 아직 내 것인 job_id 목록 (빠진 건 만료돼서 다른 워커에게 넘어간 것)"""
+        ids = [str(j) for j in job_ids]
+        if not ids:
+            return []
+        now = time.time()
+        with self._tx():
+            self.conn.executemany(
+                "UPDATE jobs SET lease_expires_at = ?, heartbeat_at = ? "
+                "WHERE job_id = ? AND status = 'leased' AND lease_owner = ?",
+                [(now + self.lease_sec, now, j, worker_id) for j in ids])
+            held = self.conn.execute(
+                f"SELECT job_id FROM jobs WHERE status = 'leased' AND lease_owner = ? "
+                f"AND job_id IN ({','.join('?' * len(ids))})", [worker_id, *ids]).fetchall()
+        return [r["job_id"] for r in held]
+
+    def complete(self, worker_id: str, job_id: str, result: Dict[str, Any] | None = None,
+                 ok: bool = True, error: str = "") -> bool:
+        """결과 올리기. 리스를 잃은 뒤면 False (결과 버림). 실패는 max_attempts 까지 백오프 후 재투입"""
+        now = time.time()
+        with self._tx():
+            row = self.conn.execute("SELECT attempts, max_attempts FROM jobs WHERE job_id = ? AND status = 'leased' "
+                                    "AND lease_owner = ?", (str(job_id), worker_id)).fetchone()
+            if row is None:
+                return False
+            if ok or row["attempts"] >= row["max_attempts"]:
+                status, available_at, finished = ("done" if ok else "failed"), 0, now
+            else:
+                status, available_at, finished = "queued", now + RETRY_BACKOFF_SEC * 2 ** (row["attempts"] - 1), None
+            self.conn.execute(
+                "UPDATE jobs SET status = ?, available_at = ?, finished_at = ?, lease_owner = NULL, "
+                "result = ?, error = ?, collected = 0 WHERE job_id = ?",
+                (status, available_at, finished, json.dumps(result, ensure_ascii=False) if result is not None else None,
+                 error or None, str(job_id)))
+        return True
+
+
+# -----------------------------
+# Redis 백엔드 (여러 머신)
+# -----------------------------
+# 키: {prefix}job:{id} 해시 / ready(zset, -priority) / delayed(zset, 재시도 가능 시각) / leased(zset, 리스 만료 시각)
+#     done, failed(set) / uncollected(set, 코디네이터가 아직 안 가져간 결과)
+_LUA_ENQUEUE = """
+local prefix, replace, max_attempts, now = ARGV[1], ARGV[2] == '1', ARGV[3], tonumber(ARGV[4])
+local added = 0
+for i = 5, #ARGV, 3 do
+  local id, payload, prio = ARGV[i], ARGV[i + 1], tonumber(ARGV[i + 2])
+  local k = prefix .. 'job:' .. id
+  local st = redis.call('HGET', k, 'status')
+  if (not st) or (replace and st ~= 'leased') then
+    for _, key in ipairs({KEYS[2], KEYS[3]}) do redis.call('ZREM', key, id) end
+    for _, key in ipairs({KEYS[4], KEYS[5], KEYS[6]}) do redis.call('SREM', key, id) end
+    redis.call('DEL', k)
+    redis.call('HSET', k, 'payload', payload, 'priority', prio, 'status', 'queued', 'attempts', 0,
+               'max_attempts', max_attempts, 'enqueued_at', now, 'collected', 0)
+    redis.call('ZADD', KEYS[1], -prio, id)
+    added = added + 1
+  end
+end
+return added
+"""
+
+_LUA_LEASE = """
+local prefix, now, lease_sec, owner, n = ARGV[1], tonumber(ARGV[2]), tonumber(ARGV[3]), ARGV[4], tonumber(ARGV[5])
+for _, id in ipairs(redis.call('ZRANGEBYSCORE', KEYS[3], '-inf', now)) do
+  local k = prefix .. 'job:' .. id
+  redis.call('ZREM', KEYS[3], id)
+  local owner_was = redis.call('HGET', k, 'lease_owner') or '?'
+  redis.call('HSET', k, 'error', 'lease expired (' .. owner_was .. ')', 'lease_owner', '')
+  if tonumber(redis.call('HGET', k, 'attempts')) >= tonumber(redis.call('HGET', k, 'max_attempts')) then
+    redis.call('HSET', k, 'status', 'failed', 'finished_at', now, 'collected', 0)
+    redis.call('SADD', KEYS[4], id)
+    redis.call('SADD', KEYS[5], id)
+  else
+    redis.call('HSET', k, 'status', 'queued')
+    redis.call('ZADD', KEYS[1], -tonumber(redis.call('HGET', k, 'priority')), id)
+  end
+end
+for _, id in ipairs(redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', now)) do
+  redis.call('ZREM', KEYS[2], id)
+  redis.call('ZADD', KEYS[1], -tonumber(redis.call('HGET', prefix .. 'job:' .. id, 'priority')), id)
+end
+local out = {}
+for _, id in ipairs(redis.call('ZRANGE', KEYS[1], 0, n - 1)) do
+  local k = prefix .. 'job:' .. id
+  redis.call('ZREM', KEYS[1], id)
+  redis.call('ZADD', KEYS[3], now + lease_sec, id)
+  local attempts = redis.call('HINCRBY', k, 'attempts', 1)
+  redis.call('HSET', k, 'status', 'leased', 'lease_owner', owner, 'heartbeat_at', now)
+  table.insert(out, id)
+  table.insert(out, redis.call('HGET', k, 'payload'))
+  table.insert(out, attempts)
+end
+return out
+"""
+
+_LUA_HEARTBEAT = """
+local prefix, now, lease_sec, owner = ARGV[1], tonumber(ARGV[2]), tonumber(ARGV[3]), ARGV[4]
+local held = {}
+for i = 5, #ARGV do
+  local id = ARGV[i]
+  local k = prefix .. 'job:' .. id
+  if redis.call('HGET', k, 'status') == 'leased' and redis.call('HGET', k, 'lease_owner') == owner then
+    redis.call('ZADD', KEYS[1], now + lease_sec, id)
+    redis.call('HSET', k, 'heartbeat_at', now)
+    table.insert(held, id)
+  end
+end
+return held
+"""
+
+_LUA_COMPLETE = """
+local prefix, id, owner, now, ok = ARGV[1], ARGV[2], ARGV[3], tonumber(ARGV[4]), ARGV[5] == '1'
+local k = prefix .. 'job:' .. id
+if redis.call('HGET', k, 'status') ~= 'leased' or redis.call('HGET', k, 'lease_owner') ~= owner then
+  return 0
+end
+redis.call('ZREM', KEYS[3], id)
+local attempts = tonumber(redis.call('HGET', k, 'attempts'))
+redis.call('HSET', k, 'lease_owner', '', 'result', ARGV[6], 'error', ARGV[7], 'collected', 0)
+if ok or attempts >= tonumber(redis.call('HGET', k, 'max_attempts')) then
+  redis.call('HSET', k, 'status', ok and 'done' or 'failed', 'finished_at', now)
+  redis.call('SADD', ok and KEYS[4] or KEYS[5], id)
+  redis.call('SADD', KEYS[6], id)
+else
+  redis.call('HSET', k, 'status', 'queued')
+  redis.call('ZADD', KEYS[2], now + tonumber(ARGV[8]) * 2 ^ (attempts - 1), id)
+end
+return 1
+"""
+
+_LUA_REQUEUE_FAILED = """
+local prefix = ARGV[1]
+local ids = redis.call('SMEMBERS', KEYS[2])
+for _, id in ipairs(ids) do
+  local k = prefix .. 'job:' .. id
+  redis.call('HSET', k, 'status', 'queued', 'attempts', 0)
+  redis.call('ZADD', KEYS[1], -tonumber(redis.call('HGET', k, 'priority')), id)
+  redis.call('SREM', KEYS[3], id)
+end
+redis.call('DEL', KEYS[2])
+return #ids
+"""
+
+
+class RedisWorkQueue:
+    """SqliteWorkQueue 와 같은 메서드. url 예: redis://queue-host:6379/0 (pip install redis)"""
+    def __init__(self, url: str, lease_sec: float = LEASE_SEC, name: str = "crawlq", client=None):
+        if client is None:
+            try:
+                import redis
+            except ImportError as e:
+                raise RuntimeError("Redis 큐는 redis 패키지가 필요해요: pip install redis") from e
+            client = redis.Redis.from_url(url)
+        self.r = client
+        self.url = url
+        self.lease_sec = float(lease_sec)
+        self.prefix = f"{name}:"
+        k = {n: f"{self.prefix}{n}" for n in ("ready", "delayed", "leased", "done", "failed", "uncollected")}
+        self._k = k
+        self._enqueue = self.r.register_script(_LUA_ENQUEUE)
+        self._lease = self.r.register_script(_LUA_LEASE)
+        self._heartbeat = self.r.register_script(_LUA_HEARTBEAT)
+        self._complete = self.r.register_script(_LUA_COMPLETE)
+        self._requeue = self.r.register_script(_LUA_REQUEUE_FAILED)
+
+    def close(self):
+        self.r.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _keys(self, *names: str) -> List[str]:
+        return [self._k[n] for n in names]
+
+    # -----------------------------
+    # 코디네이터
+    # -----------------------------
+    def enqueue(self, jobs: Iterable[Tuple[str, Dict[str, Any], float]], max_attempts: int = MAX_ATTEMPTS,
+                replace: bool = False) -> int:
+        args: List[Any] = [self.prefix, int(replace), max_attempts, time.time()]
+        for jid, payload, prio in jobs:
+            args += [str(jid), json.dumps(payload, ensure_ascii=False), float(prio)]
+        keys = self._keys("ready", "delayed", "leased", "done", "failed", "uncollected")
+        return int(self._enqueue(keys=keys, args=args))
+
+    def requeue_failed(self) -> int:
+        return int(self._requeue(keys=self._keys("ready", "failed", "uncollected"), args=[self.prefix]))
+
+    def results(self, only_new: bool = True) -> List[Dict[str, Any]]:
+        ids = self.r.smembers(self._k["uncollected"]) if only_new else \
+            self.r.sunion(self._k["done"], self._k["failed"])
+        out = []
+        for jid in sorted(x.decode() if isinstance(x, bytes) else x for x in ids):
+            status, result, error = [v.decode() if isinstance(v, bytes) else v for v in
+                                     self.r.hmget(f"{self.prefix}job:{jid}", "status", "result", "error")]
+            out.append({"job_id": jid, "status": status, "error": error or None,
+                        "result": json.loads(result) if result else None})
+        return out
+
+    def mark_collected(self, job_ids: Iterable[str]):
+        pipe = self.r.pipeline()
+        for jid in job_ids:
+            pipe.srem(self._k["uncollected"], str(jid))
+            pipe.hset(f"{self.prefix}job:{jid}", "collected", 1)
+        pipe.execute()
+
+    def stats(self) -> Dict[str, int]:
+        counts = {"queued": self.r.zcard(self._k["ready"]) + self.r.zcard(self._k["delayed"]),
+                  "leased": self.r.zcard(self._k["leased"]),
+                  "done": self.r.scard(self._k["done"]), "failed": self.r.scard(self._k["failed"])}
+        return {k: v for k, v in counts.items() if v}
+
+    def pending(self) -> int:
+        return sum(self.r.zcard(self._k[n]) for n in ("ready", "delayed", "leased"))
+
+    # -----------------------------
+    # 워커
+    # -----------------------------
+    def lease(self, worker_id: str, n: int = 1) -> List[Dict[str, Any]]:
+        flat = self._lease(keys=self._keys("ready", "delayed", "leased", "failed", "uncollected"),
+                           args=[self.prefix, time.time(), self.lease_sec, worker_id, int(n)])
+        out = []
+        for i in range(0, len(flat), 3):
+            jid, payload, attempts = flat[i:i + 3]
+            out.append({"job_id": jid.decode() if isinstance(jid, bytes) else jid,
+                        "payload": json.loads(payload), "attempts": int(attempts)})
+        return out
+
+    def heartbeat(self, worker_id: str, job_ids: Iterable[str]) -> List[str]:
+        ids = [str(j) for j in job_ids]
+        if not ids:
+            return []
+        held = self._heartbeat(keys=self._keys("leased"), args=[self.prefix, time.time(), self.lease_sec, worker_id, *ids])
+        return [h.decode() if isinstance(h, bytes) else h for h in held]
+
+    def complete(self, worker_id: str, job_id: str, result: Dict[str, Any] | None = None,
+                 ok: bool = True, error: str = "") -> bool:
+        res = self._complete(keys=self._keys("ready", "delayed", "leased", "done", "failed", "uncollected"),
+                             args=[self.prefix, str(job_id), worker_id, time.time(), int(ok),
+                                   json.dumps(result, ensure_ascii=False) if result is not None else "",
+                                   error or "", RETRY_BACKOFF_SEC])
+        return bool(res)
+
+
+def open_queue(spec: str | Path = DEFAULT_QUEUE_PATH, lease_sec: float = LEASE_SEC):
+    """redis://... → RedisWorkQueue, 그 외(파일 경로) → SqliteWorkQueue"""
+    spec = str(spec)
+    if spec.startswith(("redis://", "rediss://", "unix://")):
+        return RedisWorkQueue(spec, lease_sec=lease_sec)
+    return SqliteWorkQueue(spec, lease_sec=lease_sec)
+
+
+class _Immediate:
+    """BEGIN IMMEDIATE ... COMMIT/ROLLBACK (쓰기 잠금을 처음부터 잡음)"""
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, *exc):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+class Heartbeat:
+    """처리 중인 작업의 리스를 백그라운드 스레드에서 주기적으로 연장 (스레드 전용 커넥션)"""
+    def __init__(self, queue_spec: str | Path, worker_id: str, lease_sec: float = LEASE_SEC):
+        self.queue_spec, self.worker_id, self.lease_sec = queue_spec, worker_id, lease_sec
+        self.held: set[str] = set()
+        self.lost: set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join(timeout=5)
+
+    def add(self, job_id: str):
+        with self._lock:
+            self.held.add(job_id)
+
+    def discard(self, job_id: str):
+        with self._lock:
+            self.held.discard(job_id)
+            self.lost.discard(job_id)
+
+    def _loop(self):
+        q = open_queue(self.queue_spec, lease_sec=self.lease_sec)
+        try:
+            while not self._stop.wait(self.lease_sec / 3):
+                with self._lock:
+                    ids = list(self.held)
+                try:
+                    kept = set(q.heartbeat(self.worker_id, ids))
+                except Exception as e:
+                    print(f"[QUEUE] heartbeat 실패: {e}")
+                    continue
+                with self._lock:
+                    self.lost |= set(ids) - kept
+        finally:
+            q.close()
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="crawl work queue status")
+    ap.add_argument("--queue", default=str(DEFAULT_QUEUE_PATH), help="SQLite 파일 경로 또는 redis://host:port/db")
+    ap.add_argument("--requeue_failed", action="store_true", help="failed 작업을 다시 queued 로")
+    args = ap.parse_args(argv)
+    with open_queue(args.queue) as q:
+        if args.requeue_failed:
+            print(f"[QUEUE] 재투입 {q.requeue_failed()}개")
+        print(f"[QUEUE] {q.stats()} (남은 작업 {q.pending()})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
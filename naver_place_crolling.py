@@ -14,7 +14,8 @@ Naver Place Review Crawler (mobile)
 - 모바일 리뷰 페이지 열기 (/restaurant, /place 두 경우 모두 시도)
 - "더보기" 버튼 자동 클릭 반복
 - 닉네임, 리뷰 본문, 작성 날짜, 재방문 여부 추출
-- 결과를 CSV(UTF-8-SIG)로 저장
+- '더보기'를 누를 때마다 새로 붙은 리뷰만 추출해 JSON Lines(.jsonl)로 바로바로 저장
+  (중간에 브라우저가 죽어도 그때까지 수집한 리뷰는 남음, --csv 로 CSV도 함께 저장)
 
 💻 실행 예시
   pip install selenium webdriver-manager beautifulsoup4 lxml
@@ -25,6 +26,9 @@ Naver Place Review Crawler (mobile)
   # 옵션 추가 실행
   python naver_place_reviews.py --place_id 36978606 --max_clicks 60 --headless
   python naver_place_reviews.py --place_id 36978606 --sort recent   # (recent/favorite/relevance)
+
+  # 증분 실행 (지난번 이후 새 리뷰만 outputs/review_store/36978606.jsonl 에 추가, 본 리뷰가 나오면 클릭 중단)
+  python naver_place_reviews.py --place_id 36978606 --incremental --headless
 """
 
 
@@ -36,15 +40,33 @@ import argparse
 import json
 import datetime as dt
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, List, Dict
 
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException
-from webdriver_manager.chrome import ChromeDriverManager
+
+# keyword_counting/ 의 공용 모듈 사용 (고정 sleep 대신 이벤트 기반 대기)
+sys.path.insert(0, str(Path(__file__).resolve().parent / "keyword_counting"))
+from page_waits import item_count, wait_for_growth, wait_until_quiet
+from browser_profile import make_chrome
+from driver_cache import timed_get
+from chrome_daemon import acquire_driver
+from selector_registry import SelectorRegistry
+from page_scripts import extract_reviews, prune_crawled
+from scope_memo import ScopeMemo
+from review_store import ReviewStore, review_key, STOP_AFTER_SEEN
+
+# '더보기' 버튼 후보 — 최근 적중률 순으로 implicit wait 없이 조회 (통계는 실행 간 유지)
+MORE_BUTTON = SelectorRegistry("more_button", [
+    ("xpath", '//*[@id="app-root"]//a[contains(.,"더보기")]', None),
+    ("xpath", '//*[@id="app-root"]//button[contains(.,"더보기")]', None),
+    ("xpath", '//*[@id="app-root"]/div/div/div//a[contains(@href,"review") and contains(.,"더보기")]', None),
+    ("js", "a, button", "더보기"),        # 전수조사 폴백 (페이지 안에서 1회 왕복)
+], stats_path="./outputs/selector_stats/more_button.json")
+SCOPE_MEMO = ScopeMemo()   # place_id → 리뷰 페이지가 열렸던 스코프(restaurant/place), 다음 실행에서 먼저 시도
 
 
 # -----------------------------
@@ -61,82 +83,64 @@ def build_review_urls(place_id: str, sort: str = "recent") -> List[str]:
     ]
 
 
-def make_driver(headless: bool = False) -> webdriver.Chrome:
-    opts = webdriver.ChromeOptions()
-    if headless:
-        opts.add_argument("headless=new")
-    opts.add_argument("window-size=1920,1080")
-    opts.add_argument("disable-gpu")
-    # 무난한 UA
-    opts.add_argument(
-        "user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    )
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=opts)
-    driver.implicitly_wait(10)
-    return driver
+def make_driver(headless: bool = False, lean: bool = True) -> webdriver.Chrome:
+    # 공용 프로필(browser_profile.py): 작은 모바일 뷰포트 + 이미지/폰트/미디어/트래커 차단
+    return make_chrome(headless=headless, lean=lean, mobile=True, implicit_wait=10)
 
 
 # -----------------------------
 # Interactions
 # -----------------------------
-def click_more_until_end(driver: webdriver.Chrome, max_clicks: int = 50, sleep_sec: float = 0.4):
+def click_more_until_end(driver: webdriver.Chrome, max_clicks: int = 50, sleep_sec: float = 0.4,
+                         wait_timeout: float = 8.0, on_expand=None, prune_dom: bool = False):
     """
     '더보기' 버튼을 최대 max_clicks 번까지 반복 클릭. 페이지/시점에 따라 DOM이 달라질 수 있어
     여러 셀렉터 전략을 순차적으로 시도.
+    on_expand: 처음 한 번 + 리뷰가 늘어날 때마다 호출되는 콜백 (False를 돌려주면 클릭 중단)
+    prune_dom: (opt-in) on_expand가 추출을 끝낸 리뷰 li를 DOM에서 제거 → 클릭이 쌓여도 페이지 크기 일정
+               (추출 표시(data-crawled)가 된 li만 지우므로 on_expand 에서 증분 추출할 때만 의미 있음)
     """
     # 스크롤/렌더링 유도
     try:
         driver.find_element(By.TAG_NAME, "body").send_keys(Keys.PAGE_DOWN)
-        time.sleep(0.4)
+        wait_until_quiet(driver, timeout=0.4)
     except Exception:
         pass
 
-    # 우선 시도할 XPATH (시기/케이스별로 다를 수 있음)
-    xpath_candidates = [
-        '//*[@id="app-root"]//a[contains(.,"더보기")]',
-        '//*[@id="app-root"]//button[contains(.,"더보기")]',
-        '//*[@id="app-root"]/div/div/div//a[contains(@href,"review") and contains(.,"더보기")]',
-    ]
-
     clicks = 0
+    n_items = item_count(driver)
+    if on_expand and on_expand() is False:
+        return clicks
     while clicks < max_clicks:
         clicked = False
 
-        # 1) XPATH 우선 시도
-        for xp in xpath_candidates:
+        # 후보 셀렉터를 적중률 순으로 0-wait 조회 (없는 XPATH에서 10초씩 블록되지 않음)
+        btn = MORE_BUTTON.find(driver)
+        if btn is not None:
             try:
-                btn = driver.find_element(By.XPATH, xp)
-                if btn.is_displayed():
-                    btn.click()
+                btn.click()
+                clicked = True
+            except ElementClickInterceptedException:
+                try:
+                    driver.execute_script("arguments[0].click();", btn)
                     clicked = True
-                    break
-            except (NoSuchElementException, ElementClickInterceptedException):
-                continue
-            except Exception:
-                continue
-        if not clicked:
-            # 2) CSS 전수조사: '더보기' 텍스트 포함 링크/버튼
-            try:
-                for el in driver.find_elements(By.CSS_SELECTOR, "a, button"):
-                    try:
-                        txt = (el.text or "").strip()
-                        if "더보기" in txt and el.is_displayed():
-                            el.click()
-                            clicked = True
-                            break
-                    except Exception:
-                        continue
+                except Exception:
+                    pass
             except Exception:
                 pass
 
         if not clicked:
             # 더 이상 클릭할 '더보기'가 없다고 판단
-            time.sleep(0.6)
             break
 
         clicks += 1
-        time.sleep(sleep_sec)
+        # 리뷰 li가 늘면 즉시, 아니면 sleep_sec 동안 DOM/네트워크가 조용해지면 다음 클릭
+        now = wait_for_growth(driver, n_items, idle_ms=int(sleep_sec * 1000), timeout=wait_timeout)
+        grew, n_items = now > n_items, now
+        if grew and on_expand and on_expand() is False:
+            break
+        if grew and prune_dom and prune_crawled(driver):
+            n_items = item_count(driver)      # 지운 만큼 기준 개수도 다시 잡아야 다음 증가를 감지
 
     return clicks
 
@@ -151,6 +155,8 @@ def parse_reviews_from_html(html: str):
 
     # 리뷰 리스트 항목들
     items = bs.select("li.place_app") or bs.select("li")  # fallback
+    # 증분 수집 중 JS가 이미 가져간 li(data-crawled)는 중복 저장하지 않음
+    items = [r for r in items if not r.has_attr("data-crawled")]
 
     for r in items:
         # ✅ 닉네임
@@ -172,18 +178,58 @@ def parse_reviews_from_html(html: str):
             data.append({
                 "nickname": nickname,
                 "content": content,
-                 "tags_json": json.dumps(tag, ensure_ascii=False)
+                "tags_icon": tag,
             })
 
     return data
 
 
+def collect_reviews(driver: webdriver.Chrome, only_new: bool = False) -> List[Dict[str, Any]] | None:
+    """
+    페이지 안 JS로 리뷰 레코드만 받아옴 (page_source 전송/재파싱 없음).
+    only_new=True 면 지난 호출 이후 새로 붙은 리뷰만, JS 실패 시 None (→ 끝에서 BeautifulSoup 폴백)
+    """
+    rows = extract_reviews(driver, only_new=only_new)
+    if rows is None:
+        return None
+    return [{"nickname": r["nickname"], "content": r["content"], "tags_icon": r["tags"]} for r in rows]
 
 
 # -----------------------------
 # Save
 # -----------------------------
-def save_csv(records: List[Dict[str, str]], place_id: str, out_dir: str = "./outputs") -> str:
+class JsonlWriter:
+    """리뷰를 받는 즉시 한 줄씩 append + flush (메모리에 쌓지 않음, 중단돼도 그때까지는 남음)"""
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.count = 0
+        self._f = open(self.path, "a", encoding="utf-8")
+
+    def write(self, records: List[Dict[str, Any]]):
+        for r in records:
+            self._f.write(json.dumps(r, ensure_ascii=False) + "\n")
+        self._f.flush()
+        self.count += len(records)
+
+    def close(self):
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_jsonl(path: str | Path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def save_csv(records, place_id: str, out_dir: str = "./outputs") -> str:
     Path(out_dir).mkdir(parents=True, exist_ok=True)
     ts = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
     path = Path(out_dir) / f"naver_place_reviews_{place_id}_{ts}.csv"
@@ -191,46 +237,129 @@ def save_csv(records: List[Dict[str, str]], place_id: str, out_dir: str = "./out
         w = csv.DictWriter(f, fieldnames=["nickname", "content", "tags_json"])
         w.writeheader()
         for row in records:
-            w.writerow(row)
+            w.writerow({
+                "nickname": row.get("nickname", ""),
+                "content": row.get("content", ""),
+                "tags_json": json.dumps(row.get("tags_icon") or [], ensure_ascii=False),
+            })
     return str(path)
 
 
 # -----------------------------
 # Orchestration
 # -----------------------------
-def fetch_reviews(place_id: str, sort: str = "recent", max_clicks: int = 50, headless: bool = False) -> str:
-    driver = make_driver(headless=headless)
+def fetch_reviews(place_id: str, sort: str = "recent", max_clicks: int = 50, headless: bool = False,
+                  out_dir: str = "./outputs", csv_also: bool = False, prune_dom: bool = False,
+                  use_daemon: bool = True, incremental: bool = False) -> str:
+    """
+    '더보기' 클릭마다 새로 붙은 리뷰만 뽑아 JSONL로 바로 append.
+    크롤 도중 예외가 나도 이미 쓴 리뷰가 있으면 부분 결과 경로를 돌려줌.
+    prune_dom=True 면 추출한 리뷰 li를 DOM에서 지워 리뷰 수천 개짜리 가게도 클릭당 비용을 일정하게 유지.
+    use_daemon=True 면 상주 Chrome(keyword_counting/chrome_daemon.py)이 있을 때 새 탭으로 붙어서 씀.
+    incremental=True 면 가게별 저장소(out_dir/review_store/{id}.jsonl)에 없는 리뷰만 이어 붙이고,
+    sort=recent 일 때는 이미 본 리뷰가 나오면 클릭을 멈춤 (첫 실행은 전체 수집).
+    """
+    store = ReviewStore(place_id, Path(out_dir) / "review_store") if incremental else None
+    if store:
+        out_path = store.path
+        known = store.known_keys()
+        # 최신순이 아니면 본 리뷰 뒤에도 새 리뷰가 섞여 있을 수 있음 → 중복만 거르고 끝까지
+        stop_after = min(STOP_AFTER_SEEN, len(known)) if sort == "recent" else 0
+        if sort != "recent":
+            print(f"[INCR] sort={sort} 라 조기 중단 없이 새 리뷰만 저장합니다 (조기 중단은 sort=recent 에서만)")
+    else:
+        ts = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
+        out_path = Path(out_dir) / f"naver_place_reviews_{place_id}_{ts}.jsonl"
+    fetched_at = dt.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    seen, new_keys = 0, []
+    driver, release = acquire_driver(lambda: make_driver(headless=headless), mobile=True,
+                                     use_daemon=use_daemon, implicit_wait=10)
     try:
         last_err = None
-        for url in build_review_urls(place_id, sort=sort):
-            try:
-                driver.get(url)
-                time.sleep(1.0)
+        for url in SCOPE_MEMO.order(place_id, build_review_urls(place_id, sort=sort)):
+            with JsonlWriter(out_path) as sink:
+                js_ok = True
+
+                def emit(records):
+                    """증분 모드면 본 리뷰는 거르고 세기만 함 → 충분히 따라잡았으면 False (클릭 중단)"""
+                    nonlocal seen
+                    if store is None:
+                        sink.write(records)
+                        return None
+                    fresh = []
+                    for r in records:
+                        k = review_key(r.get("nickname", ""), r.get("content", ""))
+                        if k and k in known:
+                            seen += 1
+                            continue
+                        if k:
+                            known.add(k)
+                            new_keys.append(k)
+                        fresh.append({**r, "review_key": k, "fetched_at": fetched_at})
+                    sink.write(fresh)
+                    if stop_after and seen >= stop_after:
+                        return False
+                    return None
+
+                def on_expand():
+                    nonlocal js_ok
+                    if not js_ok:
+                        return None
+                    records = collect_reviews(driver, only_new=True)
+                    if records is None:
+                        js_ok = False           # JS 추출 불가 → 클릭만 계속하고 끝에서 한 번에 파싱
+                        return None
+                    return emit(records)
+
+                try:
+                    timed_get(driver, url)
+                    wait_until_quiet(driver, timeout=3.0)
+
+                    # 리뷰 페이지 여부 대략 판별
+                    if "review" not in driver.current_url.lower():
+                        continue
 
-                # 리뷰 페이지 여부 대략 판별
-                if "review" not in driver.current_url.lower():
+                    clicks = click_more_until_end(driver, max_clicks=max_clicks, sleep_sec=0.4,
+                                                  on_expand=on_expand, prune_dom=prune_dom and js_ok)
+                    # 마지막 로딩이 끝날 때까지만 대기 후 남은 리뷰 수집
+                    wait_until_quiet(driver, timeout=1.2)
+                    on_expand()
+                    if not js_ok:
+                        emit(parse_reviews_from_html(driver.page_source))
+
+                    if sink.count or seen:
+                        SCOPE_MEMO.record(place_id, url)
+                        if store:
+                            store.save_watermark(new_keys, sort=sort, added=sink.count, seen=seen, clicks=clicks)
+                        print(f"[OK] {sink.count} {'new ' if store else ''}reviews saved ({clicks} clicks) -> {out_path}")
+                        break
+                except Exception as e:
+                    if sink.count:
+                        if store:
+                            store.save_watermark(new_keys, sort=sort, added=sink.count, seen=seen, partial=True)
+                        # 부분 크롤도 그때까지 쓴 JSONL은 그대로 사용 가능
+                        print(f"[PARTIAL] {sink.count} reviews saved before {type(e).__name__}: {e} -> {out_path}")
+                        break
+                    last_err = e
                     continue
-
-                clicks = click_more_until_end(driver, max_clicks=max_clicks, sleep_sec=0.4)
-                # 로딩 여유
-                time.sleep(1.2)
-
-                html = driver.page_source
-                records = parse_reviews_from_html(html)
-                if records:
-                    out = save_csv(records, place_id)
-                    print(f"[OK] {len(records)} reviews saved ({clicks} clicks) -> {out}")
-                    return out
-            except Exception as e:
-                last_err = e
-                continue
-
-        # 모든 후보 실패
-        if last_err:
-            raise last_err
-        raise RuntimeError("리뷰 페이지 접근 실패")
+        else:
+            # 모든 후보 실패 (빈 결과 파일은 남기지 않음)
+            if out_path.exists() and not out_path.stat().st_size:
+                out_path.unlink()
+            if last_err:
+                raise last_err
+            raise RuntimeError("리뷰 페이지 접근 실패")
     finally:
-        driver.quit()
+        MORE_BUTTON.save()
+        SCOPE_MEMO.save()
+        try:
+            release()
+        except Exception:
+            pass
+
+    if csv_also:
+        print(f"[CSV] {save_csv(iter_jsonl(out_path), place_id, out_dir=out_dir)}")
+    return str(out_path)
 
 
 # -----------------------------
@@ -242,6 +371,13 @@ def main(argv=None):
     p.add_argument("--sort", default="recent", help="정렬 (recent/favorite 등 페이지가 허용하는 값)")
     p.add_argument("--max_clicks", type=int, default=50, help="더보기 최대 클릭 횟수")
     p.add_argument("--headless", action="store_true", help="브라우저 창 없이 실행")
+    p.add_argument("--out_dir", default="./outputs", help="결과 저장 폴더 (JSONL)")
+    p.add_argument("--csv", action="store_true", help="JSONL과 함께 CSV도 저장")
+    p.add_argument("--prune_dom", action="store_true",
+                   help="추출한 리뷰를 페이지 DOM에서 제거 (리뷰 수천 개 가게에서 후반 클릭이 느려지는 것 방지)")
+    p.add_argument("--no_daemon", action="store_true", help="상주 Chrome이 있어도 새로 띄우기")
+    p.add_argument("--incremental", action="store_true",
+                   help="지난 크롤 이후 새 리뷰만 out_dir/review_store/{place_id}.jsonl 에 이어 붙이기 (sort=recent 권장)")
     args = p.parse_args(argv)
 
     out = fetch_reviews(
@@ -249,6 +385,11 @@ def main(argv=None):
         sort=args.sort,
         max_clicks=args.max_clicks,
         headless=args.headless,
+        out_dir=args.out_dir,
+        csv_also=args.csv,
+        prune_dom=args.prune_dom,
+        use_daemon=not args.no_daemon,
+        incremental=args.incremental,
     )
     print(out)
 
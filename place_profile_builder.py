@@ -39,7 +39,7 @@ python make_place_profile.py \
 
 
 from __future__ import annotations
-import time, csv, json, argparse, datetime as dt
+import sys, time, csv, json, argparse, datetime as dt
 from pathlib import Path
 from typing import List, Dict, Any
 from collections import Counter
@@ -48,11 +48,25 @@ from collections import Counter
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+
+# keyword_counting/ 의 공용 모듈 사용 (고정 sleep 대신 이벤트 기반 대기)
+sys.path.insert(0, str(Path(__file__).resolve().parent / "keyword_counting"))
+from page_waits import item_count, wait_for_growth, wait_until_quiet
+from browser_profile import make_chrome
+from driver_cache import timed_get
+from selector_registry import SelectorRegistry
+from page_scripts import extract_reviews
+
+# '더보기' 버튼 후보 — 최근 적중률 순으로 implicit wait 없이 조회 (통계는 실행 간 유지)
+MORE_BUTTON = SelectorRegistry("more_button", [
+    ("xpath", '//*[@id="app-root"]//a[contains(.,"더보기")]', None),
+    ("xpath", '//*[@id="app-root"]//button[contains(.,"더보기")]', None),
+    ("xpath", '//*[@id="app-root"]/div/div/div//a[contains(@href,"review") and contains(.,"더보기")]', None),
+    ("js", "a, button", "더보기"),        # 전수조사 폴백 (페이지 안에서 1회 왕복)
+], stats_path="./outputs/selector_stats/more_button.json")
 
 # -----------------------------
 # URL & Driver
@@ -65,77 +79,49 @@ def build_review_urls(place_id: str, sort: str = "recent") -> List[str]:
     ]
 
 
-def make_driver(headless: bool = False) -> webdriver.Chrome:
-    opts = webdriver.ChromeOptions()
-    if headless:
-        opts.add_argument("headless=new")
-    opts.add_argument("window-size=1920,1080")
-    opts.add_argument("disable-gpu")
-    # 무난한 UA
-    opts.add_argument(
-        "user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    )
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=opts)
-    driver.implicitly_wait(10)
-    return driver
+def make_driver(headless: bool = False, lean: bool = True) -> webdriver.Chrome:
+    # 공용 프로필(browser_profile.py): 작은 모바일 뷰포트 + 이미지/폰트/미디어/트래커 차단
+    return make_chrome(headless=headless, lean=lean, mobile=True, implicit_wait=10)
 
 # -----------------------------
 # Interactions
 # -----------------------------
-def click_more_until_end(driver: webdriver.Chrome, max_clicks: int = 50, sleep_sec: float = 0.4):
+def click_more_until_end(driver: webdriver.Chrome, max_clicks: int = 50, sleep_sec: float = 0.4,
+                         wait_timeout: float = 8.0):
     # 스크롤/렌더링 유도
     try:
         driver.find_element(By.TAG_NAME, "body").send_keys(Keys.PAGE_DOWN)
-        time.sleep(0.4)
+        wait_until_quiet(driver, timeout=0.4)
     except Exception:
         pass
 
-    # 우선 시도할 XPATH (시기/케이스별로 다를 수 있음)
-    xpath_candidates = [
-        '//*[@id="app-root"]//a[contains(.,"더보기")]',
-        '//*[@id="app-root"]//button[contains(.,"더보기")]',
-        '//*[@id="app-root"]/div/div/div//a[contains(@href,"review") and contains(.,"더보기")]',
-    ]
-
     clicks = 0
+    n_items = item_count(driver)
     while clicks < max_clicks:
         clicked = False
 
-        # 1) XPATH 우선 시도
-        for xp in xpath_candidates:
+        # 후보 셀렉터를 적중률 순으로 0-wait 조회 (없는 XPATH에서 10초씩 블록되지 않음)
+        btn = MORE_BUTTON.find(driver)
+        if btn is not None:
             try:
-                btn = driver.find_element(By.XPATH, xp)
-                if btn.is_displayed():
-                    btn.click()
+                btn.click()
+                clicked = True
+            except ElementClickInterceptedException:
+                try:
+                    driver.execute_script("arguments[0].click();", btn)
                     clicked = True
-                    break
-            except (NoSuchElementException, ElementClickInterceptedException):
-                continue
-            except Exception:
-                continue
-        if not clicked:
-            # 2) CSS 전수조사: '더보기' 텍스트 포함 링크/버튼
-            try:
-                for el in driver.find_elements(By.CSS_SELECTOR, "a, button"):
-                    try:
-                        txt = (el.text or "").strip()
-                        if "더보기" in txt and el.is_displayed():
-                            el.click()
-                            clicked = True
-                            break
-                    except Exception:
-                        continue
+                except Exception:
+                    pass
             except Exception:
                 pass
 
         if not clicked:
             # 더 이상 클릭할 '더보기'가 없다고 판단
-            time.sleep(0.6)
             break
 
         clicks += 1
-        time.sleep(sleep_sec)
+        # 리뷰 li가 늘면 즉시, 아니면 sleep_sec 동안 DOM/네트워크가 조용해지면 다음 클릭
+        n_items = wait_for_growth(driver, n_items, idle_ms=int(sleep_sec * 1000), timeout=wait_timeout)
 
     return clicks
 
@@ -177,6 +163,18 @@ def parse_reviews_from_html(html: str, place_id: str, cuisine:list[str],store_na
             })
     return data
 
+def collect_review_rows(driver, place_id: str, cuisine: list[str], store_name: str) -> List[Dict[str, Any]]:
+    """페이지 안 JS로 태그만 받아옴 (page_source 전송/재파싱 없음). 실패 시 BeautifulSoup 폴백"""
+    js_rows = extract_reviews(driver)
+    if not js_rows:
+        return parse_reviews_from_html(driver.page_source, place_id=place_id, cuisine=cuisine, store_name=store_name)
+    return [{
+        "place_id": str(place_id),
+        "cuisine": cuisine or [],
+        "store_name": store_name,
+        "option_tags": r["tags"],
+    } for r in js_rows if r["tags"]]
+
 def count_tags(rows: List[Dict[str, Any]], dedup_within_row: bool = False) -> Dict[str, int]:
     c = Counter()
     for r in rows:
@@ -228,7 +226,7 @@ def fetch_and_build(place_id: str, cuisine:str, store_name: str, sort: str = "re
         last_err = None
         for url in build_review_urls(place_id, sort=sort):
             try:
-                driver.get(url)
+                timed_get(driver, url)
                 # 요소 기준 대기: 리뷰/태그 컨테이너 등장
                 WebDriverWait(driver, 12).until(EC.any_of(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "li.place_app")),
@@ -236,10 +234,8 @@ def fetch_and_build(place_id: str, cuisine:str, store_name: str, sort: str = "re
                 ))
 
                 clicks = click_more_until_end(driver, max_clicks=max_clicks, sleep_sec=0.4)
-                time.sleep(1.0)  # 렌더 여유
-                html = driver.page_source
-
-                rows = parse_reviews_from_html(html, place_id=place_id, cuisine=cuisine, store_name=store_name)
+                wait_until_quiet(driver, timeout=1.0)  # 렌더 여유 (조용해지면 바로 진행)
+                rows = collect_review_rows(driver, place_id=place_id, cuisine=cuisine, store_name=store_name)
                 if not rows:
                     continue
 
@@ -258,6 +254,7 @@ def fetch_and_build(place_id: str, cuisine:str, store_name: str, sort: str = "re
             raise last_err
         raise RuntimeError("리뷰/태그 요소를 찾지 못했어요.")
     finally:
+        MORE_BUTTON.save()
         driver.quit()
 
 # -----------------------------